@@ -0,0 +1,237 @@
+"""Phase-by-phase benchmarks for the AI Code Validator.
+
+Generates a synthetic repository, then times traversal, reading, parsing
+and reporting separately and writes the timings as JSON so runs on
+different commits can be compared:
+
+    python benchmarks/bench.py --output before.json
+    git checkout other-branch
+    python benchmarks/bench.py --output after.json --compare before.json
+"""
+
+import argparse
+import io
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / 'src'))
+
+from synthetic_repo import RepoSpec, generate_repo  # noqa: E402
+
+from ai_code_validator.config import Config  # noqa: E402
+from ai_code_validator.parser import AnnotationParser  # noqa: E402
+from ai_code_validator.reporter import ResultReporter  # noqa: E402
+from ai_code_validator.scanner import FileScanner  # noqa: E402
+
+# Optional on older commits, so their phases can still be measured for
+# comparison; phases needing them are left out of those results
+try:
+    from ai_code_validator.parser import OffsetAnnotationParser
+except ImportError:
+    OffsetAnnotationParser = None
+try:
+    from ai_code_validator.reporter import NdjsonReporter
+except ImportError:
+    NdjsonReporter = None
+
+
+def _best_of(repeats: int, func) -> tuple[float, list[float], object]:
+    timings = []
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), timings, result
+
+
+def run_benchmarks(repo_path: Path, repeats: int) -> dict:
+    """Time each validator phase against a repository.
+
+    The reading phase follows the validator's own read path where the
+    commit has one: raw buffers, the START marker prefilter and decoding of
+    the marker region only. Older commits read and decode whole files.
+
+    Args:
+        repo_path: Repository to validate
+        repeats: Number of runs per phase (the fastest is reported)
+
+    Returns:
+        Mapping of phase name to timing details
+    """
+    config = Config(repo_path=str(repo_path))
+    scanner = FileScanner(config)
+    phases = {}
+
+    discover = getattr(scanner, 'discover_files', None) or scanner._discover_files
+
+    def traverse():
+        return list(discover())
+
+    best, timings, paths = _best_of(repeats, traverse)
+    phases['traversal'] = {'seconds': best, 'runs': timings, 'files': len(paths)}
+
+    def read_regions():
+        # Arguments for validate_file: (path, region, line offset of the region)
+        prefilter = AnnotationParser()
+        files, size, contents = 0, 0, []
+        for path in paths:
+            buffer = scanner.read_buffer(path)
+            if buffer is None:
+                continue
+            try:
+                files += 1
+                size += len(buffer)
+                region = prefilter.annotation_region(buffer)
+                if region is None:
+                    continue
+                start, end = region
+                content = scanner.decode(path, buffer.region(start, end))
+                if content is not None:
+                    contents.append((path, content, buffer.count_lines(start)))
+            finally:
+                buffer.close()
+        return files, size, contents
+
+    def read_file(path):
+        if hasattr(scanner, 'read_file'):
+            return scanner.read_file(path)
+        try:
+            return path.read_text(encoding='utf-8')
+        except (UnicodeDecodeError, PermissionError):
+            return None
+
+    def read_files():
+        files, size, contents = 0, 0, []
+        for path in paths:
+            content = read_file(path)
+            if content is not None:
+                files += 1
+                size += len(content)
+                contents.append((path, content))
+        return files, size, contents
+
+    read = read_regions if hasattr(scanner, 'read_buffer') else read_files
+    best, timings, (files_read, size, contents) = _best_of(repeats, read)
+    phases['reading'] = {
+        'seconds': best,
+        'runs': timings,
+        'files': files_read,
+        'bytes': size,
+        'decoded_files': len(contents),
+    }
+
+    engines = [('parsing_lines', AnnotationParser)]
+    if OffsetAnnotationParser is not None:
+        engines.append(('parsing_offsets', OffsetAnnotationParser))
+    for name, parser_class in engines:
+        def parse(parser_class=parser_class):
+            parser = parser_class()
+            errors = []
+            for arguments in contents:
+                errors.extend(parser.validate_file(*arguments)[1])
+            return errors
+
+        best, timings, errors = _best_of(repeats, parse)
+        phases[name] = {'seconds': best, 'runs': timings, 'errors': len(errors)}
+
+    reporter = ResultReporter()
+    best, timings, _ = _best_of(
+        repeats, lambda: reporter.report_json(reporter.generate_result(errors, files_read))
+    )
+    phases['reporting_json'] = {'seconds': best, 'runs': timings}
+
+    if NdjsonReporter is None:
+        return phases
+
+    def stream():
+        streaming = NdjsonReporter(io.StringIO())
+        streaming.start()
+        for error in errors:
+            streaming.add_file(error.file_path, [error])
+        return streaming.finish()
+
+    best, timings, _ = _best_of(repeats, stream)
+    phases['reporting_ndjson'] = {'seconds': best, 'runs': timings}
+
+    return phases
+
+
+def _git_commit() -> str | None:
+    try:
+        output = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'],
+            cwd=Path(__file__).resolve().parent,
+            capture_output=True,
+            text=True,
+        )
+    except FileNotFoundError:
+        return None
+    return output.stdout.strip() or None
+
+
+def compare(current: dict, baseline: dict) -> list[str]:
+    """Format per-phase ratios against a baseline result file."""
+    lines = []
+    for phase, details in current['phases'].items():
+        before = baseline.get('phases', {}).get(phase)
+        if not before:
+            continue
+        ratio = details['seconds'] / before['seconds'] if before['seconds'] else float('inf')
+        lines.append(
+            f"{phase:18} {before['seconds']:.4f}s -> {details['seconds']:.4f}s ({ratio:.2f}x)"
+        )
+    return lines
+
+
+def main() -> int:
+    """Generate a synthetic repository and benchmark it."""
+    parser = argparse.ArgumentParser(description='Benchmark validator phases')
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--output', help='Write results JSON to this file')
+    parser.add_argument('--compare', help='Baseline results JSON to compare against')
+    parser.add_argument('--repo-path', help='Benchmark an existing tree instead of a synthetic one')
+    for name, value in RepoSpec().as_dict().items():
+        parser.add_argument(f'--{name.replace("_", "-")}', type=type(value), default=value)
+    args = parser.parse_args()
+
+    spec = RepoSpec(**{name: getattr(args, name) for name in RepoSpec().as_dict()})
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        if args.repo_path:
+            repo_path = Path(args.repo_path)
+            generated = None
+        else:
+            repo_path = Path(tmpdir)
+            generated = generate_repo(repo_path, spec)
+        phases = run_benchmarks(repo_path, args.repeats)
+
+    result = {
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'spec': None if args.repo_path else spec.as_dict(),
+        'generated': generated,
+        'phases': phases,
+    }
+
+    output = json.dumps(result, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + '\n')
+    print(output)
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        print('\n'.join(compare(result, baseline)), file=sys.stderr)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,152 @@
+"""Deterministic synthetic repository generator for benchmarks."""
+
+import argparse
+import random
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+EXTENSIONS = ['py', 'js', 'ts', 'java', 'go']
+
+EXCLUDED_DIRS = ['node_modules', '.git', '.venv', 'build']
+
+VALID_HEADER = [
+    'START_AI_GENERATED_CODE',
+    'TOOL_NAME: GitHub Copilot',
+    'TOOL_VERSION: 1.0',
+    'DATE: 2025-02-15T10:30:00Z',
+    'AUTHOR_ID: dev-{author}',
+    'ACTION: GENERATED',
+]
+
+# Each malformed variant replaces (or drops) one header field
+MALFORMED_EDITS = [
+    ('TOOL_NAME', None),
+    ('DATE', 'DATE: 2025/02/15'),
+    ('ACTION', 'ACTION: MODIFIED'),
+    ('AUTHOR_ID', None),
+]
+
+
+@dataclass
+class RepoSpec:
+    """Shape of a synthetic repository."""
+
+    files: int = 2000
+    depth: int = 4
+    fanout: int = 6
+    lines_per_file: int = 120
+    annotation_density: float = 0.05
+    blocks_per_file: int = 2
+    malformed_ratio: float = 0.1
+    unterminated_ratio: float = 0.02
+    excluded_files: int = 4000
+    seed: int = 42
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def generate_repo(root: Path, spec: RepoSpec) -> dict:
+    """Write a synthetic repository under ``root``.
+
+    The same spec and seed always produce byte-identical trees.
+
+    Args:
+        root: Empty directory to populate
+        spec: Repository shape
+
+    Returns:
+        Counts of what was written (files, blocks, expected bad blocks)
+    """
+    rng = random.Random(spec.seed)
+    directories = _directories(root, spec)
+    counts = {'files': 0, 'annotated_files': 0, 'blocks': 0, 'bad_blocks': 0, 'excluded_files': 0}
+
+    for index in range(spec.files):
+        directory = directories[rng.randrange(len(directories))]
+        extension = EXTENSIONS[index % len(EXTENSIONS)]
+        annotated = rng.random() < spec.annotation_density
+        lines, blocks, bad_blocks = _file_lines(rng, spec, annotated)
+
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f'module_{index}.{extension}').write_text('\n'.join(lines) + '\n')
+        counts['files'] += 1
+        counts['annotated_files'] += annotated
+        counts['blocks'] += blocks
+        counts['bad_blocks'] += bad_blocks
+
+    for index in range(spec.excluded_files):
+        excluded = root / EXCLUDED_DIRS[index % len(EXCLUDED_DIRS)] / f'pkg_{index % 50}'
+        excluded.mkdir(parents=True, exist_ok=True)
+        (excluded / f'vendored_{index}.js').write_text('module.exports = {};\n' * 20)
+        counts['excluded_files'] += 1
+
+    return counts
+
+
+def _directories(root: Path, spec: RepoSpec) -> list[Path]:
+    directories = [root]
+    frontier = [root]
+    for level in range(spec.depth):
+        next_frontier = []
+        for parent in frontier:
+            for child in range(spec.fanout):
+                next_frontier.append(parent / f'dir{level}_{child}')
+        directories.extend(next_frontier)
+        frontier = next_frontier
+        if len(directories) > spec.files:
+            break
+    return directories
+
+
+def _file_lines(rng: random.Random, spec: RepoSpec, annotated: bool) -> tuple[list[str], int, int]:
+    lines = [f'line_{n} = compute({n}, {n + 1})' for n in range(spec.lines_per_file)]
+    if not annotated:
+        return lines, 0, 0
+
+    blocks = 0
+    bad_blocks = 0
+    positions = sorted(rng.sample(range(len(lines) + 1), spec.blocks_per_file), reverse=True)
+    for position in positions:
+        header = [line.format(author=rng.randrange(100)) for line in VALID_HEADER]
+        body = [f'    generated_{n}()' for n in range(rng.randint(3, 30))]
+        footer = ['END_AI_GENERATED_CODE']
+
+        roll = rng.random()
+        # Only the last block in the file may be unterminated, so it cannot
+        # swallow the blocks after it
+        if roll < spec.unterminated_ratio and position == positions[0]:
+            footer = []
+            bad_blocks += 1
+        elif roll < spec.unterminated_ratio + spec.malformed_ratio:
+            field, replacement = MALFORMED_EDITS[rng.randrange(len(MALFORMED_EDITS))]
+            header = [
+                replacement if line.startswith(f'{field}:') else line
+                for line in header
+            ]
+            header = [line for line in header if line is not None]
+            bad_blocks += 1
+
+        block = [f'# {line}' for line in header] + body + [f'# {line}' for line in footer]
+        lines[position:position] = block
+        blocks += 1
+
+    return lines, blocks, bad_blocks
+
+
+def main() -> None:
+    """Generate a synthetic repository from the command line."""
+    parser = argparse.ArgumentParser(description='Generate a synthetic repository')
+    parser.add_argument('root', help='Directory to create')
+    for name, value in RepoSpec().as_dict().items():
+        parser.add_argument(f'--{name.replace("_", "-")}', type=type(value), default=value)
+    args = parser.parse_args()
+
+    spec = RepoSpec(**{name: getattr(args, name) for name in RepoSpec().as_dict()})
+    root = Path(args.root)
+    root.mkdir(parents=True, exist_ok=True)
+    print(generate_repo(root, spec))
+
+
+if __name__ == '__main__':
+    main()
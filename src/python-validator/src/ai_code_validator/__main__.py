@@ -0,0 +1,7 @@
+"""Allow running the validator with ``python -m ai_code_validator``."""
+
+import sys
+
+from .cli import main
+
+sys.exit(main())
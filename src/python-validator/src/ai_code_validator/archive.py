@@ -0,0 +1,97 @@
+"""Archive sources: validate members of zip and tar archives without extracting them."""
+
+import tarfile
+import zipfile
+from pathlib import Path
+from typing import IO, Generator, Optional
+
+from .config import Config
+
+# Separates the archive path from the member name in reported paths
+MEMBER_SEPARATOR = '!'
+
+ZIP_SUFFIXES = ('.zip', '.whl', '.jar', '.war', '.egg')
+TAR_SUFFIXES = ('.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')
+
+
+def member_path(archive_path: Path, member: str) -> Path:
+    """Return the path used to report a member, e.g. ``dist/pkg.whl!pkg/mod.py``."""
+    return Path(f'{archive_path}{MEMBER_SEPARATOR}{member}')
+
+
+def archive_members(
+    archive_path: Path, config: Config
+) -> Generator[tuple[Path, bytes], None, None]:
+    """Stream the members of an archive that the configured patterns select.
+
+    Member names are normalized (``./`` and empty components dropped) and
+    matched like repo-relative paths: a member is skipped if any of its
+    components is excluded or it does not match the file patterns.
+
+    Contents are read into memory one member at a time, and with
+    ``max_file_size`` set at most one byte past the limit is read, enough
+    for the validator to tell the member is oversized; nothing is written
+    to disk. Tar archives are read sequentially, so compressed tarballs are
+    decompressed in a single pass.
+
+    Args:
+        archive_path: Zip (zip, wheel, jar) or tar (plain, gz, bz2, xz) archive
+        config: Configuration whose patterns select members
+
+    Yields:
+        Tuples of (member_path, raw_bytes), where ``member_path`` is
+        ``archive!member`` with the normalized member name
+
+    Raises:
+        ValueError: If the file is not a supported or readable archive
+    """
+    name = archive_path.name.lower()
+    try:
+        if name.endswith(ZIP_SUFFIXES):
+            yield from _zip_members(archive_path, config)
+        elif name.endswith(TAR_SUFFIXES):
+            yield from _tar_members(archive_path, config)
+        else:
+            raise ValueError(
+                f'Unsupported archive: {archive_path} (expected one of '
+                f'{", ".join(ZIP_SUFFIXES + TAR_SUFFIXES)})'
+            )
+    except (zipfile.BadZipFile, tarfile.TarError, EOFError) as e:
+        raise ValueError(f'Unreadable archive {archive_path}: {e}') from e
+
+
+def _selected_name(config: Config, member: str) -> Optional[str]:
+    """Return the normalized member name if the patterns select it, else None."""
+    parts = [part for part in member.split('/') if part not in ('', '.')]
+    if not parts or any(config.is_excluded_name(part) for part in parts):
+        return None
+    name = '/'.join(parts)
+    return name if config.matches_file(name) else None
+
+
+def _read_member(stream: IO[bytes], config: Config) -> bytes:
+    """Read a member, stopping one byte past ``max_file_size`` if set."""
+    if config.max_file_size is not None:
+        return stream.read(config.max_file_size + 1)
+    return stream.read()
+
+
+def _zip_members(archive_path: Path, config: Config) -> Generator[tuple[Path, bytes], None, None]:
+    with zipfile.ZipFile(archive_path) as archive:
+        for info in archive.infolist():
+            name = None if info.is_dir() else _selected_name(config, info.filename)
+            if name is None:
+                continue
+            with archive.open(info) as stream:
+                data = _read_member(stream, config)
+            yield member_path(archive_path, name), data
+
+
+def _tar_members(archive_path: Path, config: Config) -> Generator[tuple[Path, bytes], None, None]:
+    with tarfile.open(archive_path, 'r|*') as archive:
+        for info in archive:
+            name = _selected_name(config, info.name) if info.isfile() else None
+            if name is None:
+                continue
+            stream = archive.extractfile(info)
+            yield member_path(archive_path, name), _read_member(stream, config)
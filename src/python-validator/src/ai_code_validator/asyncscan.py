@@ -0,0 +1,284 @@
+"""Asyncio pipeline for scanning trees on high-latency filesystems."""
+
+import asyncio
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, AsyncGenerator, Callable, Generator, Iterable, Optional, TypeVar
+
+from .config import Config
+from .coverage import CoverageMetrics
+from .parallel import BUDGET_POLL_INTERVAL, FileResult, ParallelValidator, _validate_data
+from .parser import OffsetAnnotationParser
+from .reader import FileReader
+from .scanner import FileScanner
+from .stats import RunStats
+
+if TYPE_CHECKING:
+    from .budget import RunBudget
+
+T = TypeVar('T')
+
+DEFAULT_IO_CONCURRENCY = 16
+
+# Marks the end of a queue's input for one consumer
+_DONE = object()
+
+
+def _timed(function: Callable[..., T], *args) -> tuple[T, float, float]:
+    """Call ``function`` and return its result with the wall and CPU time it took.
+
+    CPU time is that of the calling thread, so a call made on an I/O thread
+    is not charged for work other threads do meanwhile.
+    """
+    wall, cpu = time.perf_counter(), time.thread_time()
+    result = function(*args)
+    return result, time.perf_counter() - wall, time.thread_time() - cpu
+
+
+class AsyncValidator(ParallelValidator):
+    """Overlaps directory listings and file reads with validation.
+
+    On network filesystems (NFS, SMB, FUSE mounts) each ``scandir`` and
+    ``open`` waits on a round trip, so a serial walk spends most of its time
+    idle. Here listings and reads run on a thread pool with at most
+    ``io_concurrency`` operations in flight, feeding bounded queues that a
+    single parser drains in the event loop thread. When parsing falls
+    behind, the full queues stop discovery and reading from running ahead.
+
+    Results are yielded as files finish reading, so their order is not
+    deterministic.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        io_concurrency: int = DEFAULT_IO_CONCURRENCY,
+        stats: Optional[RunStats] = None,
+        coverage: Optional[CoverageMetrics] = None,
+        budget: Optional['RunBudget'] = None,
+    ):
+        """Initialize async validator.
+
+        Args:
+            config: Configuration object
+            io_concurrency: Maximum number of listings and reads in flight
+            stats: Optional statistics collector; discovery and reading time
+                is measured on the I/O threads and summed over them, so it
+                can exceed the elapsed time
+            coverage: Optional coverage metrics
+            budget: Optional run budget; it is checked while the parser
+                waits for listings and reads
+        """
+        super().__init__(config, stats=stats, coverage=coverage, budget=budget)
+        self.io_concurrency = max(1, io_concurrency)
+
+    def validate_tree(self) -> Generator[FileResult, None, None]:
+        """Discover and validate all matching files under the repository root.
+
+        Yields:
+            Tuples of (file_path, valid_blocks, errors) for readable files
+
+        Raises:
+            FileNotFoundError: If the repository path does not exist
+        """
+        if not self.config.repo_path.exists():
+            raise FileNotFoundError(f"Repository path not found: {self.config.repo_path}")
+        yield from self._run(None)
+
+    def validate(self, paths: Iterable[Path]) -> Generator[FileResult, None, None]:
+        """Read and validate an explicit list of files.
+
+        Args:
+            paths: File paths to validate
+
+        Yields:
+            Tuples of (file_path, valid_blocks, errors) for readable files
+        """
+        yield from self._run(paths)
+
+    def _run(self, paths: Optional[Iterable[Path]]) -> Generator[FileResult, None, None]:
+        """Drive the pipeline on a private event loop, one result at a time.
+
+        The loop only runs while the caller asks for the next result, so a
+        slow consumer applies backpressure all the way to discovery.
+        """
+        loop = asyncio.new_event_loop()
+        loop.set_default_executor(
+            ThreadPoolExecutor(max_workers=self.io_concurrency, thread_name_prefix='ai-validator-io')
+        )
+        results = self._pipeline(paths)
+        try:
+            while True:
+                try:
+                    item = loop.run_until_complete(results.__anext__())
+                except StopAsyncIteration:
+                    return
+                yield item
+        finally:
+            loop.run_until_complete(results.aclose())
+            loop.run_until_complete(loop.shutdown_default_executor())
+            loop.close()
+
+    async def _pipeline(
+        self, paths: Optional[Iterable[Path]]
+    ) -> AsyncGenerator[FileResult, None]:
+        """Run discovery, readers and the parser until every file is handled."""
+        # Listings and reads run in threads; counters and phase times are
+        # updated from the event loop thread only
+        io_scanner = FileScanner(self.config)
+        scanner = self._scanner()
+        parser = OffsetAnnotationParser()
+
+        path_queue = asyncio.Queue(maxsize=self.io_concurrency * 4)
+        data_queue = asyncio.Queue(maxsize=self.io_concurrency * 2)
+
+        if paths is None:
+            producer = self._discover(io_scanner, path_queue)
+        else:
+            producer = self._feed(paths, path_queue)
+        tasks = [asyncio.create_task(self._produce(producer, path_queue, data_queue))]
+        tasks.extend(
+            asyncio.create_task(self._read(path_queue, data_queue))
+            for _ in range(self.io_concurrency)
+        )
+
+        try:
+            remaining = self.io_concurrency
+            while remaining:
+                if self.budget is None:
+                    item = await data_queue.get()
+                else:
+                    try:
+                        item = await asyncio.wait_for(data_queue.get(), BUDGET_POLL_INTERVAL)
+                    except TimeoutError:
+                        if self.budget.exceeded() is not None:
+                            return
+                        continue
+                if item is _DONE:
+                    remaining -= 1
+                    continue
+                if isinstance(item, BaseException):
+                    raise item
+                file_path, buffer, released = item
+                try:
+                    result = _validate_data(scanner, parser, file_path, buffer, self.coverage)
+                finally:
+                    buffer.close()
+                    released.set()
+                if result is not None:
+                    yield file_path, *result
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            # Release buffers read but never parsed when the run was abandoned
+            while not data_queue.empty():
+                item = data_queue.get_nowait()
+                if isinstance(item, tuple):
+                    item[1].close()
+            self.fast_path_files += parser.fast_path_files
+
+    async def _produce(self, producer, path_queue: asyncio.Queue, data_queue: asyncio.Queue) -> None:
+        """Run a path producer, then tell every reader that input has ended."""
+        try:
+            await producer
+        except Exception as e:
+            await data_queue.put(e)
+        for _ in range(self.io_concurrency):
+            await path_queue.put(_DONE)
+
+    async def _feed(self, paths: Iterable[Path], path_queue: asyncio.Queue) -> None:
+        """Queue an explicit list of paths."""
+        for file_path in paths:
+            await path_queue.put(file_path)
+
+    async def _discover(self, scanner: FileScanner, path_queue: asyncio.Queue) -> None:
+        """List the tree with ``io_concurrency`` workers and queue matching files.
+
+        Directories waiting to be listed are entries in a work queue drained
+        by a fixed set of worker tasks, so a wide tree costs one queue entry
+        per pending directory instead of one coroutine.
+        """
+        loop = asyncio.get_running_loop()
+        matches_file = self.config.matches_file
+        directories = asyncio.Queue()
+
+        async def work() -> None:
+            while True:
+                entry = await directories.get()
+                try:
+                    (subdirs, files), wall, cpu = await loop.run_in_executor(
+                        None, _timed, scanner.list_directory, *entry
+                    )
+                    self._add_time('discovery', wall, cpu)
+                    for subdir in subdirs:
+                        directories.put_nowait(subdir)
+                    for file_path, relative_path in files:
+                        if matches_file(relative_path):
+                            if self.stats is not None:
+                                self.stats.count('files_discovered')
+                            await path_queue.put(file_path)
+                finally:
+                    directories.task_done()
+
+        root_entry, wall, cpu = await loop.run_in_executor(
+            None, _timed, scanner.root_entry, self.config.repo_path
+        )
+        self._add_time('discovery', wall, cpu)
+        directories.put_nowait(root_entry)
+
+        workers = [asyncio.create_task(work()) for _ in range(self.io_concurrency)]
+        listed = asyncio.create_task(directories.join())
+        try:
+            await asyncio.wait([listed, *workers], return_when=asyncio.FIRST_COMPLETED)
+            # Workers only finish by failing; re-raise the first failure
+            for worker in workers:
+                if worker.done():
+                    worker.result()
+        finally:
+            for task in (listed, *workers):
+                task.cancel()
+            await asyncio.gather(listed, *workers, return_exceptions=True)
+
+    async def _read(self, path_queue: asyncio.Queue, data_queue: asyncio.Queue) -> None:
+        """Read queued files on the thread pool until input ends.
+
+        Each reader owns a ``FileReader``, so small files are read into its
+        reusable buffer and large ones memory-mapped. As such a buffer is
+        only valid until the next read, the reader waits for the parser to
+        release each one before reading on.
+        """
+        loop = asyncio.get_running_loop()
+        reader = FileReader(self.config.mmap_threshold)
+        try:
+            while True:
+                file_path = await path_queue.get()
+                if file_path is _DONE:
+                    break
+                try:
+                    buffer, wall, cpu = await loop.run_in_executor(
+                        None, _timed, reader.read, file_path
+                    )
+                except OSError as e:
+                    # Unreadable, or deleted since discovery
+                    if self.stats is not None:
+                        self.stats.count('read_errors')
+                    if self.config.verbose:
+                        print(f"Warning: Could not read file {file_path}: {e}", file=sys.stderr)
+                    continue
+                self._add_time('reading', wall, cpu)
+                if self.stats is not None:
+                    self.stats.count('bytes_read', len(buffer))
+                released = asyncio.Event()
+                await data_queue.put((file_path, buffer, released))
+                await released.wait()
+        except Exception as e:
+            await data_queue.put(e)
+        await data_queue.put(_DONE)
+
+    def _add_time(self, phase: str, wall: float, cpu: float) -> None:
+        """Add time measured on an I/O thread to a phase, if collecting statistics."""
+        if self.stats is not None:
+            self.stats.add_time(phase, wall, cpu)
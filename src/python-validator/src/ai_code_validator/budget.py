@@ -0,0 +1,83 @@
+"""Time and memory budgets that end a scan early with a partial report."""
+
+import sys
+import time
+from typing import Optional
+
+SIZE_UNITS = {'': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+
+
+def parse_size(value: str) -> int:
+    """Parse a byte count with an optional K, M or G suffix (powers of 1024).
+
+    Args:
+        value: Size such as ``4096``, ``512K`` or ``10M``
+
+    Returns:
+        Number of bytes
+
+    Raises:
+        ValueError: If the size is malformed or not positive
+    """
+    text = value.strip().upper().removesuffix('B')
+    unit = text[-1:] if text[-1:] in SIZE_UNITS else ''
+    try:
+        size = int(float(text[:len(text) - len(unit)]) * SIZE_UNITS[unit])
+    except (ValueError, OverflowError):
+        size = 0
+    if size < 1:
+        raise ValueError(f'Invalid size: {value} (expected bytes with an optional K, M or G suffix)')
+    return size
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Return the peak resident set size of this process, or None if unknown."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class RunBudget:
+    """Wall-clock and memory limits checked while a scan runs.
+
+    The CLI asks ``exceeded()`` after each result; discovery and validators
+    also ask while they would otherwise block, so a run stalled on a slow
+    directory or a long chunk still stops on time. Once a limit is reached
+    the run ends with a partial report instead of being killed by its
+    environment.
+    """
+
+    def __init__(self, time_budget: Optional[float] = None, max_rss: Optional[int] = None):
+        """Start the budget clock.
+
+        Args:
+            time_budget: Seconds the scan may run, measured from now
+            max_rss: Peak resident set size in bytes, compared against the
+                largest of this process and the pool workers that reported
+                through ``note_worker_rss``
+        """
+        self.deadline = time.monotonic() + time_budget if time_budget is not None else None
+        self.max_rss = max_rss
+        self.worker_rss = 0
+        # The first limit found exceeded; limits stay exceeded once reached
+        self.reason: Optional[str] = None
+
+    def note_worker_rss(self, rss: Optional[int]) -> None:
+        """Record the peak resident set size a pool worker reported."""
+        if rss is not None:
+            self.worker_rss = max(self.worker_rss, rss)
+
+    def exceeded(self) -> Optional[str]:
+        """Return the summary's ``stop_reason`` if a limit has been reached, else None."""
+        if self.reason is None:
+            if self.deadline is not None and time.monotonic() >= self.deadline:
+                self.reason = 'time_budget'
+            elif self.max_rss is not None:
+                rss = max(peak_rss_bytes() or 0, self.worker_rss)
+                if rss >= self.max_rss:
+                    self.reason = 'max_rss'
+        return self.reason
@@ -0,0 +1,292 @@
+"""Persistent incremental validation cache."""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Optional
+
+from . import __version__
+from .parser import AnnotationBlock, AnnotationError, ErrorCode
+
+DEFAULT_MAX_ENTRIES = 200_000
+
+CACHE_FILENAME = 'validation.sqlite3'
+
+# Pending writes are committed in batches to keep transactions short
+FLUSH_THRESHOLD = 500
+
+# (blocks, errors, line count or None for entries stored without one)
+CachedResult = tuple[list[AnnotationBlock], list[AnnotationError], Optional[int]]
+
+
+def rules_fingerprint() -> str:
+    """Fingerprint of the validator version and annotation rule set.
+
+    The parser module source is hashed along with the package version, so any
+    change to the validation rules invalidates previously cached results.
+
+    Returns:
+        Hex digest identifying the current rule set
+    """
+    from . import parser
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(__version__.encode('utf-8'))
+    digest.update(Path(parser.__file__).read_bytes())
+    return digest.hexdigest()
+
+
+def content_digest(data) -> str:
+    """Hash file content for cache validation.
+
+    Args:
+        data: Raw file bytes (any buffer-protocol object)
+
+    Returns:
+        Hex digest of the content
+    """
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class ValidationCache:
+    """On-disk cache of per-file validation results.
+
+    Entries are keyed by absolute path and validated by ``(mtime, size,
+    inode)``; when the stat signature changes, the content hash decides
+    whether the file really changed. The store is a SQLite database in WAL
+    mode, so several processes can read and write it concurrently. Least
+    recently used entries are evicted once ``max_entries`` is exceeded.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        fingerprint: Optional[str] = None,
+    ):
+        """Open (or create) the cache.
+
+        Args:
+            cache_dir: Directory holding the cache database
+            max_entries: Maximum number of files kept before LRU eviction
+            fingerprint: Rule-set fingerprint (default: ``rules_fingerprint()``)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.fingerprint = fingerprint or rules_fingerprint()
+        self.hits = 0
+        self.misses = 0
+        self._pending_store: list[tuple] = []
+        self._pending_touch: list[tuple] = []
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            self.cache_dir / CACHE_FILENAME, timeout=30, isolation_level=None
+        )
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._setup()
+
+    def _setup(self) -> None:
+        """Create tables and drop entries written under another rule set."""
+        with self._transaction():
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)'
+            )
+            self._conn.execute(
+                '''CREATE TABLE IF NOT EXISTS entries (
+                    path TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    inode INTEGER NOT NULL,
+                    digest TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    last_used REAL NOT NULL
+                )'''
+            )
+            self._conn.execute(
+                'CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used)'
+            )
+            row = self._conn.execute(
+                "SELECT value FROM meta WHERE key = 'fingerprint'"
+            ).fetchone()
+            if row is None or row[0] != self.fingerprint:
+                self._conn.execute('DELETE FROM entries')
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('fingerprint', ?)",
+                    (self.fingerprint,),
+                )
+
+    def _transaction(self):
+        """Return a context manager running statements in one write transaction."""
+        return _Transaction(self._conn)
+
+    def lookup_stat(
+        self, file_path: Path, stat: os.stat_result, need_line_count: bool = False
+    ) -> Optional[CachedResult]:
+        """Return cached results if the file's stat signature is unchanged.
+
+        Args:
+            file_path: Absolute file path
+            stat: Current ``os.stat`` result for the file
+            need_line_count: Treat entries stored without a line count as misses
+
+        Returns:
+            Cached (blocks, errors, line_count), or None on a miss
+        """
+        row = self._conn.execute(
+            'SELECT mtime_ns, size, inode, payload FROM entries WHERE path = ?',
+            (str(file_path),),
+        ).fetchone()
+        if row is None or tuple(row[:3]) != _signature(stat):
+            return None
+        cached = _load_payload(file_path, row[3])
+        if need_line_count and cached[2] is None:
+            return None
+        self.hits += 1
+        self._pending_touch.append((time.time(), str(file_path)))
+        self._maybe_flush()
+        return cached
+
+    def lookup_digest(
+        self,
+        file_path: Path,
+        stat: os.stat_result,
+        digest: str,
+        need_line_count: bool = False,
+    ) -> Optional[CachedResult]:
+        """Return cached results if the file content is unchanged.
+
+        Used after a stat mismatch (e.g. a fresh checkout touching mtimes);
+        on a hit the stored stat signature is refreshed.
+
+        Args:
+            file_path: Absolute file path
+            stat: Current ``os.stat`` result for the file
+            digest: ``content_digest`` of the current file bytes
+            need_line_count: Treat entries stored without a line count as misses
+
+        Returns:
+            Cached (blocks, errors, line_count), or None on a miss
+        """
+        row = self._conn.execute(
+            'SELECT digest, payload FROM entries WHERE path = ?',
+            (str(file_path),),
+        ).fetchone()
+        cached = None if row is None or row[0] != digest else _load_payload(file_path, row[1])
+        if cached is None or (need_line_count and cached[2] is None):
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._pending_store.append(
+            (str(file_path), *_signature(stat), digest, row[1], time.time())
+        )
+        self._maybe_flush()
+        return cached
+
+    def store(
+        self,
+        file_path: Path,
+        stat: os.stat_result,
+        digest: str,
+        blocks: list[AnnotationBlock],
+        errors: list[AnnotationError],
+        line_count: Optional[int] = None,
+    ) -> None:
+        """Record validation results for a file.
+
+        Args:
+            file_path: Absolute file path
+            stat: ``os.stat`` result taken before the file was read
+            digest: ``content_digest`` of the file bytes
+            blocks: Valid blocks found in the file
+            errors: Validation errors found in the file
+            line_count: Number of lines in the file, for coverage metrics
+        """
+        payload = json.dumps({
+            'blocks': [_record(block) for block in blocks],
+            'errors': [_record(error) for error in errors],
+            'lines': line_count,
+        })
+        self._pending_store.append(
+            (str(file_path), *_signature(stat), digest, payload, time.time())
+        )
+        self._maybe_flush()
+
+    def _maybe_flush(self) -> None:
+        if len(self._pending_store) + len(self._pending_touch) >= FLUSH_THRESHOLD:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write pending entries and enforce the size bound."""
+        if not self._pending_store and not self._pending_touch:
+            return
+        with self._transaction():
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO entries '
+                '(path, mtime_ns, size, inode, digest, payload, last_used) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                self._pending_store,
+            )
+            self._conn.executemany(
+                'UPDATE entries SET last_used = ? WHERE path = ?',
+                self._pending_touch,
+            )
+            count = self._conn.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+            if count > self.max_entries:
+                self._conn.execute(
+                    'DELETE FROM entries WHERE path IN '
+                    '(SELECT path FROM entries ORDER BY last_used LIMIT ?)',
+                    (count - self.max_entries,),
+                )
+        self._pending_store.clear()
+        self._pending_touch.clear()
+
+    def close(self) -> None:
+        """Flush pending writes and close the database."""
+        self.flush()
+        self._conn.close()
+
+
+class _Transaction:
+    """``BEGIN IMMEDIATE`` ... ``COMMIT`` block for an autocommit connection."""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute('BEGIN IMMEDIATE')
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute('ROLLBACK' if exc_type else 'COMMIT')
+        return False
+
+
+def _signature(stat: os.stat_result) -> tuple[int, int, int]:
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+def _record(item) -> dict:
+    record = asdict(item)
+    del record['file_path']
+    return record
+
+
+def _load_payload(file_path: Path, payload: str) -> CachedResult:
+    data = json.loads(payload)
+    blocks = [AnnotationBlock(file_path=file_path, **block) for block in data['blocks']]
+    errors = [
+        AnnotationError(
+            file_path=file_path,
+            line_number=error['line_number'],
+            code=ErrorCode(error['code']),
+            args=tuple(error['args']),
+        )
+        for error in data['errors']
+    ]
+    return blocks, errors, data.get('lines')
@@ -4,14 +4,28 @@ import argparse
 import sys
 from pathlib import Path
 
-from .config import Config, DEFAULT_EXCLUDE_PATTERNS, DEFAULT_FILE_PATTERNS
-from .parser import AnnotationParser
-from .reporter import ResultReporter
+from .config import OVERSIZED_ACTIONS, Config
+from .coverage import DEFAULT_DIRECTORY_DEPTH
+from .parallel import ParallelValidator
+from .results import ErrorTable
 from .scanner import FileScanner
+from .shard import parse_shard
+from .stats import RunStats, maybe_phase
+
+# The pre-commit hook starts a new interpreter for every commit, so modules
+# that only some runs need (the reporter, json, asyncio, sqlite3, sockets,
+# subprocess) are imported where they are used rather than here. The
+# import-time budget is checked by tests/test_startup.py.
+
+# Keep in sync with reporter.STREAMING_REPORTERS, which is not imported here
+STREAMING_FORMATS = ('ndjson', 'sarif')
 
 
 def main():
     """Main CLI entry point."""
+    if len(sys.argv) > 1 and sys.argv[1] in SUBCOMMANDS:
+        return SUBCOMMANDS[sys.argv[1]](sys.argv[2:])
+
     parser = argparse.ArgumentParser(
         description='Validate AI-generated code annotations in a repository',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -26,11 +40,68 @@ Examples:
   # Output as JSON
   python -m ai_code_validator --output-format json
 
+  # Stream errors as NDJSON or SARIF while scanning
+  python -m ai_code_validator --output-format sarif > results.sarif
+
   # Custom file patterns
   python -m ai_code_validator --file-patterns "*.py,*.js,*.ts"
 
   # Exclude patterns
   python -m ai_code_validator --exclude-patterns "build,dist,.git"
+
+  # Validate with 8 worker processes
+  python -m ai_code_validator --jobs 8
+
+  # Overlap up to 32 directory listings and reads on a network filesystem
+  python -m ai_code_validator --io-concurrency 32
+
+  # Reuse results for unchanged files between runs
+  python -m ai_code_validator --cache
+
+  # Pre-commit: validate the staged version of staged files only
+  python -m ai_code_validator --staged
+
+  # Pull request: validate files changed since the base branch
+  python -m ai_code_validator --since origin/main
+
+  # Validate a past release from the object database, without checking it out
+  python -m ai_code_validator --git-rev v1.2.0
+
+  # Validate the sources shipped in a wheel and an sdist, without extracting them
+  python -m ai_code_validator --archive dist/pkg-1.0-py3-none-any.whl --archive dist/pkg-1.0.tar.gz
+
+  # Audit every commit of a release and find when violations came and went
+  python -m ai_code_validator audit --range v1.1.0..v1.2.0
+
+  # Validate an explicit file list
+  git ls-files -z | python -m ai_code_validator --files-from -
+
+  # Split the tree over 4 CI nodes, then combine their JSON reports
+  python -m ai_code_validator --shard 1/4 --output-format json > shard1.json
+  python -m ai_code_validator merge shard*.json
+
+  # Gate a pull request: stop at the first error instead of scanning everything
+  python -m ai_code_validator --since origin/main --fail-fast
+
+  # On shared CI runners: skip files over 5 MB, stop after 10 minutes or at 2 GB RSS
+  python -m ai_code_validator --max-file-size 5M --time-budget 600 --max-rss 2048
+
+  # Show per-phase timings and the slowest files, and dump a cProfile
+  python -m ai_code_validator --stats --profile validator.prof
+
+  # Report AI-generated line ratios per top-two directory levels, tool and author
+  python -m ai_code_validator --coverage --coverage-depth 2
+
+  # Revalidate changed files and reprint the report while editing
+  python -m ai_code_validator --watch
+
+  # Keep results in memory in a daemon and query it from hooks
+  python -m ai_code_validator serve &
+  python -m ai_code_validator client --output-format json
+
+  # Index annotation blocks, then query them without rescanning
+  python -m ai_code_validator index
+  python -m ai_code_validator query --tool "GitHub Copilot" --since 2025-01-01
         ''',
     )
 
@@ -42,9 +113,9 @@ Examples:
 
     parser.add_argument(
         '--output-format',
-        choices=['text', 'json'],
+        choices=['text', 'json', *STREAMING_FORMATS],
         default='text',
-        help='Output format (default: text)',
+        help='Output format (default: text); ndjson and sarif are streamed while scanning',
     )
 
     parser.add_argument(
@@ -59,6 +130,170 @@ Examples:
         default=None,
     )
 
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=None,
+        help='Number of worker processes for reading and validation (default: CPU count)',
+    )
+
+    parser.add_argument(
+        '--io-concurrency',
+        type=int,
+        metavar='N',
+        default=None,
+        help='List directories and read files with up to N concurrent I/O operations in '
+        'one process, for network filesystems (results are reported in completion order)',
+    )
+
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Cache per-file results in .ai-validator-cache/ and skip unchanged files',
+    )
+
+    parser.add_argument(
+        '--cache-dir',
+        default=None,
+        help='Directory for the validation cache (implies --cache)',
+    )
+
+    parser.add_argument(
+        '--no-gitignore',
+        action='store_true',
+        help='Do not skip paths ignored by .gitignore, .git/info/exclude or .ai-validator-ignore',
+    )
+
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument(
+        '--staged',
+        action='store_true',
+        help='Validate the staged contents of files changed in the git index',
+    )
+    source.add_argument(
+        '--since',
+        metavar='REV',
+        default=None,
+        help='Validate only files changed between REV and the working tree',
+    )
+    source.add_argument(
+        '--files-from',
+        metavar='FILE',
+        default=None,
+        help='Validate only the paths listed in FILE (newline or NUL separated, - for stdin)',
+    )
+    source.add_argument(
+        '--git-rev',
+        metavar='REV',
+        default=None,
+        help='Validate the files of REV straight from the git object database, without '
+        'a checkout (works in bare repositories)',
+    )
+    source.add_argument(
+        '--archive',
+        metavar='FILE',
+        action='append',
+        default=None,
+        help='Validate the members of a zip, wheel, jar or tar (gz, bz2, xz) archive '
+        'without extracting it; errors are reported as archive!member:line (repeatable)',
+    )
+
+    parser.add_argument(
+        '--coverage',
+        action='store_true',
+        help='Add AI-generated line counts and ratios per directory, tool and author '
+        'to the text or json report',
+    )
+
+    parser.add_argument(
+        '--coverage-depth',
+        type=int,
+        metavar='N',
+        default=DEFAULT_DIRECTORY_DEPTH,
+        help=f'Group coverage by the first N directory levels (default: {DEFAULT_DIRECTORY_DEPTH})',
+    )
+
+    parser.add_argument(
+        '--watch',
+        action='store_true',
+        help='Keep running, revalidate changed files and print a new report after each '
+        'burst of changes (inotify where available, else mtime polling)',
+    )
+
+    parser.add_argument(
+        '--shard',
+        metavar='INDEX/COUNT',
+        type=_shard_arg,
+        default=None,
+        help='Validate only the files in shard INDEX of COUNT (1-based), split by a stable '
+        'hash of the repo-relative path; combine JSON reports with the merge subcommand',
+    )
+
+    parser.add_argument(
+        '--fail-fast',
+        action='store_true',
+        help='Stop at the first error (same as --max-errors 1)',
+    )
+
+    parser.add_argument(
+        '--max-errors',
+        type=int,
+        metavar='N',
+        default=None,
+        help='Stop scanning once N errors were found; the report is marked as truncated',
+    )
+
+    parser.add_argument(
+        '--max-file-size',
+        type=_size_arg,
+        metavar='SIZE',
+        default=None,
+        help='Treat files larger than SIZE bytes (K, M, G suffixes allowed) as oversized; '
+        'they are listed as warnings in the report',
+    )
+
+    parser.add_argument(
+        '--oversized',
+        choices=OVERSIZED_ACTIONS,
+        default='skip',
+        help='Skip oversized files, or scan only their first --max-file-size bytes for '
+        'annotations (default: skip)',
+    )
+
+    parser.add_argument(
+        '--time-budget',
+        type=float,
+        metavar='SECONDS',
+        default=None,
+        help='Stop after SECONDS and report the files validated so far, with per-phase '
+        'timings on stderr',
+    )
+
+    parser.add_argument(
+        '--max-rss',
+        type=int,
+        metavar='MB',
+        default=None,
+        help='Stop once this process or any worker process has used MB megabytes of memory '
+        'and report the files validated so far, with per-phase timings on stderr',
+    )
+
+    parser.add_argument(
+        '--stats',
+        nargs='?',
+        const='text',
+        choices=['text', 'json'],
+        default=None,
+        help='Print per-phase timings, counters and slowest files to stderr (default: text)',
+    )
+
+    parser.add_argument(
+        '--profile',
+        metavar='FILE',
+        default=None,
+        help='Write a cProfile dump of the run to FILE (worker processes are not profiled)',
+    )
+
     parser.add_argument(
         '--verbose',
         action='store_true',
@@ -66,6 +301,37 @@ Examples:
     )
 
     args = parser.parse_args()
+    if args.io_concurrency is not None and (args.cache or args.cache_dir):
+        parser.error('--io-concurrency cannot be combined with --cache')
+    if args.watch and (
+        args.output_format in STREAMING_FORMATS
+        or args.staged
+        or args.since
+        or args.files_from
+        or args.git_rev
+        or args.archive
+        or args.io_concurrency is not None
+    ):
+        parser.error('--watch validates the whole tree with text or json output')
+    if args.coverage and (args.watch or args.output_format in STREAMING_FORMATS):
+        parser.error('--coverage is reported in text and json output only')
+    max_errors = 1 if args.fail_fast else args.max_errors
+    if max_errors is not None and max_errors < 1:
+        parser.error('--max-errors must be at least 1')
+    if args.watch and max_errors is not None:
+        parser.error('--watch cannot be combined with --fail-fast or --max-errors')
+    if args.time_budget is not None and args.time_budget <= 0:
+        parser.error('--time-budget must be positive')
+    if args.max_rss is not None and args.max_rss < 1:
+        parser.error('--max-rss must be at least 1')
+    budget = None
+    if args.time_budget is not None or args.max_rss is not None:
+        if args.watch:
+            parser.error('--watch cannot be combined with --time-budget or --max-rss')
+        from .budget import RunBudget
+        budget = RunBudget(
+            args.time_budget, args.max_rss * 1024 * 1024 if args.max_rss is not None else None
+        )
 
     # Create configuration
     config = Config.from_cli_args(args)
@@ -76,31 +342,120 @@ Examples:
         print(f'Excluded patterns: {", ".join(config.exclude_patterns)}', file=sys.stderr)
         print('', file=sys.stderr)
 
-    # Scan files
-    scanner = FileScanner(config)
-    parser_instance = AnnotationParser()
-    reporter = ResultReporter(verbose=config.verbose)
+    # Scan files; a budget always collects statistics, to account for a
+    # run it cuts short
+    stats = RunStats() if args.stats or budget is not None else None
+    coverage = None
+    if args.coverage:
+        from .coverage import CoverageMetrics
+        coverage = CoverageMetrics(config.repo_path, args.coverage_depth)
+    if args.io_concurrency is not None:
+        from .asyncscan import AsyncValidator
+        validator = AsyncValidator(
+            config, args.io_concurrency, stats=stats, coverage=coverage, budget=budget
+        )
+    else:
+        validator = ParallelValidator(config, stats=stats, coverage=coverage, budget=budget)
+
+    streaming = None
+    if args.output_format in STREAMING_FORMATS:
+        from .reporter import STREAMING_REPORTERS
+        streaming = STREAMING_REPORTERS[args.output_format](repo_path=config.repo_path)
+
+    profiler = None
+    if args.profile:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
 
     try:
+        if args.watch:
+            return _watch(args, config)
+
         files_scanned = 0
-        all_errors = []
+        errors_found = 0
+        stop_reason = None
+        all_errors = ErrorTable()
+
+        if streaming:
+            streaming.start()
+
+        results = _validate(args, config, validator)
+        try:
+            for file_path, _, errors in results:
+                files_scanned += 1
+                if max_errors is not None and errors_found + len(errors) >= max_errors:
+                    # The report is only truncated if errors are dropped or
+                    # files are left unchecked, not when the last file
+                    # reaches the limit exactly
+                    if errors_found + len(errors) > max_errors or next(results, None) is not None:
+                        stop_reason = 'max_errors'
+                    errors = errors[:max_errors - errors_found]
+                errors_found += len(errors)
+                if streaming:
+                    with maybe_phase(stats, 'reporting'):
+                        streaming.add_file(file_path, errors)
+                else:
+                    all_errors.add(errors)
 
-        for file_path, content in scanner.scan():
-            files_scanned += 1
-            _, errors = parser_instance.validate_file(file_path, content)
-            all_errors.extend(errors)
+                if config.verbose and errors:
+                    print(f'Errors in {file_path}:', file=sys.stderr)
+                    for error in errors:
+                        print(f'  Line {error.line_number}: {error.message}', file=sys.stderr)
 
-            if config.verbose and errors:
-                print(f'Errors in {file_path}:', file=sys.stderr)
-                for error in errors:
-                    print(f'  Line {error.line_number}: {error.message}', file=sys.stderr)
+                if stop_reason is None and budget is not None:
+                    stop_reason = budget.exceeded()
+                if stop_reason is not None:
+                    break
+        finally:
+            # Cancels queued chunks, reads and listings when stopping early
+            results.close()
+        if stop_reason is None and budget is not None:
+            # Discovery and validators end the results early once the
+            # budget runs out, even between two files
+            stop_reason = budget.reason
+
+        if config.verbose:
+            print(
+                f'Files without annotation markers (fast path): {validator.fast_path_files}',
+                file=sys.stderr,
+            )
 
         # Generate and print result
-        result = reporter.generate_result(all_errors, files_scanned)
-        reporter.print_result(result, format=args.output_format)
+        with maybe_phase(stats, 'reporting'):
+            if streaming:
+                streaming.truncated = stop_reason is not None
+                streaming.stop_reason = stop_reason
+                streaming.warnings = validator.warnings
+                result = streaming.finish()
+            else:
+                from .reporter import ResultReporter
+                reporter = ResultReporter(verbose=config.verbose)
+                result = reporter.generate_result(
+                    all_errors,
+                    files_scanned,
+                    coverage.to_dict() if coverage is not None else None,
+                    validator.warnings,
+                )
+                if config.shard is not None:
+                    result.summary['shard'] = '{}/{}'.format(*config.shard)
+                if stop_reason is not None:
+                    result.summary['truncated'] = True
+                    result.summary['stop_reason'] = stop_reason
+                reporter.print_result(result, format=args.output_format)
 
-        # Exit with appropriate code
-        return 0 if result.valid else 1
+        if args.stats or stop_reason in ('time_budget', 'max_rss'):
+            stats.counters['files_scanned'] = files_scanned
+            stats.counters['fast_path_files'] = validator.fast_path_files
+            stats.finish()
+            print(
+                stats.format_json() if args.stats == 'json' else stats.format_text(),
+                file=sys.stderr,
+            )
+
+        # Exit with appropriate code; a run cut short by a budget did not
+        # check every file, so it cannot pass
+        return 0 if result.valid and stop_reason is None else 1
 
     except Exception as e:
         print(f'Error: {e}', file=sys.stderr)
@@ -109,6 +464,373 @@ Examples:
             traceback.print_exc(file=sys.stderr)
         return 1
 
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+
+
+def _size_arg(value: str) -> int:
+    from .budget import parse_size
+
+    try:
+        return parse_size(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def _shard_arg(value: str):
+    try:
+        return parse_shard(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def _watch(args, config: Config) -> int:
+    """Print a report after the initial scan and after each burst of changes.
+
+    Returns:
+        Exit code for the last report when interrupted
+    """
+    from .incremental import IncrementalValidator
+    from .reporter import ResultReporter
+    from .watcher import create_watcher, watch
+
+    reporter = ResultReporter(verbose=config.verbose)
+    validator = IncrementalValidator(config, create_watcher(FileScanner(config)))
+    result = None
+
+    def report(validator: IncrementalValidator) -> None:
+        nonlocal result
+        result = validator.result(reporter)
+        reporter.print_result(result, format=args.output_format)
+        sys.stdout.flush()
+
+    try:
+        watch(validator, report)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        validator.watcher.close()
+    return 0 if result is None or result.valid else 1
+
+
+def _validate(args, config: Config, validator: ParallelValidator):
+    """Validate the file set selected by the CLI arguments.
+
+    Yields:
+        Tuples of (file_path, valid_blocks, errors)
+    """
+    scanner = FileScanner(config, validator.stats, budget=validator.budget)
+
+    if args.staged or args.git_rev or args.since or args.files_from:
+        from .gitsource import (
+            CatFileBatch,
+            changed_files_since,
+            read_path_list,
+            read_staged_contents,
+            staged_files,
+        )
+
+    if args.staged:
+        paths = scanner.select(staged_files(config.repo_path), require_file=False)
+        yield from validator.validate_contents(read_staged_contents(config.repo_path, paths))
+        return
+
+    if args.git_rev:
+        from .history import tree_objects
+        with CatFileBatch(config.repo_path) as batch:
+            yield from validator.validate_objects(tree_objects(scanner, args.git_rev), batch.read)
+        return
+
+    if args.archive:
+        from .archive import archive_members
+        yield from validator.validate_contents(
+            member
+            for archive_path in args.archive
+            for member in archive_members(Path(archive_path), config)
+        )
+        return
+
+    if args.since:
+        paths = scanner.select(changed_files_since(config.repo_path, args.since))
+    elif args.files_from:
+        if args.files_from == '-':
+            path_list = read_path_list(sys.stdin, Path.cwd())
+        else:
+            with open(args.files_from, encoding='utf-8') as stream:
+                path_list = read_path_list(stream, Path.cwd())
+        paths = scanner.select(path_list)
+    elif args.io_concurrency is not None:
+        yield from validator.validate_tree()
+        return
+    else:
+        paths = scanner.discover_files()
+
+    yield from validator.validate(paths)
+
+
+def serve_main(argv: list[str]) -> int:
+    """Run the validation daemon (``ai-code-validator serve``)."""
+    from .daemon import DEFAULT_POLL_INTERVAL, ValidationDaemon
+
+    parser = argparse.ArgumentParser(
+        prog='ai-code-validator serve',
+        description='Keep validation results for a repository in memory and answer '
+        'requests on a Unix socket',
+    )
+    parser.add_argument('--repo-path', default='.', help='Root path of repository to watch')
+    parser.add_argument('--socket', default=None, help='Socket path (default: .ai-validator-cache/daemon.sock)')
+    parser.add_argument(
+        '--poll-interval',
+        type=float,
+        default=DEFAULT_POLL_INTERVAL,
+        help=f'Seconds between checks for changed files (default: {DEFAULT_POLL_INTERVAL})',
+    )
+    parser.add_argument('--file-patterns', default=None, help='Comma-separated file patterns to scan')
+    parser.add_argument('--exclude-patterns', default=None, help='Comma-separated patterns to exclude')
+    parser.add_argument('--no-gitignore', action='store_true', help='Do not skip ignored paths')
+    parser.add_argument('--verbose', action='store_true', help='Log refreshes')
+    parser.set_defaults(
+        jobs=None, cache=False, cache_dir=None, shard=None, max_file_size=None, oversized='skip'
+    )
+    args = parser.parse_args(argv)
+
+    config = Config.from_cli_args(args)
+    daemon = ValidationDaemon(config, args.socket, args.poll_interval)
+    try:
+        print(f'Listening on {daemon.socket_path}', file=sys.stderr)
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        print(f'Error: {e}', file=sys.stderr)
+        return 1
+    return 0
+
+
+def client_main(argv: list[str]) -> int:
+    """Query a running daemon (``ai-code-validator client``)."""
+    from .daemon import default_socket_path, send_request
+
+    parser = argparse.ArgumentParser(
+        prog='ai-code-validator client',
+        description='Print the current report from a running validation daemon',
+    )
+    parser.add_argument('--repo-path', default='.', help='Repository the daemon serves')
+    parser.add_argument('--socket', default=None, help='Socket path (default: .ai-validator-cache/daemon.sock)')
+    parser.add_argument('--output-format', choices=['text', 'json'], default='text', help='Output format')
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='Have the daemon pick up changes made since its last poll before answering',
+    )
+    command = parser.add_mutually_exclusive_group()
+    command.add_argument('--status', action='store_true', help='Print daemon status instead of a report')
+    command.add_argument('--shutdown', action='store_true', help='Stop the daemon')
+    args = parser.parse_args(argv)
+
+    if args.status:
+        request = {'command': 'status'}
+    elif args.shutdown:
+        request = {'command': 'shutdown'}
+    else:
+        request = {'command': 'check', 'format': args.output_format, 'refresh': args.refresh}
+
+    socket_path = Path(args.socket) if args.socket else default_socket_path(Path(args.repo_path))
+    try:
+        response = send_request(socket_path, request)
+    except Exception as e:
+        print(f'Error: {e}', file=sys.stderr)
+        return 1
+    print(response['output'])
+    return response['exit_code']
+
+
+def index_main(argv: list[str]) -> int:
+    """Update the annotation inventory (``ai-code-validator index``)."""
+    from .inventory import AnnotationInventory, default_inventory_path
+
+    parser = argparse.ArgumentParser(
+        prog='ai-code-validator index',
+        description='Record annotation blocks and errors in a SQLite inventory, '
+        're-reading only files changed since the last run',
+    )
+    parser.add_argument('--repo-path', default='.', help='Root path of repository to index')
+    parser.add_argument('--db', default=None, help='Inventory database (default: .ai-validator-cache/inventory.sqlite3)')
+    parser.add_argument('--file-patterns', default=None, help='Comma-separated file patterns to index')
+    parser.add_argument('--exclude-patterns', default=None, help='Comma-separated patterns to exclude')
+    parser.add_argument('--no-gitignore', action='store_true', help='Do not skip ignored paths')
+    parser.add_argument('--jobs', type=int, default=None, help='Number of worker processes')
+    parser.add_argument('--verbose', action='store_true', help='Enable verbose output')
+    parser.set_defaults(cache=False, cache_dir=None, shard=None, max_file_size=None, oversized='skip')
+    args = parser.parse_args(argv)
+
+    config = Config.from_cli_args(args)
+    try:
+        inventory = AnnotationInventory(args.db or default_inventory_path(config.repo_path))
+        try:
+            counts = inventory.update(config)
+        finally:
+            inventory.close()
+    except Exception as e:
+        print(f'Error: {e}', file=sys.stderr)
+        return 1
+    print(
+        f"Indexed {counts['files']} files "
+        f"({counts['updated']} updated, {counts['removed']} removed)"
+    )
+    return 0
+
+
+def query_main(argv: list[str]) -> int:
+    """Query the annotation inventory (``ai-code-validator query``)."""
+    from .inventory import AnnotationInventory, default_inventory_path
+
+    parser = argparse.ArgumentParser(
+        prog='ai-code-validator query',
+        description='List indexed annotation blocks (or errors) without scanning the tree',
+    )
+    parser.add_argument('--repo-path', default='.', help='Repository the inventory belongs to')
+    parser.add_argument('--db', default=None, help='Inventory database (default: .ai-validator-cache/inventory.sqlite3)')
+    parser.add_argument('--tool', default=None, help='Only blocks with this TOOL_NAME')
+    parser.add_argument('--author', default=None, help='Only blocks with this AUTHOR_ID')
+    parser.add_argument('--since', default=None, help='Only blocks dated at or after this ISO 8601 date')
+    parser.add_argument('--until', default=None, help='Only blocks dated before this ISO 8601 date')
+    parser.add_argument('--path', default=None, help='Only files under this repo-relative directory')
+    parser.add_argument('--errors', action='store_true', help='List validation errors instead of blocks')
+    parser.add_argument('--count', action='store_true', help='Print only the number of matches')
+    parser.add_argument('--output-format', choices=['text', 'json'], default='text', help='Output format')
+    args = parser.parse_args(argv)
+
+    db_path = Path(args.db) if args.db else default_inventory_path(Path(args.repo_path))
+    if not db_path.exists():
+        print(
+            f"Error: No inventory at {db_path}; build one with 'ai-code-validator index'",
+            file=sys.stderr,
+        )
+        return 1
+
+    try:
+        inventory = AnnotationInventory(db_path)
+        try:
+            if args.errors:
+                records = inventory.errors(args.path)
+            else:
+                records = inventory.blocks(
+                    tool=args.tool,
+                    author=args.author,
+                    since=args.since,
+                    until=args.until,
+                    path_prefix=args.path,
+                )
+        finally:
+            inventory.close()
+    except Exception as e:
+        print(f'Error: {e}', file=sys.stderr)
+        return 1
+
+    if args.count:
+        print(len(records))
+    elif args.output_format == 'json':
+        import json
+        print(json.dumps(records, indent=2))
+    elif args.errors:
+        for record in records:
+            print(f"{record['path']}:{record['line_number']}: {record['message']}")
+    else:
+        for record in records:
+            print(
+                f"{record['path']}:{record['start_line']}-{record['end_line']}  "
+                f"{record['tool_name']}  {record['author_id']}  {record['date']}  {record['action']}"
+            )
+    return 0
+
+
+def merge_main(argv: list[str]) -> int:
+    """Combine per-shard JSON reports (``ai-code-validator merge``)."""
+    parser = argparse.ArgumentParser(
+        prog='ai-code-validator merge',
+        description='Combine JSON reports from --shard runs into one report',
+    )
+    parser.add_argument('reports', nargs='+', metavar='REPORT', help='JSON report files')
+    parser.add_argument('--output-format', choices=['text', 'json'], default='text', help='Output format')
+    args = parser.parse_args(argv)
+
+    import json
+
+    from .reporter import ResultReporter
+    from .shard import merge_reports, missing_shards
+
+    try:
+        reports = []
+        for report_path in args.reports:
+            with open(report_path, encoding='utf-8') as stream:
+                reports.append(json.load(stream))
+        result = merge_reports(reports)
+        missing = missing_shards(reports)
+    except Exception as e:
+        print(f'Error: {e}', file=sys.stderr)
+        return 1
+
+    if missing:
+        # Files of a missing shard were never validated
+        print(f'Error: No reports for shard(s) {", ".join(missing)}', file=sys.stderr)
+        return 1
+    ResultReporter().print_result(result, format=args.output_format)
+    return 0 if result.valid else 1
+
+
+def audit_main(argv: list[str]) -> int:
+    """Audit every commit of a range (``ai-code-validator audit``)."""
+    from .history import HistoryAudit, format_audit_text
+
+    parser = argparse.ArgumentParser(
+        prog='ai-code-validator audit',
+        description='Validate every commit in a range from the object database and report '
+        'when each violation was introduced and fixed',
+    )
+    parser.add_argument('--range', required=True, dest='revision_range', metavar='A..B', help='Commit range to audit')
+    parser.add_argument('--repo-path', default='.', help='Repository (or subdirectory) to audit')
+    parser.add_argument('--output-format', choices=['text', 'json'], default='text', help='Output format')
+    parser.add_argument('--file-patterns', default=None, help='Comma-separated file patterns to validate')
+    parser.add_argument('--exclude-patterns', default=None, help='Comma-separated patterns to exclude')
+    parser.add_argument('--verbose', action='store_true', help='Enable verbose output')
+    parser.set_defaults(
+        jobs=None,
+        cache=False,
+        cache_dir=None,
+        shard=None,
+        no_gitignore=False,
+        max_file_size=None,
+        oversized='skip',
+    )
+    args = parser.parse_args(argv)
+
+    config = Config.from_cli_args(args)
+    try:
+        report = HistoryAudit(config).run(args.revision_range)
+    except Exception as e:
+        print(f'Error: {e}', file=sys.stderr)
+        return 1
+
+    if args.output_format == 'json':
+        import json
+        print(json.dumps(report, indent=2))
+    else:
+        print(format_audit_text(report))
+    return 0 if report['valid'] else 1
+
+
+SUBCOMMANDS = {
+    'serve': serve_main,
+    'client': client_main,
+    'index': index_main,
+    'query': query_main,
+    'merge': merge_main,
+    'audit': audit_main,
+}
+
 
 if __name__ == '__main__':
     sys.exit(main())
@@ -1,8 +1,14 @@
 """Configuration management for the AI Code Validator."""
 
+import fnmatch
 import os
+import re
 from pathlib import Path
-from typing import Set
+from typing import Optional, Set
+
+from .patterns import FilePatternMatcher
+from .reader import DEFAULT_MMAP_THRESHOLD
+from .shard import Shard, shard_of
 
 DEFAULT_FILE_PATTERNS = [
     '*.py',
@@ -33,12 +39,18 @@ DEFAULT_EXCLUDE_PATTERNS = [
     'env',
     'build',
     'dist',
-    '.egg-info',
+    '*.egg-info',
     'out',
     '.vscode',
     '.idea',
+    '.ai-validator-cache',
 ]
 
+DEFAULT_CACHE_DIR = '.ai-validator-cache'
+
+# Ways to handle files over max_file_size
+OVERSIZED_ACTIONS = ('skip', 'prefix')
+
 
 class Config:
     """Configuration holder for validator settings."""
@@ -49,19 +61,66 @@ class Config:
         file_patterns: list[str] | None = None,
         exclude_patterns: list[str] | None = None,
         verbose: bool = False,
+        jobs: int | None = None,
+        cache_dir: str | None = None,
+        mmap_threshold: int = DEFAULT_MMAP_THRESHOLD,
+        respect_gitignore: bool = True,
+        shard: Optional[Shard] = None,
+        max_file_size: Optional[int] = None,
+        oversized: str = 'skip',
     ):
         """Initialize configuration.
 
         Args:
             repo_path: Root repository path to scan
-            file_patterns: File patterns to include (e.g., ['*.py', '*.js'])
-            exclude_patterns: Directory/file patterns to exclude
+            file_patterns: File patterns to include (e.g., ['*.py', '*.js',
+                'Dockerfile', 'src/**/*.ts'])
+            exclude_patterns: Directory/file name patterns to exclude
+                (exact names or globs such as '*.egg-info')
             verbose: Enable verbose output
+            jobs: Number of worker processes (default: CPU count)
+            cache_dir: Directory for the incremental validation cache
+                (default: caching disabled)
+            mmap_threshold: Files at least this many bytes are memory-mapped
+            respect_gitignore: Also skip paths ignored by .gitignore,
+                .git/info/exclude and .ai-validator-ignore files
+            shard: Optional (index, count) selecting the 1-based share of
+                files this run validates
+            max_file_size: Files larger than this many bytes are oversized
+                (default: no limit)
+            oversized: What to do with oversized files: ``skip`` them, or
+                scan only a ``prefix`` of ``max_file_size`` bytes
+
+        Raises:
+            ValueError: If ``oversized`` is not a known action
         """
+        if oversized not in OVERSIZED_ACTIONS:
+            raise ValueError(f'Invalid oversized action: {oversized} (expected skip or prefix)')
         self.repo_path = Path(repo_path).resolve()
         self.file_patterns = file_patterns or DEFAULT_FILE_PATTERNS
         self.exclude_patterns = exclude_patterns or DEFAULT_EXCLUDE_PATTERNS
         self.verbose = verbose
+        self.jobs = max(1, jobs or os.cpu_count() or 1)
+        self.cache_dir = Path(cache_dir).resolve() if cache_dir else None
+        self.mmap_threshold = mmap_threshold
+        self.respect_gitignore = respect_gitignore
+        self.shard = shard
+        self.max_file_size = max_file_size
+        self.oversized = oversized
+        self._file_matcher = FilePatternMatcher(self.file_patterns)
+        self._compile_exclude_patterns()
+
+    def _compile_exclude_patterns(self) -> None:
+        """Split exclude patterns into exact names and one combined glob regex."""
+        exact = []
+        globs = []
+        for pattern in self.exclude_patterns:
+            if any(char in pattern for char in '*?['):
+                globs.append(fnmatch.translate(pattern))
+            else:
+                exact.append(pattern)
+        self._exclude_names = frozenset(exact)
+        self._exclude_glob = re.compile('|'.join(globs)) if globs else None
 
     @classmethod
     def from_cli_args(cls, args) -> 'Config':
@@ -74,17 +133,53 @@ class Config:
         if args.exclude_patterns:
             exclude_patterns = [p.strip() for p in args.exclude_patterns.split(',')]
 
+        cache_dir = args.cache_dir
+        if cache_dir is None and args.cache:
+            cache_dir = str(Path(args.repo_path) / DEFAULT_CACHE_DIR)
+
         return cls(
             repo_path=args.repo_path,
             file_patterns=file_patterns,
             exclude_patterns=exclude_patterns,
             verbose=args.verbose,
+            jobs=args.jobs,
+            cache_dir=cache_dir,
+            respect_gitignore=not args.no_gitignore,
+            shard=args.shard,
+            max_file_size=args.max_file_size,
+            oversized=args.oversized,
         )
 
     def should_exclude_path(self, path: Path) -> bool:
         """Check if a path should be excluded from scanning."""
-        parts = path.parts
-        for pattern in self.exclude_patterns:
-            if pattern in parts:
-                return True
-        return False
+        return any(self.is_excluded_name(part) for part in path.parts)
+
+    def matches_file(self, relative_path: str) -> bool:
+        """Check if a file matches the configured file patterns.
+
+        Args:
+            relative_path: ``/``-separated path relative to the repository root
+
+        Returns:
+            True if the file should be scanned (and belongs to this run's
+            shard, if sharded)
+        """
+        if not self._file_matcher.matches(relative_path):
+            return False
+        return self.shard is None or shard_of(relative_path, self.shard[1]) == self.shard[0]
+
+    def is_excluded_name(self, name: str) -> bool:
+        """Check if a single path component matches an exclude pattern.
+
+        Used during traversal so excluded directories are pruned before
+        they are descended into.
+
+        Args:
+            name: File or directory name (one path component)
+
+        Returns:
+            True if the component is excluded
+        """
+        if name in self._exclude_names:
+            return True
+        return self._exclude_glob is not None and self._exclude_glob.match(name) is not None
@@ -0,0 +1,148 @@
+"""AI-generated code coverage metrics aggregated while validating."""
+
+from pathlib import Path
+from typing import Iterable
+
+from .parser import AnnotationBlock
+
+DEFAULT_DIRECTORY_DEPTH = 1
+
+# Group key for files directly in the repository root
+ROOT_GROUP = '.'
+
+
+def block_lines(block: AnnotationBlock) -> int:
+    """Number of lines inside a block, excluding its START and END marker lines."""
+    return max(0, block.end_line - block.start_line - 1)
+
+
+def _ratio(part: int, whole: int) -> float:
+    return part / whole if whole else 0.0
+
+
+class CoverageMetrics:
+    """Streaming totals of AI-generated lines per directory, tool and author.
+
+    Each file is folded into fixed-size counters as it is validated, so
+    memory grows with the number of groups, not files. Worker processes keep
+    their own instance and send ``to_dict()`` back to be combined with
+    ``merge()``.
+    """
+
+    def __init__(self, repo_path: Path, directory_depth: int = DEFAULT_DIRECTORY_DEPTH):
+        """Initialize empty metrics.
+
+        Args:
+            repo_path: Root that directory groups are relative to
+            directory_depth: Number of leading path components that form a
+                directory group (e.g. 2 groups ``src/api/x.py`` under ``src/api``)
+        """
+        self.repo_path = Path(repo_path)
+        self.directory_depth = max(1, directory_depth)
+        self.files = 0
+        self.total_lines = 0
+        self.ai_lines = 0
+        # directory -> [total_lines, ai_lines]
+        self.by_directory: dict[str, list[int]] = {}
+        # tool or author -> [ai_lines, blocks]
+        self.by_tool: dict[str, list[int]] = {}
+        self.by_author: dict[str, list[int]] = {}
+
+    def add_file(self, file_path: Path, total_lines: int, blocks: Iterable[AnnotationBlock]) -> None:
+        """Fold one validated file into the totals.
+
+        Args:
+            file_path: Path of the file
+            total_lines: Number of lines in the file
+            blocks: Valid annotation blocks found in the file
+        """
+        ai_lines = 0
+        for block in blocks:
+            lines = block_lines(block)
+            ai_lines += lines
+            for groups, key in ((self.by_tool, block.tool_name), (self.by_author, block.author_id)):
+                counts = groups.get(key)
+                if counts is None:
+                    groups[key] = [lines, 1]
+                else:
+                    counts[0] += lines
+                    counts[1] += 1
+
+        self.files += 1
+        self.total_lines += total_lines
+        self.ai_lines += ai_lines
+        counts = self.by_directory.setdefault(self._directory(file_path), [0, 0])
+        counts[0] += total_lines
+        counts[1] += ai_lines
+
+    def _directory(self, file_path: Path) -> str:
+        try:
+            parts = Path(file_path).relative_to(self.repo_path).parts[:-1]
+        except ValueError:
+            parts = Path(file_path).parts[:-1]
+        return '/'.join(parts[:self.directory_depth]) or ROOT_GROUP
+
+    def merge(self, other: dict) -> None:
+        """Add metrics collected elsewhere (e.g. in a worker process).
+
+        Args:
+            other: Output of another instance's ``to_dict()``
+        """
+        self.files += other['files']
+        self.total_lines += other['total_lines']
+        self.ai_lines += other['ai_lines']
+        for name, value in other['by_directory'].items():
+            counts = self.by_directory.setdefault(name, [0, 0])
+            counts[0] += value['total_lines']
+            counts[1] += value['ai_lines']
+        for groups, key in ((self.by_tool, 'by_tool'), (self.by_author, 'by_author')):
+            for name, value in other[key].items():
+                counts = groups.setdefault(name, [0, 0])
+                counts[0] += value['ai_lines']
+                counts[1] += value['blocks']
+
+    def to_dict(self) -> dict:
+        """Return the metrics as a JSON-serializable dict with ratios."""
+        return {
+            'files': self.files,
+            'total_lines': self.total_lines,
+            'ai_lines': self.ai_lines,
+            'ratio': _ratio(self.ai_lines, self.total_lines),
+            'by_directory': {
+                name: {
+                    'total_lines': total,
+                    'ai_lines': ai,
+                    'ratio': _ratio(ai, total),
+                }
+                for name, (total, ai) in sorted(self.by_directory.items())
+            },
+            'by_tool': {
+                name: {'ai_lines': ai, 'blocks': blocks}
+                for name, (ai, blocks) in sorted(self.by_tool.items())
+            },
+            'by_author': {
+                name: {'ai_lines': ai, 'blocks': blocks}
+                for name, (ai, blocks) in sorted(self.by_author.items())
+            },
+        }
+
+
+def format_coverage_text(coverage: dict) -> list[str]:
+    """Format a ``CoverageMetrics.to_dict()`` result as report lines."""
+    lines = [
+        'AI code coverage:',
+        f"  AI lines: {coverage['ai_lines']} / {coverage['total_lines']} "
+        f"({coverage['ratio']:.2%})",
+    ]
+    if coverage['by_directory']:
+        lines.append('  By directory:')
+        for name, value in coverage['by_directory'].items():
+            lines.append(
+                f"    {name}: {value['ai_lines']} / {value['total_lines']} ({value['ratio']:.2%})"
+            )
+    for title, key in (('By tool', 'by_tool'), ('By author', 'by_author')):
+        if coverage[key]:
+            lines.append(f'  {title}:')
+            for name, value in coverage[key].items():
+                lines.append(f"    {name}: {value['ai_lines']} lines in {value['blocks']} block(s)")
+    return lines
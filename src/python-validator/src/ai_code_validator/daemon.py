@@ -0,0 +1,212 @@
+"""Long-running validation server on a Unix socket, and its client."""
+
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from .config import DEFAULT_CACHE_DIR, Config
+from .incremental import IncrementalValidator
+from .reporter import ResultReporter
+
+DEFAULT_SOCKET_NAME = 'daemon.sock'
+
+DEFAULT_POLL_INTERVAL = 1.0
+
+# Seconds a client waits for the server to answer
+DEFAULT_CLIENT_TIMEOUT = 60.0
+
+
+def default_socket_path(repo_path: Path) -> Path:
+    """Return the socket a daemon for ``repo_path`` listens on by default."""
+    return Path(repo_path).resolve() / DEFAULT_CACHE_DIR / DEFAULT_SOCKET_NAME
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Answers one newline-terminated JSON request per connection."""
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        try:
+            request = json.loads(line)
+            response = self.server.daemon.handle(request)
+        except (ValueError, KeyError, TypeError) as e:
+            response = {'exit_code': 2, 'output': f'Error: invalid request: {e}'}
+        self.wfile.write(json.dumps(response).encode('utf-8') + b'\n')
+
+
+class _UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class ValidationDaemon:
+    """Keeps a tree's validation results in memory and serves reports.
+
+    A background thread polls the tree every ``poll_interval`` seconds and
+    revalidates changed files, so a ``check`` request is answered from
+    memory. Requests may ask for a synchronous refresh first when they must
+    see changes made in the last poll interval.
+
+    Requests are JSON objects with a ``command`` of ``check`` (optional
+    ``format`` of ``text`` or ``json`` and ``refresh`` flag), ``status`` or
+    ``shutdown``. Responses carry the ``exit_code`` and ``output`` the
+    one-shot CLI would have produced.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        socket_path: Optional[Path] = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ):
+        """Initialize daemon.
+
+        Args:
+            config: Configuration object
+            socket_path: Unix socket to listen on (default: inside the
+                repository's .ai-validator-cache directory)
+            poll_interval: Seconds between background refreshes
+        """
+        self.config = config
+        self.socket_path = Path(socket_path or default_socket_path(config.repo_path))
+        self.poll_interval = poll_interval
+        self.validator = IncrementalValidator(config)
+        self.reporter = ResultReporter()
+        self.last_refresh = 0.0
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._server: Optional[_UnixServer] = None
+
+    def refresh(self) -> None:
+        """Revalidate files changed since the last refresh."""
+        with self._lock:
+            changes = self.validator.refresh()
+            self.last_refresh = time.time()
+        if self.config.verbose and changes:
+            print(
+                f'Revalidated {len(changes.changed)} file(s), '
+                f'dropped {len(changes.deleted)} deleted file(s)'
+            )
+
+    def handle(self, request: dict) -> dict:
+        """Answer one request.
+
+        Args:
+            request: Decoded request object
+
+        Returns:
+            Response object with ``exit_code`` and ``output``
+        """
+        command = request['command']
+        if command == 'check':
+            if request.get('refresh'):
+                self.refresh()
+            with self._lock:
+                result = self.validator.result(self.reporter)
+            if request.get('format') == 'json':
+                output = self.reporter.report_json(result)
+            else:
+                output = self.reporter.report_text(result)
+            return {'exit_code': 0 if result.valid else 1, 'output': output}
+
+        if command == 'status':
+            with self._lock:
+                status = {
+                    'repo_path': str(self.config.repo_path),
+                    'files': len(self.validator.errors),
+                    'last_refresh': self.last_refresh,
+                    'pid': os.getpid(),
+                }
+            return {'exit_code': 0, 'output': json.dumps(status, indent=2)}
+
+        if command == 'shutdown':
+            self._stopped.set()
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+            return {'exit_code': 0, 'output': 'Validator daemon stopped'}
+
+        raise ValueError(f'unknown command {command!r}')
+
+    def serve_forever(self) -> None:
+        """Validate the tree, then serve requests until shut down.
+
+        Raises:
+            RuntimeError: If another daemon is already listening on the socket
+        """
+        if self.socket_path.exists():
+            if _is_listening(self.socket_path):
+                raise RuntimeError(f'A validator daemon is already listening on {self.socket_path}')
+            self.socket_path.unlink()
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # The first full scan runs before any thread starts
+        self.refresh()
+
+        self._server = _UnixServer(str(self.socket_path), _RequestHandler)
+        self._server.daemon = self
+        poller = threading.Thread(target=self._poll, name='ai-validator-poll', daemon=True)
+        poller.start()
+        try:
+            self._server.serve_forever()
+        finally:
+            self._stopped.set()
+            self._server.server_close()
+            try:
+                self.socket_path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _poll(self) -> None:
+        while not self._stopped.wait(self.poll_interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                # A failed refresh must not end background polling
+                print(f'Warning: Refresh failed: {e}', file=sys.stderr)
+
+
+def _is_listening(socket_path: Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(str(socket_path))
+        except OSError:
+            return False
+    return True
+
+
+def send_request(
+    socket_path: Path, request: dict, timeout: float = DEFAULT_CLIENT_TIMEOUT
+) -> dict:
+    """Send one request to a running daemon.
+
+    Args:
+        socket_path: Socket the daemon listens on
+        request: Request object
+        timeout: Seconds to wait for the response
+
+    Returns:
+        Decoded response object
+
+    Raises:
+        RuntimeError: If no daemon is listening or the response is malformed
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        try:
+            client.connect(str(socket_path))
+        except OSError as e:
+            raise RuntimeError(
+                f"No validator daemon listening on {socket_path} ({e}); "
+                "start one with 'ai-code-validator serve'"
+            ) from e
+        client.sendall(json.dumps(request).encode('utf-8') + b'\n')
+        with client.makefile('rb') as stream:
+            line = stream.readline()
+    try:
+        return json.loads(line)
+    except ValueError as e:
+        raise RuntimeError(f'Malformed response from validator daemon: {line!r}') from e
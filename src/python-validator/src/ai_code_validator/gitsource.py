@@ -0,0 +1,212 @@
+"""Git-backed file sources for validating changed files only."""
+
+import subprocess
+from pathlib import Path
+from typing import IO, Generator, Iterable, Optional
+
+
+def run_git(repo_path: Path, *args: str) -> bytes:
+    """Run a git command in a repository and return its stdout.
+
+    Args:
+        repo_path: Directory to run git in
+        *args: Git arguments
+
+    Returns:
+        Raw stdout bytes
+
+    Raises:
+        RuntimeError: If git is missing or the command fails
+    """
+    try:
+        completed = subprocess.run(
+            ['git', *args],
+            cwd=repo_path,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+    except FileNotFoundError as e:
+        raise RuntimeError('git executable not found') from e
+
+    if completed.returncode != 0:
+        message = completed.stderr.decode('utf-8', 'replace').strip()
+        raise RuntimeError(f"git {' '.join(args)} failed: {message}")
+    return completed.stdout
+
+
+def git_toplevel(repo_path: Path) -> Path:
+    """Return the working tree root of the repository containing a path."""
+    output = run_git(repo_path, 'rev-parse', '--show-toplevel')
+    return Path(output.decode('utf-8').strip()).resolve()
+
+
+def staged_files(repo_path: Path) -> list[Path]:
+    """List files added, copied, modified or renamed in the index.
+
+    Args:
+        repo_path: Any directory inside the repository
+
+    Returns:
+        Absolute paths of staged files (deletions are omitted)
+    """
+    output = run_git(
+        repo_path, 'diff', '--cached', '--name-only', '-z', '--diff-filter=d'
+    )
+    return _absolute(git_toplevel(repo_path), output)
+
+
+def changed_files_since(repo_path: Path, rev: str) -> list[Path]:
+    """List files that differ between a revision and the working tree.
+
+    Args:
+        repo_path: Any directory inside the repository
+        rev: Revision to compare against (e.g. ``origin/main``)
+
+    Returns:
+        Absolute paths of changed files (deletions are omitted)
+    """
+    output = run_git(
+        repo_path, 'diff', '--name-only', '-z', '--diff-filter=d', rev, '--'
+    )
+    return _absolute(git_toplevel(repo_path), output)
+
+
+def tree_entries(repo_path: Path, rev: str) -> list[tuple[str, str]]:
+    """List the regular files in a revision's tree.
+
+    Run from a subdirectory of a working tree, only that directory's part of
+    the tree is listed; in a bare repository the whole tree is.
+
+    Args:
+        repo_path: Repository (or subdirectory) to list from
+        rev: Revision whose tree to list (commit, tag or tree)
+
+    Returns:
+        Tuples of (path relative to ``repo_path``, blob id); symlinks and
+        submodules are omitted
+    """
+    output = run_git(repo_path, 'ls-tree', '-r', '-z', rev)
+    entries = []
+    for record in output.split(b'\0'):
+        if not record:
+            continue
+        info, _, name = record.partition(b'\t')
+        mode, kind, object_id = info.split()
+        if kind != b'blob' or mode == b'120000':
+            continue
+        entries.append((name.decode('utf-8', 'surrogateescape'), object_id.decode('ascii')))
+    return entries
+
+
+def read_path_list(stream: IO[str], base_path: Path) -> list[Path]:
+    """Read file paths from a stream, one per line or NUL-separated.
+
+    Args:
+        stream: Text stream to read (e.g. ``sys.stdin``)
+        base_path: Directory relative paths are resolved against
+
+    Returns:
+        Absolute paths in input order
+    """
+    data = stream.read()
+    separator = '\0' if '\0' in data else '\n'
+    return [
+        (base_path / name.strip()).resolve()
+        for name in data.split(separator)
+        if name.strip()
+    ]
+
+
+def read_staged_contents(
+    repo_path: Path, paths: Iterable[Path]
+) -> Generator[tuple[Path, bytes], None, None]:
+    """Read the staged (index) version of files.
+
+    All blobs are streamed through a single ``git cat-file --batch`` process.
+
+    Args:
+        repo_path: Any directory inside the repository
+        paths: Absolute paths of files in the working tree
+
+    Yields:
+        Tuples of (file_path, staged_bytes) for files present in the index
+    """
+    toplevel = git_toplevel(repo_path)
+    with CatFileBatch(toplevel) as batch:
+        for file_path in paths:
+            relative = file_path.relative_to(toplevel).as_posix()
+            data = batch.read(f':{relative}')
+            if data is not None:
+                yield file_path, data
+
+
+def _absolute(toplevel: Path, output: bytes) -> list[Path]:
+    return [
+        toplevel / name.decode('utf-8', 'surrogateescape')
+        for name in output.split(b'\0')
+        if name
+    ]
+
+
+class CatFileBatch:
+    """Long-lived ``git cat-file --batch`` process for reading objects.
+
+    Object names can be anything ``git cat-file`` accepts, such as blob ids,
+    ``<rev>:<path>`` or ``:<path>`` for the staged version of a file.
+    """
+
+    def __init__(self, repo_path: Path):
+        """Start the batch process.
+
+        Args:
+            repo_path: Any directory inside the repository
+        """
+        try:
+            self._process = subprocess.Popen(
+                ['git', 'cat-file', '--batch'],
+                cwd=repo_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+            )
+        except FileNotFoundError as e:
+            raise RuntimeError('git executable not found') from e
+
+    def read(self, object_name: str) -> Optional[bytes]:
+        """Read an object's content.
+
+        Args:
+            object_name: Object to read
+
+        Returns:
+            Object bytes, or None if the object does not exist
+        """
+        stdin = self._process.stdin
+        stdout = self._process.stdout
+        stdin.write(object_name.encode('utf-8', 'surrogateescape') + b'\n')
+        stdin.flush()
+
+        header = stdout.readline()
+        if not header:
+            raise RuntimeError('git cat-file exited unexpectedly')
+        if header.rstrip().endswith((b' missing', b' ambiguous')):
+            return None
+
+        _, _, size = header.split()
+        size = int(size)
+        data = stdout.read(size)
+        stdout.read(1)  # Trailing newline after each object
+        return data
+
+    def close(self) -> None:
+        """Stop the batch process."""
+        if self._process.stdin:
+            self._process.stdin.close()
+        self._process.wait()
+        if self._process.stdout:
+            self._process.stdout.close()
+
+    def __enter__(self) -> 'CatFileBatch':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
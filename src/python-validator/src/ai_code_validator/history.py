@@ -0,0 +1,238 @@
+"""Validation of git revisions and commit ranges from the object database."""
+
+from pathlib import Path
+from typing import Optional
+
+from .gitsource import CatFileBatch, run_git, tree_entries
+from .parallel import ObjectResult, ParallelValidator
+from .scanner import FileScanner
+
+# A violation is identified by file and message; repeats of the same message
+# in one file are told apart by their ordinal, so line shifts caused by
+# unrelated edits do not count as a fix plus a new violation
+ViolationKey = tuple[str, str, int]
+
+# The violations of one commit, mapped to their line numbers
+ViolationState = dict[ViolationKey, int]
+
+# The violations of one commit, mapped to their report records
+OpenViolations = dict[ViolationKey, dict]
+
+
+def tree_objects(scanner: FileScanner, rev: str) -> list[tuple[Path, str]]:
+    """List the files of a revision that the scanner's config selects.
+
+    Args:
+        scanner: Scanner whose exclude and file patterns apply
+        rev: Revision whose tree to list
+
+    Returns:
+        Tuples of (file_path, blob_id), with paths under the repository root
+    """
+    root = scanner.config.repo_path
+    entries = [(root / name, object_id) for name, object_id in tree_entries(root, rev)]
+    wanted = set(scanner.select((path for path, _ in entries), require_file=False))
+    return [(path, object_id) for path, object_id in entries if path in wanted]
+
+
+def list_commits(repo_path: Path, revision_range: str) -> list[tuple[str, list[str], str]]:
+    """List the commits of a range, parents before children.
+
+    Args:
+        repo_path: Any directory inside the repository
+        revision_range: Range such as ``v1.0..v1.1``
+
+    Returns:
+        Tuples of (commit, parents (empty for a root commit), subject)
+    """
+    output = run_git(
+        repo_path, 'log', '--reverse', '--topo-order', '--format=%H%x00%P%x00%s', revision_range, '--'
+    )
+    commits = []
+    for line in output.decode('utf-8', 'replace').splitlines():
+        commit, parents, subject = line.split('\0', 2)
+        commits.append((commit, parents.split(), subject))
+    return commits
+
+
+class HistoryAudit:
+    """Validates every commit of a range, each distinct blob only once.
+
+    Blob results are memoized by object id across commits, so the cost is
+    close to the number of unique blobs in the range rather than files
+    times commits. Each commit is compared with all of its parents to find
+    the commits that introduced and fixed each violation: a violation is
+    only introduced by a commit none of whose parents had it, so one that
+    arrives through a merge keeps the record of the branch it came from.
+    """
+
+    def __init__(self, config, validator: Optional[ParallelValidator] = None):
+        """Initialize audit.
+
+        Args:
+            config: Configuration object (``repo_path`` locates the repository)
+            validator: Validator to use (default: a new ``ParallelValidator``)
+        """
+        self.config = config
+        self.validator = validator or ParallelValidator(config)
+        self.scanner = FileScanner(config)
+        self.memo: dict[str, ObjectResult] = {}
+        self._states: dict[str, ViolationState] = {}
+
+    def run(self, revision_range: str) -> dict:
+        """Audit a commit range.
+
+        Args:
+            revision_range: Range such as ``v1.0..v1.1``
+
+        Returns:
+            Report with per-commit results, violations with the commits that
+            introduced and fixed them, and a summary; violations that already
+            existed before the range have ``introduced`` set to None (and
+            ``fixed`` too if the range does not fix them)
+        """
+        commits = list_commits(self.config.repo_path, revision_range)
+        results = []
+        violations = []
+        # Violations of each audited commit, and of commits before the range
+        open_violations: dict[str, OpenViolations] = {}
+        base_violations: OpenViolations = {}
+        files_checked = 0
+
+        with CatFileBatch(self.config.repo_path) as batch:
+            for commit, parents, subject in commits:
+                state, errors, files = self._audit_tree(batch, commit)
+                files_checked += files
+                results.append({
+                    'commit': commit,
+                    'subject': subject,
+                    'valid': not errors,
+                    'files': files,
+                    'files_with_errors': len({error['file'] for error in errors}),
+                    'total_errors': len(errors),
+                })
+
+                # Parents outside the range hold the violations that predate it
+                before = [
+                    open_violations[parent] if parent in open_violations
+                    else self._base(batch, parent, base_violations)
+                    for parent in parents
+                ]
+                current = {}
+                for key, line in state.items():
+                    record = next((opened[key] for opened in before if key in opened), None)
+                    if record is None:
+                        record = _violation(key, line, introduced=commit)
+                        violations.append(record)
+                    current[key] = record
+                for opened in before:
+                    for key, record in opened.items():
+                        if key not in state and record['fixed'] is None:
+                            record['fixed'] = commit
+                open_violations[commit] = current
+
+        return {
+            'range': revision_range,
+            'valid': all(result['valid'] for result in results),
+            'commits': results,
+            'violations': [*base_violations.values(), *violations],
+            'summary': {
+                'commits': len(results),
+                'invalid_commits': sum(not result['valid'] for result in results),
+                'files_checked': files_checked,
+                'unique_blobs': len(self.memo),
+            },
+        }
+
+    def _base(
+        self, batch: CatFileBatch, commit: str, base_violations: OpenViolations
+    ) -> OpenViolations:
+        """Return the violations of a commit before the range, with shared records.
+
+        Records are shared by key, so a violation present in several commits
+        before the range (e.g. both parents of a merge) is reported once.
+        """
+        opened = {}
+        for key, line in self._state(batch, commit).items():
+            opened[key] = base_violations.setdefault(key, _violation(key, line, introduced=None))
+        return opened
+
+    def _state(self, batch: CatFileBatch, commit: str) -> ViolationState:
+        """Return the violations of a commit, auditing it if needed."""
+        if commit not in self._states:
+            self._audit_tree(batch, commit)
+        return self._states[commit]
+
+    def _audit_tree(
+        self, batch: CatFileBatch, commit: str
+    ) -> tuple[ViolationState, list[dict], int]:
+        """Validate one commit's tree through the blob memo.
+
+        Returns:
+            Tuple of (violations with their lines, error records, number of
+            files validated)
+        """
+        root = self.config.repo_path
+        errors = []
+        files = 0
+        for file_path, _, file_errors in self.validator.validate_objects(
+            tree_objects(self.scanner, commit), batch.read, self.memo
+        ):
+            files += 1
+            relative = file_path.relative_to(root).as_posix()
+            errors.extend(
+                {'file': relative, 'line': error.line_number, 'message': error.message}
+                for error in file_errors
+            )
+        state = {}
+        ordinals: dict[tuple[str, str], int] = {}
+        for error in errors:
+            pair = error['file'], error['message']
+            ordinal = ordinals[pair] = ordinals.get(pair, -1) + 1
+            state[(*pair, ordinal)] = error['line']
+        self._states[commit] = state
+        return state, errors, files
+
+
+def _violation(key: ViolationKey, line: int, introduced: Optional[str]) -> dict:
+    return {
+        'file': key[0],
+        'message': key[1],
+        'line': line,
+        'introduced': introduced,
+        'fixed': None,
+    }
+
+
+def format_audit_text(report: dict) -> str:
+    """Format an audit report as human-readable text."""
+    summary = report['summary']
+    lines = [
+        '✅ Every audited commit is valid' if report['valid']
+        else f"❌ {summary['invalid_commits']} of {summary['commits']} commits have invalid annotations",
+        '',
+        f"Audited {summary['commits']} commits in {report['range']} "
+        f"({summary['unique_blobs']} unique blobs for {summary['files_checked']} files)",
+        '',
+        'Commits:',
+    ]
+    for result in report['commits']:
+        status = '✅' if result['valid'] else '❌'
+        detail = '' if result['valid'] else (
+            f" ({result['total_errors']} errors in {result['files_with_errors']} files)"
+        )
+        lines.append(f"  {status} {result['commit'][:12]} {result['subject']}{detail}")
+
+    if report['violations']:
+        lines.append('')
+        lines.append('Violations:')
+        for violation in report['violations']:
+            introduced = (
+                f"introduced in {violation['introduced'][:12]}" if violation['introduced']
+                else 'introduced before the range'
+            )
+            fixed = f"fixed in {violation['fixed'][:12]}" if violation['fixed'] else 'not fixed'
+            lines.append(f"  {violation['file']}:{violation['line']}")
+            lines.append(f"    → {violation['message']}")
+            lines.append(f"    {introduced}, {fixed}")
+    return '\n'.join(lines)
@@ -0,0 +1,263 @@
+"""Gitignore-style exclusion rules with compiled matchers."""
+
+import re
+from pathlib import Path
+from typing import Optional
+
+# Per-directory ignore files, lowest precedence first
+IGNORE_FILENAMES = ('.gitignore', '.ai-validator-ignore')
+
+# Repository-wide ignore file inside the git directory
+GIT_INFO_EXCLUDE = Path('.git') / 'info' / 'exclude'
+
+
+def glob_to_regex(pattern: str) -> str:
+    """Translate a gitignore glob into a regex over ``/``-separated paths.
+
+    ``*`` and ``?`` never match ``/``; ``**`` matches across directories
+    when it forms a whole path component (``**/x``, ``x/**``, ``x/**/y``).
+
+    Args:
+        pattern: Glob without leading ``!``, leading ``/`` or trailing ``/``
+
+    Returns:
+        Regex source (not anchored)
+    """
+    result = []
+    i = 0
+    length = len(pattern)
+    while i < length:
+        char = pattern[i]
+        if char == '*':
+            if pattern.startswith('**', i):
+                at_start = i == 0 or pattern[i - 1] == '/'
+                at_end = i + 2 == length
+                if at_start and at_end:
+                    result.append('.*')
+                    i += 2
+                    continue
+                if at_start and pattern[i + 2] == '/':
+                    result.append('(?:.*/)?')
+                    i += 3
+                    continue
+                i += 1
+            result.append('[^/]*')
+        elif char == '?':
+            result.append('[^/]')
+        elif char == '[':
+            start = i + 1
+            if pattern[start:start + 1] in ('!', '^'):
+                start += 1
+            if pattern[start:start + 1] == ']':
+                start += 1
+            end = pattern.find(']', start)
+            if end == -1:
+                result.append(re.escape(char))
+            else:
+                body = pattern[i + 1:end]
+                if body[:1] in ('!', '^'):
+                    body = '^' + body[1:]
+                body = body.replace('\\', '\\\\').replace('[', '\\[')
+                result.append('(?!/)[' + body + ']')
+                i = end
+        elif char == '\\' and i + 1 < length:
+            i += 1
+            result.append(re.escape(pattern[i]))
+        else:
+            result.append(re.escape(char))
+        i += 1
+    return ''.join(result)
+
+
+class IgnoreRules:
+    """Compiled rules from one ignore file (or pattern list).
+
+    All patterns of the file are combined into one alternation regex per
+    entry type, ordered last pattern first, so a single ``fullmatch``
+    returns the pattern that wins under gitignore's "last match wins" rule.
+    """
+
+    def __init__(self, patterns: list[str]):
+        """Compile gitignore-style patterns.
+
+        Args:
+            patterns: Lines of an ignore file
+        """
+        file_rules = []
+        dir_rules = []
+        for line in patterns:
+            rule = self._parse(line)
+            if rule is None:
+                continue
+            regex, negated, directory_only = rule
+            dir_rules.append((regex, negated))
+            if not directory_only:
+                file_rules.append((regex, negated))
+
+        self._file_matcher, self._file_negated = self._combine(file_rules)
+        self._dir_matcher, self._dir_negated = self._combine(dir_rules)
+
+    def __bool__(self) -> bool:
+        return self._dir_matcher is not None
+
+    @staticmethod
+    def _parse(line: str) -> Optional[tuple[str, bool, bool]]:
+        """Parse one ignore line into (regex, negated, directory_only)."""
+        line = line.rstrip('\n').rstrip('\r')
+        # Trailing spaces are ignored unless escaped
+        stripped = line.rstrip(' ')
+        if stripped.endswith('\\') and len(stripped) < len(line):
+            stripped += ' '
+        line = stripped
+        if not line or line.startswith('#'):
+            return None
+
+        negated = line.startswith('!')
+        if negated:
+            line = line[1:]
+        elif line.startswith('\\'):
+            line = line[1:] if line[1:2] in ('#', '!') else line
+
+        directory_only = line.endswith('/')
+        line = line.rstrip('/')
+        if not line:
+            return None
+
+        # A slash anywhere but the end anchors the pattern to the file's directory
+        anchored = '/' in line
+        line = line.lstrip('/')
+        regex = glob_to_regex(line)
+        if not anchored:
+            regex = '(?:.*/)?' + regex
+        return regex, negated, directory_only
+
+    @staticmethod
+    def _combine(rules: list[tuple[str, bool]]):
+        if not rules:
+            return None, ()
+        ordered = list(reversed(rules))
+        matcher = re.compile('|'.join(f'({regex})' for regex, _ in ordered), re.DOTALL)
+        return matcher, tuple(negated for _, negated in ordered)
+
+    def match(self, relative_path: str, is_dir: bool) -> Optional[bool]:
+        """Decide whether a path is ignored by these rules.
+
+        Args:
+            relative_path: ``/``-separated path relative to the rules' directory
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True if ignored, False if re-included by a negated pattern, None
+            if no pattern matches
+        """
+        matcher = self._dir_matcher if is_dir else self._file_matcher
+        if matcher is None:
+            return None
+        found = matcher.fullmatch(relative_path)
+        if found is None:
+            return None
+        negated = self._dir_negated if is_dir else self._file_negated
+        return not negated[found.lastindex - 1]
+
+    @classmethod
+    def from_file(cls, path: Path) -> Optional['IgnoreRules']:
+        """Load rules from an ignore file.
+
+        Args:
+            path: Ignore file to read
+
+        Returns:
+            Compiled rules, or None if the file is missing, unreadable or empty
+        """
+        try:
+            lines = path.read_text(encoding='utf-8', errors='replace').splitlines()
+        except OSError:
+            return None
+        rules = cls(lines)
+        return rules if rules else None
+
+
+# Chain of (base, lead, rules), outermost first. A path relative to the scan
+# root is matched as ``lead + path[len(base) + 1:]``: ``base`` is the rules'
+# directory below the root, ``lead`` the root's path below an ancestor.
+RuleChain = tuple[tuple[str, str, IgnoreRules], ...]
+
+
+def load_directory_rules(directory: Path, relative_dir: str, names) -> RuleChain:
+    """Load the ignore files present in one directory.
+
+    Args:
+        directory: Directory on disk
+        relative_dir: The directory relative to the scan root ('' for root)
+        names: Entry names in the directory
+
+    Returns:
+        Rules found, lowest precedence first
+    """
+    chain = []
+    for filename in IGNORE_FILENAMES:
+        if filename in names:
+            rules = IgnoreRules.from_file(directory / filename)
+            if rules is not None:
+                chain.append((relative_dir, '', rules))
+    return tuple(chain)
+
+
+def load_root_rules(root: Path) -> RuleChain:
+    """Load the rules that apply from above the scan root.
+
+    Walks up to the enclosing git working tree (if any) so that
+    ``.git/info/exclude`` and ``.gitignore`` files in parent directories
+    apply when scanning a subdirectory of a repository. Ignore files in the
+    root itself are loaded by ``load_directory_rules`` during the walk.
+
+    Args:
+        root: Directory the scan starts in
+
+    Returns:
+        Rules for the root, outermost and lowest precedence first
+    """
+    ancestors = [root, *root.parents]
+    toplevel = next((path for path in ancestors if (path / '.git').exists()), None)
+    if toplevel is None:
+        return ()
+
+    chain = []
+    exclude = IgnoreRules.from_file(toplevel / GIT_INFO_EXCLUDE)
+    if exclude is not None:
+        chain.append(('', _lead(root, toplevel), exclude))
+
+    for directory in reversed(ancestors[1:ancestors.index(toplevel) + 1]):
+        for filename in IGNORE_FILENAMES:
+            rules = IgnoreRules.from_file(directory / filename)
+            if rules is not None:
+                chain.append(('', _lead(root, directory), rules))
+    return tuple(chain)
+
+
+def _lead(root: Path, directory: Path) -> str:
+    """Return the root's path below an ancestor directory, with a trailing slash."""
+    relative = root.relative_to(directory).as_posix()
+    return '' if relative == '.' else relative + '/'
+
+
+def is_ignored(chain: RuleChain, relative_path: str, is_dir: bool) -> bool:
+    """Evaluate a path against a rule chain.
+
+    Deeper ignore files override shallower ones, and within a file the last
+    matching pattern wins.
+
+    Args:
+        chain: Rules applying to the path's directory, outermost first
+        relative_path: ``/``-separated path relative to the scan root
+        is_dir: Whether the path is a directory
+
+    Returns:
+        True if the path is ignored
+    """
+    for base, lead, rules in reversed(chain):
+        subpath = relative_path[len(base) + 1:] if base else relative_path
+        decision = rules.match(lead + subpath, is_dir)
+        if decision is not None:
+            return decision
+    return False
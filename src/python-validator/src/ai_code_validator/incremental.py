@@ -0,0 +1,77 @@
+"""In-memory validation results kept up to date as files change."""
+
+from pathlib import Path
+from typing import Optional
+
+from .config import Config
+from .parallel import ParallelValidator
+from .parser import AnnotationError
+from .reporter import ResultReporter, ValidationResult
+from .scanner import FileScanner
+from .watcher import Changes, PollingWatcher
+
+
+class IncrementalValidator:
+    """Holds per-file errors for a tree and revalidates only changed files.
+
+    The first ``refresh()`` validates the whole tree; later calls re-read
+    only files the watcher reports as added or modified and drop deleted
+    ones, so a report can be produced without touching unchanged files.
+    """
+
+    def __init__(self, config: Config, watcher: Optional[PollingWatcher] = None):
+        """Initialize with an empty index.
+
+        Args:
+            config: Configuration object
+            watcher: Change detector (default: a ``PollingWatcher`` over the
+                configured tree)
+        """
+        self.config = config
+        self.watcher = watcher or PollingWatcher(FileScanner(config))
+        self.validator = ParallelValidator(config)
+        # Errors per scanned file, in discovery order
+        self.errors: dict[Path, list[AnnotationError]] = {}
+
+    def refresh(self) -> Changes:
+        """Pick up changes from the watcher and revalidate affected files.
+
+        Returns:
+            The changes that were applied
+        """
+        return self.apply(self.watcher.poll())
+
+    def apply(self, changes: Changes) -> Changes:
+        """Revalidate added and modified files and forget deleted ones.
+
+        Args:
+            changes: Changes to apply
+
+        Returns:
+            The same changes
+        """
+        for file_path in changes.deleted:
+            self.errors.pop(file_path, None)
+
+        changed = changes.changed
+        readable = set()
+        for file_path, _, errors in self.validator.validate(changed):
+            self.errors[file_path] = errors
+            readable.add(file_path)
+        # Files that can no longer be read are dropped, as a full scan would
+        for file_path in changed:
+            if file_path not in readable:
+                self.errors.pop(file_path, None)
+        return changes
+
+    def result(self, reporter: ResultReporter) -> ValidationResult:
+        """Build a result from the current index.
+
+        Args:
+            reporter: Reporter used to assemble the result
+
+        Returns:
+            Result equivalent to a full scan of the tree's current state
+        """
+        errors = (error for file_errors in self.errors.values() for error in file_errors)
+        return reporter.generate_result(errors, len(self.errors))
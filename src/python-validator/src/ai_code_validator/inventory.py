@@ -0,0 +1,252 @@
+"""SQLite inventory of annotation blocks and errors for compliance queries."""
+
+import sqlite3
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from .cache import _Transaction, rules_fingerprint
+from .config import DEFAULT_CACHE_DIR, Config
+from .parallel import ParallelValidator
+from .scanner import FileScanner
+
+INVENTORY_FILENAME = 'inventory.sqlite3'
+
+BLOCK_COLUMNS = (
+    'path', 'start_line', 'end_line', 'tool_name', 'tool_version', 'date', 'author_id', 'action',
+)
+
+
+def default_inventory_path(repo_path: Path) -> Path:
+    """Return the inventory database used for ``repo_path`` by default."""
+    return Path(repo_path).resolve() / DEFAULT_CACHE_DIR / INVENTORY_FILENAME
+
+
+def normalize_date(value: str) -> Optional[str]:
+    """Convert an ISO 8601 date or timestamp to a sortable UTC timestamp.
+
+    Dates without a time mean midnight and timestamps without an offset are
+    taken as UTC, so ``2025-02-15`` and ``2025-02-15T00:00:00Z`` compare equal.
+
+    Args:
+        value: ISO 8601 string as written in an annotation
+
+    Returns:
+        ``YYYY-MM-DDTHH:MM:SS+00:00`` string, or None if unparseable
+    """
+    try:
+        parsed = datetime.fromisoformat(value.strip().replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).isoformat(timespec='seconds')
+
+
+class AnnotationInventory:
+    """Index of every annotation block and error in a working tree.
+
+    Rows are keyed by repo-relative path, so the database survives the
+    checkout being moved. ``update()`` only re-reads files whose
+    ``(mtime, size)`` changed since the last update; ``blocks()`` and
+    ``errors()`` answer queries from indexed columns without touching the
+    tree.
+    """
+
+    def __init__(self, db_path: Path):
+        """Open (or create) the inventory.
+
+        Args:
+            db_path: SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._setup()
+
+    def _setup(self) -> None:
+        """Create tables and indexes, and drop rows from another rule set."""
+        with _Transaction(self._conn):
+            for statement in (
+                'CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)',
+                '''CREATE TABLE IF NOT EXISTS files (
+                    path TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL
+                )''',
+                '''CREATE TABLE IF NOT EXISTS blocks (
+                    path TEXT NOT NULL,
+                    start_line INTEGER NOT NULL,
+                    end_line INTEGER NOT NULL,
+                    tool_name TEXT NOT NULL,
+                    tool_version TEXT,
+                    date TEXT NOT NULL,
+                    date_utc TEXT,
+                    author_id TEXT NOT NULL,
+                    action TEXT NOT NULL
+                )''',
+                '''CREATE TABLE IF NOT EXISTS errors (
+                    path TEXT NOT NULL,
+                    line_number INTEGER NOT NULL,
+                    message TEXT NOT NULL
+                )''',
+                'CREATE INDEX IF NOT EXISTS blocks_path ON blocks (path)',
+                'CREATE INDEX IF NOT EXISTS blocks_tool_name ON blocks (tool_name)',
+                'CREATE INDEX IF NOT EXISTS blocks_author_id ON blocks (author_id)',
+                'CREATE INDEX IF NOT EXISTS blocks_date ON blocks (date_utc)',
+                'CREATE INDEX IF NOT EXISTS errors_path ON errors (path)',
+            ):
+                self._conn.execute(statement)
+            row = self._conn.execute(
+                "SELECT value FROM meta WHERE key = 'fingerprint'"
+            ).fetchone()
+            fingerprint = rules_fingerprint()
+            if row is None or row[0] != fingerprint:
+                for table in ('files', 'blocks', 'errors'):
+                    self._conn.execute(f'DELETE FROM {table}')
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('fingerprint', ?)",
+                    (fingerprint,),
+                )
+
+    def update(self, config: Config) -> dict:
+        """Bring the inventory up to date with the working tree.
+
+        Args:
+            config: Configuration selecting the tree and files to index
+
+        Returns:
+            Counts of ``files`` in the tree and files ``updated`` and ``removed``
+        """
+        known = {
+            row['path']: (row['mtime_ns'], row['size'])
+            for row in self._conn.execute('SELECT path, mtime_ns, size FROM files')
+        }
+
+        root = config.repo_path
+        seen = set()
+        changed = {}
+        for file_path in FileScanner(config).discover_files():
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            relative = file_path.relative_to(root).as_posix()
+            seen.add(relative)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            if known.get(relative) != signature:
+                changed[file_path] = (relative, signature)
+        removed = [path for path in known if path not in seen]
+
+        with _Transaction(self._conn):
+            for relative in removed + [relative for relative, _ in changed.values()]:
+                self._forget(relative)
+            self._conn.executemany(
+                'INSERT INTO files (path, mtime_ns, size) VALUES (?, ?, ?)',
+                [(relative, *signature) for relative, signature in changed.values()],
+            )
+            for file_path, blocks, errors in ParallelValidator(config).validate(changed):
+                relative = changed[file_path][0]
+                self._conn.executemany(
+                    'INSERT INTO blocks (path, start_line, end_line, tool_name, tool_version, '
+                    'date, date_utc, author_id, action) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                    [
+                        (
+                            relative, block.start_line, block.end_line, block.tool_name,
+                            block.tool_version, block.date, normalize_date(block.date),
+                            block.author_id, block.action,
+                        )
+                        for block in blocks
+                    ],
+                )
+                self._conn.executemany(
+                    'INSERT INTO errors (path, line_number, message) VALUES (?, ?, ?)',
+                    [(relative, error.line_number, error.message) for error in errors],
+                )
+
+        return {'files': len(seen), 'updated': len(changed), 'removed': len(removed)}
+
+    def _forget(self, relative: str) -> None:
+        for table in ('files', 'blocks', 'errors'):
+            self._conn.execute(f'DELETE FROM {table} WHERE path = ?', (relative,))
+
+    def blocks(
+        self,
+        tool: Optional[str] = None,
+        author: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        path_prefix: Optional[str] = None,
+    ) -> list[dict]:
+        """Find valid annotation blocks.
+
+        Args:
+            tool: Exact TOOL_NAME
+            author: Exact AUTHOR_ID
+            since: Only blocks dated at or after this ISO 8601 date/time
+            until: Only blocks dated before this ISO 8601 date/time
+            path_prefix: Only files under this repo-relative directory
+
+        Returns:
+            Block records ordered by path and line
+
+        Raises:
+            ValueError: If ``since`` or ``until`` is not ISO 8601
+        """
+        clauses = []
+        params = []
+        if tool is not None:
+            clauses.append('tool_name = ?')
+            params.append(tool)
+        if author is not None:
+            clauses.append('author_id = ?')
+            params.append(author)
+        for value, operator in ((since, '>='), (until, '<')):
+            if value is not None:
+                normalized = normalize_date(value)
+                if normalized is None:
+                    raise ValueError(f'Invalid date: {value} (expected ISO 8601)')
+                clauses.append(f'date_utc {operator} ?')
+                params.append(normalized)
+        self._filter_path(path_prefix, clauses, params)
+
+        where = f' WHERE {" AND ".join(clauses)}' if clauses else ''
+        rows = self._conn.execute(
+            f'SELECT {", ".join(BLOCK_COLUMNS)} FROM blocks{where} ORDER BY path, start_line',
+            params,
+        )
+        return [dict(row) for row in rows]
+
+    def errors(self, path_prefix: Optional[str] = None) -> list[dict]:
+        """Find validation errors.
+
+        Args:
+            path_prefix: Only files under this repo-relative directory
+
+        Returns:
+            Error records ordered by path and line
+        """
+        clauses = []
+        params = []
+        self._filter_path(path_prefix, clauses, params)
+        where = f' WHERE {" AND ".join(clauses)}' if clauses else ''
+        rows = self._conn.execute(
+            f'SELECT path, line_number, message FROM errors{where} ORDER BY path, line_number',
+            params,
+        )
+        return [dict(row) for row in rows]
+
+    @staticmethod
+    def _filter_path(path_prefix: Optional[str], clauses: list, params: list) -> None:
+        prefix = (path_prefix or '').strip('/')
+        if prefix:
+            # Range scan on the path index: prefix/ <= path < prefix0 ('0' follows '/')
+            clauses.append('(path = ? OR (path >= ? AND path < ?))')
+            params.extend([prefix, prefix + '/', prefix + '0'])
+
+    def close(self) -> None:
+        """Close the database."""
+        self._conn.close()
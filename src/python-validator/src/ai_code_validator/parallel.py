@@ -0,0 +1,490 @@
+"""Process-pool execution mode for reading and validating files."""
+
+import sys
+import time
+from collections import deque
+from dataclasses import replace
+from itertools import chain, islice, takewhile
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Generator, Iterable, Optional
+
+from .budget import peak_rss_bytes
+from .config import Config
+from .coverage import CoverageMetrics
+from .parser import (
+    AnnotationBlock,
+    AnnotationError,
+    AnnotationParser,
+    ErrorCode,
+    OffsetAnnotationParser,
+)
+from .reader import FileBuffer
+from .scanner import FileScanner
+from .stats import RunStats, maybe_phase
+
+if TYPE_CHECKING:
+    from multiprocessing.synchronize import Event
+
+    from .budget import RunBudget
+    from .cache import ValidationCache
+
+FileResult = tuple[Path, list[AnnotationBlock], list[AnnotationError]]
+
+DEFAULT_CHUNK_SIZE = 256
+
+# Seconds between run budget checks while waiting on a worker's chunk
+BUDGET_POLL_INTERVAL = 0.1
+
+# Results of one object: (blocks, errors, line count or None), or None if the
+# object could not be decoded
+ObjectResult = Optional[tuple[list[AnnotationBlock], list[AnnotationError], Optional[int]]]
+
+# Per-process state, set up once by the pool initializer
+_worker_scanner: Optional[FileScanner] = None
+_worker_parser: Optional[AnnotationParser] = None
+_worker_cache: Optional['ValidationCache'] = None
+
+
+_worker_collect_stats = False
+_worker_coverage_depth: Optional[int] = None
+_worker_stop: Optional['Event'] = None
+
+
+def _init_worker(
+    config: Config,
+    collect_stats: bool = False,
+    coverage_depth: Optional[int] = None,
+    stop: Optional['Event'] = None,
+) -> None:
+    """Create the scanner, parser and cache used by a worker process."""
+    global _worker_scanner, _worker_parser, _worker_cache, _worker_collect_stats
+    global _worker_coverage_depth, _worker_stop
+    _worker_scanner = FileScanner(config)
+    _worker_parser = OffsetAnnotationParser()
+    _worker_collect_stats = collect_stats
+    _worker_coverage_depth = coverage_depth
+    _worker_stop = stop
+    if config.cache_dir is not None:
+        from .cache import ValidationCache
+        _worker_cache = ValidationCache(config.cache_dir)
+
+
+def _validate_chunk(
+    paths: list[Path],
+) -> tuple[list[FileResult], int, Optional[dict], Optional[dict], list[dict], Optional[int]]:
+    """Read and validate a chunk of files inside a worker process.
+
+    Once the parent sets the stop event, the rest of the chunk is skipped;
+    its results are discarded by then.
+
+    Returns:
+        Tuple of (results, number of files that took the marker fast path,
+        statistics and coverage metrics for the chunk, each None when not
+        collected, warnings for oversized files, peak resident set size of
+        the worker in bytes or None if unknown)
+    """
+    _worker_parser.fast_path_files = 0
+    _worker_scanner.warnings = []
+    if _worker_collect_stats:
+        _worker_scanner.stats = RunStats()
+    coverage = None
+    if _worker_coverage_depth is not None:
+        coverage = CoverageMetrics(_worker_scanner.config.repo_path, _worker_coverage_depth)
+    if _worker_stop is not None:
+        paths = takewhile(lambda _: not _worker_stop.is_set(), paths)
+    results = list(
+        _validate_paths(_worker_scanner, _worker_parser, paths, _worker_cache, coverage)
+    )
+    if _worker_cache is not None:
+        _worker_cache.flush()
+    stats = _worker_scanner.stats.to_dict() if _worker_collect_stats else None
+    coverage = coverage.to_dict() if coverage is not None else None
+    return (
+        results,
+        _worker_parser.fast_path_files,
+        stats,
+        coverage,
+        _worker_scanner.warnings,
+        peak_rss_bytes(),
+    )
+
+
+def _validate_paths(
+    scanner: FileScanner,
+    parser: AnnotationParser,
+    paths: Iterable[Path],
+    cache: Optional['ValidationCache'] = None,
+    coverage: Optional[CoverageMetrics] = None,
+) -> Generator[FileResult, None, None]:
+    """Read and validate files, skipping those that cannot be read."""
+    stats = scanner.stats
+    for file_path in paths:
+        if stats is not None:
+            started = time.perf_counter()
+        if cache is None:
+            buffer = scanner.read_buffer(file_path)
+            if buffer is None:
+                continue
+            try:
+                result = _validate_data(scanner, parser, file_path, buffer, coverage)
+            finally:
+                buffer.close()
+        else:
+            result = _validate_cached(scanner, parser, cache, file_path, coverage)
+        if stats is not None:
+            stats.record_file(file_path, time.perf_counter() - started)
+        if result is not None:
+            yield file_path, *result
+
+
+def _validate_data(
+    scanner: FileScanner,
+    parser: AnnotationParser,
+    file_path: Path,
+    buffer: FileBuffer,
+    coverage: Optional[CoverageMetrics] = None,
+    line_count: Optional[int] = None,
+) -> Optional[tuple[list[AnnotationBlock], list[AnnotationError]]]:
+    """Validate a raw file buffer, decoding only the region around markers.
+
+    With ``coverage``, the file is also added to those metrics;
+    ``line_count`` saves recounting lines the caller already counted.
+    Files over ``max_file_size`` are skipped (returning None) or validated
+    up to the limit, as ``FileScanner.limit_buffer`` decides.
+    """
+    if scanner.config.max_file_size is not None:
+        buffer = scanner.limit_buffer(file_path, buffer)
+        if buffer is None:
+            return None
+        if buffer.truncated:
+            line_count = None
+    with maybe_phase(scanner.stats, 'parsing'):
+        region = parser.annotation_region(buffer)
+        if region is None:
+            result = [], []
+        else:
+            start, end = region
+            content = scanner.decode(file_path, buffer.region(start, end))
+            if content is None:
+                return None
+            result = parser.validate_file(
+                file_path, content, line_offset=buffer.count_lines(start)
+            )
+            if buffer.truncated:
+                # The END marker of a block open at the cut may lie past it
+                result = result[0], [
+                    error for error in result[1] if error.code != ErrorCode.UNTERMINATED_BLOCK
+                ]
+        if coverage is not None:
+            if line_count is None:
+                line_count = buffer.total_lines()
+            coverage.add_file(file_path, line_count, result[0])
+        return result
+
+
+def _validate_cached(
+    scanner: FileScanner,
+    parser: AnnotationParser,
+    cache: 'ValidationCache',
+    file_path: Path,
+    coverage: Optional[CoverageMetrics] = None,
+) -> Optional[tuple[list[AnnotationBlock], list[AnnotationError]]]:
+    """Validate a file through the cache, reading it only on a stat miss.
+
+    Entries stored without a line count cannot feed coverage, so while
+    ``coverage`` is collected they are misses; lines are only counted (and
+    stored) when it is. Files over ``max_file_size`` bypass the cache: they
+    are skipped without being read, or their prefix is validated.
+    """
+    from .cache import content_digest
+
+    try:
+        stat = file_path.stat()
+    except OSError as e:
+        # Deleted or made unreadable since discovery: skip like an unreadable file
+        if scanner.stats is not None:
+            scanner.stats.count('read_errors')
+        if scanner.config.verbose:
+            print(f"Warning: Could not read file {file_path}: {e}", file=sys.stderr)
+        return None
+    limit = scanner.config.max_file_size
+    oversized = limit is not None and stat.st_size > limit
+    if oversized and scanner.config.oversized == 'skip':
+        scanner.skip_oversized(file_path)
+        return None
+
+    need_line_count = coverage is not None
+    if not oversized:
+        result = _cache_hit(
+            scanner, coverage, file_path, cache.lookup_stat(file_path, stat, need_line_count)
+        )
+        if result is not None:
+            return result
+
+    buffer = scanner.read_buffer(file_path)
+    if buffer is None:
+        return None
+    try:
+        if not oversized:
+            with buffer.view() as view:
+                digest = content_digest(view)
+            result = _cache_hit(
+                scanner,
+                coverage,
+                file_path,
+                cache.lookup_digest(file_path, stat, digest, need_line_count),
+            )
+            if result is not None:
+                return result
+
+        line_count = buffer.total_lines() if coverage is not None else None
+        result = _validate_data(scanner, parser, file_path, buffer, coverage, line_count)
+    finally:
+        buffer.close()
+    if result is not None and not oversized and not buffer.truncated:
+        cache.store(file_path, stat, digest, *result, line_count=line_count)
+    return result
+
+
+def _cache_hit(
+    scanner: FileScanner, coverage: Optional[CoverageMetrics], file_path: Path, cached
+) -> Optional[tuple[list[AnnotationBlock], list[AnnotationError]]]:
+    """Accept a cache entry, feeding coverage from its stored line count."""
+    if cached is None:
+        return None
+    blocks, errors, line_count = cached
+    if coverage is not None:
+        coverage.add_file(file_path, line_count, blocks)
+    if scanner.stats is not None:
+        scanner.stats.count('cache_hits')
+    return blocks, errors
+
+
+_UNSEEN = object()
+
+
+class ParallelValidator:
+    """Spreads file reading and validation across a process pool.
+
+    Files are grouped into fixed-size chunks in discovery order and results
+    are yielded in that same order, so reports are identical to a serial run.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        stats: Optional[RunStats] = None,
+        coverage: Optional[CoverageMetrics] = None,
+        budget: Optional['RunBudget'] = None,
+    ):
+        """Initialize parallel validator.
+
+        Args:
+            config: Configuration object (``config.jobs`` sets the pool size)
+            chunk_size: Number of files handed to a worker at a time
+            stats: Optional statistics collector; worker statistics are
+                merged into it
+            coverage: Optional coverage metrics; worker metrics are merged
+                into it
+            budget: Optional run budget; it is checked while waiting on
+                workers, which report their peak memory to it
+        """
+        self.config = config
+        self.chunk_size = max(1, chunk_size)
+        self.stats = stats
+        self.coverage = coverage
+        self.budget = budget
+        # Files whose buffer had no START marker and skipped parsing
+        self.fast_path_files = 0
+        # Warning records ({'file', 'message'}) for files over max_file_size
+        self.warnings: list[dict] = []
+
+    def validate(self, paths: Iterable[Path]) -> Generator[FileResult, None, None]:
+        """Validate files and yield (file_path, blocks, errors) in input order.
+
+        Trees that fit in a single chunk are validated in-process, since
+        starting a pool would cost more than it saves. With a run budget,
+        waiting on a worker's chunk ends once the budget is exceeded, so the
+        results stop short instead of after the chunk.
+
+        Args:
+            paths: File paths to validate, in the order results are wanted
+
+        Yields:
+            Tuples of (file_path, valid_blocks, errors) for readable files
+        """
+        paths = iter(paths)
+        first_chunk = list(islice(paths, self.chunk_size))
+        second_chunk = list(islice(paths, self.chunk_size))
+
+        if self.config.jobs <= 1 or not second_chunk:
+            cache = None
+            if self.config.cache_dir is not None:
+                from .cache import ValidationCache
+                cache = ValidationCache(self.config.cache_dir)
+            parser = OffsetAnnotationParser()
+            try:
+                yield from _validate_paths(
+                    self._scanner(),
+                    parser,
+                    chain(first_chunk, second_chunk, paths),
+                    cache,
+                    self.coverage,
+                )
+            finally:
+                self.fast_path_files += parser.fast_path_files
+                if cache is not None:
+                    cache.close()
+            return
+
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Keep a bounded window of chunks in flight so discovery never runs
+        # far ahead of validation
+        max_pending = self.config.jobs * 2
+        context = multiprocessing.get_context()
+        stop = context.Event()
+        executor = ProcessPoolExecutor(
+            max_workers=self.config.jobs,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(
+                self.config,
+                self.stats is not None,
+                self.coverage.directory_depth if self.coverage is not None else None,
+                stop,
+            ),
+        )
+        try:
+            pending = deque()
+            pending.append(executor.submit(_validate_chunk, first_chunk))
+            pending.append(executor.submit(_validate_chunk, second_chunk))
+
+            while pending:
+                while len(pending) < max_pending:
+                    chunk = list(islice(paths, self.chunk_size))
+                    if not chunk:
+                        break
+                    pending.append(executor.submit(_validate_chunk, chunk))
+
+                chunk_result = self._chunk_result(pending.popleft())
+                if chunk_result is None:
+                    return
+                results, fast_path_files, stats, coverage, warnings, peak_rss = chunk_result
+                if self.budget is not None:
+                    self.budget.note_worker_rss(peak_rss)
+                self.fast_path_files += fast_path_files
+                self.warnings.extend(warnings)
+                if stats is not None:
+                    self.stats.merge(stats)
+                if coverage is not None:
+                    self.coverage.merge(coverage)
+                yield from results
+        finally:
+            # A consumer that stops early (closing this generator) should not
+            # wait for chunks that were queued but not started, nor for the
+            # rest of those being validated
+            stop.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _chunk_result(self, future):
+        """Wait for a worker's chunk, or return None once the run budget is exceeded."""
+        from concurrent.futures import TimeoutError
+
+        if self.budget is None:
+            return future.result()
+        while True:
+            try:
+                return future.result(timeout=BUDGET_POLL_INTERVAL)
+            except TimeoutError:
+                if self.budget.exceeded() is not None:
+                    return None
+
+    def validate_contents(
+        self, items: Iterable[tuple[Path, bytes]]
+    ) -> Generator[FileResult, None, None]:
+        """Validate file contents that were already read, in this process.
+
+        Used for sources that do not live in the working tree, such as
+        staged blobs.
+
+        Args:
+            items: Tuples of (file_path, raw_bytes)
+
+        Yields:
+            Tuples of (file_path, valid_blocks, errors) for decodable files
+        """
+        scanner = self._scanner()
+        parser = OffsetAnnotationParser()
+        try:
+            for file_path, data in items:
+                result = _validate_data(
+                    scanner, parser, file_path, FileBuffer(data), self.coverage
+                )
+                if result is not None:
+                    yield file_path, *result
+        finally:
+            self.fast_path_files += parser.fast_path_files
+
+    def validate_objects(
+        self,
+        items: Iterable[tuple[Path, str]],
+        read_object: Callable[[str], Optional[bytes]],
+        memo: Optional[dict[str, ObjectResult]] = None,
+    ) -> Generator[FileResult, None, None]:
+        """Validate content-addressed objects, each distinct object only once.
+
+        Files sharing an object id (copies within a tree, or the same file
+        across commits) reuse the first result with their own path filled in.
+
+        Args:
+            items: Tuples of (file_path, object_id)
+            read_object: Returns an object's bytes, or None if it is missing
+            memo: Results by object id; pass the same dict to several calls
+                to skip objects seen in earlier ones
+
+        Yields:
+            Tuples of (file_path, valid_blocks, errors) for decodable objects
+        """
+        memo = {} if memo is None else memo
+        scanner = self._scanner()
+        parser = OffsetAnnotationParser()
+        try:
+            for file_path, object_id in items:
+                cached = memo.get(object_id, _UNSEEN)
+                # Entries from runs without coverage have no line count
+                if cached is _UNSEEN or (
+                    cached is not None and cached[2] is None and self.coverage is not None
+                ):
+                    with maybe_phase(self.stats, 'reading'):
+                        data = read_object(object_id)
+                    if data is None:
+                        continue
+                    if self.stats is not None:
+                        self.stats.count('bytes_read', len(data))
+                    buffer = FileBuffer(data)
+                    line_count = buffer.total_lines() if self.coverage is not None else None
+                    result = _validate_data(
+                        scanner, parser, file_path, buffer, self.coverage, line_count
+                    )
+                    memo[object_id] = None if result is None else (*result, line_count)
+                    if result is not None:
+                        yield file_path, *result
+                    continue
+
+                if cached is None:
+                    continue
+                blocks, errors, line_count = cached
+                blocks = [replace(block, file_path=file_path) for block in blocks]
+                errors = [replace(error, file_path=file_path) for error in errors]
+                if self.coverage is not None:
+                    self.coverage.add_file(file_path, line_count, blocks)
+                yield file_path, blocks, errors
+        finally:
+            self.fast_path_files += parser.fast_path_files
+
+    def _scanner(self) -> FileScanner:
+        """Return a scanner for in-process validation reporting to this run's collectors."""
+        return FileScanner(self.config, self.stats, self.warnings, self.budget)
@@ -2,21 +2,70 @@
 
 import re
 from dataclasses import dataclass
-from datetime import datetime
+from enum import IntEnum
 from pathlib import Path
 from typing import Optional
 
 
-@dataclass
+class _LazyPattern:
+    """Class attribute holding a regex that is compiled on first use.
+
+    Keeps ``re.compile`` out of import time for runs (such as a pre-commit
+    hook on files without markers) that never parse a line.
+    """
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self._compiled = None
+
+    def __get__(self, instance, owner) -> re.Pattern:
+        if self._compiled is None:
+            self._compiled = re.compile(self.pattern)
+        return self._compiled
+
+
+class ErrorCode(IntEnum):
+    """Kinds of annotation errors; see ``ERROR_MESSAGES`` for their text."""
+
+    UNTERMINATED_BLOCK = 1
+    MISSING_FIELD = 2
+    INVALID_DATE = 3
+    INVALID_ACTION = 4
+    EMPTY_AUTHOR_ID = 5
+
+
+# Message templates, formatted with an error's arguments when it is reported
+ERROR_MESSAGES = {
+    ErrorCode.UNTERMINATED_BLOCK:
+        'START_AI_GENERATED_CODE marker found but no matching END_AI_GENERATED_CODE',
+    ErrorCode.MISSING_FIELD: 'Missing or empty required field: {0}',
+    ErrorCode.INVALID_DATE: 'Invalid DATE format: {0} (expected ISO 8601)',
+    ErrorCode.INVALID_ACTION: 'Invalid ACTION value: {0} (expected GENERATED)',
+    ErrorCode.EMPTY_AUTHOR_ID: 'AUTHOR_ID cannot be empty',
+}
+
+
+@dataclass(frozen=True, slots=True)
 class AnnotationError:
-    """Represents a validation error in an annotation block."""
+    """Represents a validation error in an annotation block.
+
+    The error keeps its code and the values that vary between occurrences;
+    ``message`` renders the text on demand, so no string is built per error
+    until it is reported.
+    """
 
     file_path: Path
     line_number: int
-    message: str
+    code: ErrorCode
+    args: tuple[str, ...] = ()
+
+    @property
+    def message(self) -> str:
+        """Human-readable error message."""
+        return ERROR_MESSAGES[self.code].format(*self.args)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AnnotationBlock:
     """Represents a valid AI-generated code annotation block."""
 
@@ -35,24 +84,90 @@ class AnnotationParser:
 
     START_MARKER = 'START_AI_GENERATED_CODE'
     END_MARKER = 'END_AI_GENERATED_CODE'
+    START_MARKER_BYTES = START_MARKER.encode('ascii')
+    END_MARKER_BYTES = END_MARKER.encode('ascii')
 
     # Metadata field patterns
-    METADATA_PATTERN = re.compile(r'^\s*(?:#|//|--|\*)??\s*(\w+):\s*(.+?)\s*$')
+    METADATA_PATTERN = _LazyPattern(r'^\s*(?:#|//|--|\*)??\s*(\w+):\s*(.+?)\s*$')
 
     def __init__(self):
         """Initialize parser."""
-        pass
+        # Files that skipped line-by-line parsing because they have no marker
+        self.fast_path_files = 0
+
+    def may_contain_annotations(self, data: bytes) -> bool:
+        """Cheap prefilter on a raw file buffer.
+
+        Only a START marker can produce blocks or errors, so a buffer without
+        one needs no decoding or parsing. Files rejected here are counted in
+        ``fast_path_files``.
+
+        Args:
+            data: Raw file bytes
+
+        Returns:
+            True if the buffer contains a START marker
+        """
+        if data.find(self.START_MARKER_BYTES) == -1:
+            self.fast_path_files += 1
+            return False
+        return True
+
+    def annotation_region(self, buffer) -> Optional[tuple[int, int]]:
+        """Locate the byte range of a buffer that can affect validation.
 
-    def validate_file(self, file_path: Path, content: str) -> tuple[list[AnnotationBlock], list[AnnotationError]]:
+        The range starts at the beginning of the line holding the first START
+        marker and ends after the line holding the last END marker, unless a
+        START marker follows it, in which case it runs to the end of the
+        buffer. Bytes outside the range never produce blocks or errors, so
+        only the range needs decoding.
+
+        Args:
+            buffer: Raw file bytes (``bytes`` or ``FileBuffer``)
+
+        Returns:
+            Tuple of (start, end) byte offsets, or None if there is no marker
+        """
+        first_start = buffer.find(self.START_MARKER_BYTES)
+        if first_start == -1:
+            self.fast_path_files += 1
+            return None
+
+        start = max(
+            buffer.rfind(b'\n', 0, first_start), buffer.rfind(b'\r', 0, first_start)
+        ) + 1
+
+        end = len(buffer)
+        last_end = buffer.rfind(self.END_MARKER_BYTES)
+        if last_end > buffer.rfind(self.START_MARKER_BYTES):
+            line_breaks = [
+                offset
+                for offset in (buffer.find(b'\n', last_end), buffer.find(b'\r', last_end))
+                if offset != -1
+            ]
+            if line_breaks:
+                end = min(line_breaks)
+
+        return start, end
+
+    def validate_file(
+        self, file_path: Path, content: str, line_offset: int = 0
+    ) -> tuple[list[AnnotationBlock], list[AnnotationError]]:
         """Validate all annotation blocks in a file.
 
         Args:
             file_path: Path to file being validated
             content: File content
+            line_offset: Number of lines preceding ``content`` in the file,
+                when only a region of the file is passed
 
         Returns:
             Tuple of (valid_blocks, errors)
         """
+        if self.START_MARKER not in content:
+            self.fast_path_files += 1
+            return [], []
+
         blocks = []
         errors = []
         lines = content.split('\n')
@@ -63,7 +178,7 @@ class AnnotationParser:
 
             # Look for start marker
             if self.START_MARKER in line:
-                start_line = i + 1  # Line numbers are 1-indexed
+                start_line = i + 1 + line_offset  # Line numbers are 1-indexed
                 # Find end marker
                 end_line = None
                 metadata = {}
@@ -73,7 +188,7 @@ class AnnotationParser:
                     content_line = lines[j]
 
                     if self.END_MARKER in content_line:
-                        end_line = j + 1
+                        end_line = j + 1 + line_offset
                         break
 
                     # Try to parse metadata lines
@@ -89,33 +204,54 @@ class AnnotationParser:
                     errors.append(AnnotationError(
                         file_path=file_path,
                         line_number=start_line,
-                        message='START_AI_GENERATED_CODE marker found but no matching END_AI_GENERATED_CODE',
+                        code=ErrorCode.UNTERMINATED_BLOCK,
                     ))
                 else:
-                    block_errors = self._validate_block(
-                        file_path, start_line, end_line, metadata
+                    self._close_block(
+                        file_path, start_line, end_line, metadata, blocks, errors
                     )
-                    if block_errors:
-                        errors.extend(block_errors)
-                    else:
-                        block = AnnotationBlock(
-                            file_path=file_path,
-                            start_line=start_line,
-                            end_line=end_line,
-                            tool_name=metadata.get('TOOL_NAME', ''),
-                            tool_version=metadata.get('TOOL_VERSION'),
-                            date=metadata.get('DATE', ''),
-                            author_id=metadata.get('AUTHOR_ID', ''),
-                            action=metadata.get('ACTION', ''),
-                        )
-                        blocks.append(block)
-
-                i = end_line if end_line else j
+
+                i = j + 1 if end_line else j
             else:
                 i += 1
 
         return blocks, errors
 
+    def _close_block(
+        self,
+        file_path: Path,
+        start_line: int,
+        end_line: int,
+        metadata: dict,
+        blocks: list[AnnotationBlock],
+        errors: list[AnnotationError],
+    ) -> None:
+        """Validate a terminated block and record it as valid or erroneous.
+
+        Args:
+            file_path: Path to file
+            start_line: Line number of START marker
+            end_line: Line number of END marker
+            metadata: Extracted metadata dictionary
+            blocks: Valid blocks found so far (appended to)
+            errors: Errors found so far (appended to)
+        """
+        block_errors = self._validate_block(file_path, start_line, end_line, metadata)
+        if block_errors:
+            errors.extend(block_errors)
+            return
+
+        blocks.append(AnnotationBlock(
+            file_path=file_path,
+            start_line=start_line,
+            end_line=end_line,
+            tool_name=metadata.get('TOOL_NAME', ''),
+            tool_version=metadata.get('TOOL_VERSION'),
+            date=metadata.get('DATE', ''),
+            author_id=metadata.get('AUTHOR_ID', ''),
+            action=metadata.get('ACTION', ''),
+        ))
+
     def _validate_block(
         self, file_path: Path, start_line: int, end_line: int, metadata: dict
     ) -> list[AnnotationError]:
@@ -139,7 +275,8 @@ class AnnotationParser:
                 errors.append(AnnotationError(
                     file_path=file_path,
                     line_number=start_line,
-                    message=f'Missing or empty required field: {field}',
+                    code=ErrorCode.MISSING_FIELD,
+                    args=(field,),
                 ))
 
         # Validate DATE format (ISO 8601)
@@ -148,7 +285,8 @@ class AnnotationParser:
                 errors.append(AnnotationError(
                     file_path=file_path,
                     line_number=start_line,
-                    message=f'Invalid DATE format: {metadata["DATE"]} (expected ISO 8601)',
+                    code=ErrorCode.INVALID_DATE,
+                    args=(metadata['DATE'],),
                 ))
 
         # Validate ACTION field
@@ -157,7 +295,8 @@ class AnnotationParser:
                 errors.append(AnnotationError(
                     file_path=file_path,
                     line_number=start_line,
-                    message=f'Invalid ACTION value: {metadata["ACTION"]} (expected GENERATED)',
+                    code=ErrorCode.INVALID_ACTION,
+                    args=(metadata['ACTION'],),
                 ))
 
         # Validate AUTHOR_ID is not empty
@@ -166,7 +305,7 @@ class AnnotationParser:
                 errors.append(AnnotationError(
                     file_path=file_path,
                     line_number=start_line,
-                    message='AUTHOR_ID cannot be empty',
+                    code=ErrorCode.EMPTY_AUTHOR_ID,
                 ))
 
         return errors
@@ -181,9 +320,99 @@ class AnnotationParser:
         Returns:
             True if valid ISO 8601 format
         """
+        from datetime import datetime
+
         try:
             # Try parsing common ISO 8601 formats
             datetime.fromisoformat(date_str.replace('Z', '+00:00'))
             return True
         except ValueError:
             return False
+
+
+class OffsetAnnotationParser(AnnotationParser):
+    """Single-pass annotation parser working on character offsets.
+
+    Instead of splitting the file into a list of lines, one compiled
+    alternation regex finds every START/END marker and metadata key in the
+    buffer. Only the lines holding those tokens are sliced out and examined,
+    and line numbers are computed incrementally from newline offsets. Lines
+    without a token can never set a metadata field the rules read, so the
+    results are identical to ``AnnotationParser``.
+    """
+
+    # Metadata keys read by the validation rules
+    METADATA_FIELDS = ('TOOL_NAME', 'TOOL_VERSION', 'DATE', 'AUTHOR_ID', 'ACTION')
+
+    TOKEN_PATTERN = _LazyPattern('|'.join(
+        re.escape(token)
+        for token in (AnnotationParser.START_MARKER, AnnotationParser.END_MARKER, *METADATA_FIELDS)
+    ))
+
+    def validate_file(
+        self, file_path: Path, content: str, line_offset: int = 0
+    ) -> tuple[list[AnnotationBlock], list[AnnotationError]]:
+        """Validate all annotation blocks in a file.
+
+        Args:
+            file_path: Path to file being validated
+            content: File content
+            line_offset: Number of lines preceding ``content`` in the file,
+                when only a region of the file is passed
+
+        Returns:
+            Tuple of (valid_blocks, errors)
+        """
+        if self.START_MARKER not in content:
+            self.fast_path_files += 1
+            return [], []
+
+        blocks = []
+        errors = []
+
+        # Line number of the line starting at offset `counted`
+        line_number = line_offset + 1
+        counted = 0
+        line_end = -1
+
+        block_start = None
+        metadata = {}
+
+        for match in self.TOKEN_PATTERN.finditer(content):
+            position = match.start()
+            if position < line_end:
+                # Another token on a line that was already handled
+                continue
+
+            line_start = content.rfind('\n', 0, position) + 1
+            line_end = content.find('\n', position)
+            if line_end == -1:
+                line_end = len(content)
+
+            line_number += content.count('\n', counted, line_start)
+            counted = line_start
+            line = content[line_start:line_end]
+
+            if block_start is None:
+                if self.START_MARKER in line:
+                    block_start = line_number
+                    metadata = {}
+            elif self.END_MARKER in line:
+                self._close_block(
+                    file_path, block_start, line_number, metadata, blocks, errors
+                )
+                block_start = None
+            else:
+                metadata_match = self.METADATA_PATTERN.match(line)
+                if metadata_match:
+                    key, value = metadata_match.groups()
+                    metadata[key] = value.strip()
+
+        if block_start is not None:
+            errors.append(AnnotationError(
+                file_path=file_path,
+                line_number=block_start,
+                code=ErrorCode.UNTERMINATED_BLOCK,
+            ))
+
+        return blocks, errors
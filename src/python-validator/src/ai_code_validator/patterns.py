@@ -0,0 +1,75 @@
+"""Compiled matcher for file inclusion patterns."""
+
+import re
+
+from .ignore import glob_to_regex
+
+GLOB_CHARS = '*?['
+
+
+class FilePatternMatcher:
+    """Matches repository-relative paths against include patterns.
+
+    Patterns are split once into the cheapest structure that can answer
+    them:
+
+    - ``*.ext`` patterns become a frozenset of suffixes
+    - plain names (``Makefile``) become a frozenset of exact names
+    - all other globs are combined into one compiled regex over the
+      ``/``-separated relative path. Globs without a ``/`` match the file
+      name at any depth; globs with a ``/`` are relative to the repository
+      root, and ``**`` matches any number of directories.
+    """
+
+    def __init__(self, patterns: list[str]):
+        """Compile include patterns.
+
+        Args:
+            patterns: Patterns such as ``*.py``, ``Dockerfile``,
+                ``test_*.py`` or ``src/**/*.ts``
+        """
+        self.match_all = False
+        suffixes = []
+        names = []
+        globs = []
+
+        for pattern in patterns:
+            if pattern in ('*', '**'):
+                self.match_all = True
+            elif pattern.startswith('*.') and not any(c in pattern[2:] for c in GLOB_CHARS + '/'):
+                suffixes.append(pattern[1:])
+            elif not any(c in pattern for c in GLOB_CHARS + '/'):
+                names.append(pattern)
+            elif '/' in pattern:
+                globs.append(glob_to_regex(pattern.lstrip('/')))
+            else:
+                globs.append('(?:.*/)?' + glob_to_regex(pattern))
+
+        self.suffixes = frozenset(suffixes)
+        self.names = frozenset(names)
+        self.glob = re.compile('|'.join(globs), re.DOTALL) if globs else None
+
+    def matches(self, relative_path: str) -> bool:
+        """Check whether a file matches any pattern.
+
+        Args:
+            relative_path: ``/``-separated path relative to the repository root
+
+        Returns:
+            True if the file should be scanned
+        """
+        if self.match_all:
+            return True
+
+        name = relative_path.rpartition('/')[2]
+        if name in self.names:
+            return True
+
+        if self.suffixes:
+            dot = name.find('.')
+            while dot != -1:
+                if name[dot:] in self.suffixes:
+                    return True
+                dot = name.find('.', dot + 1)
+
+        return self.glob is not None and self.glob.fullmatch(relative_path) is not None
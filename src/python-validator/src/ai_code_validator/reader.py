@@ -0,0 +1,139 @@
+"""Byte-level file reading with a reusable buffer and mmap for large files."""
+
+import mmap
+import os
+from pathlib import Path
+from typing import Union
+
+# Files at least this large are memory-mapped instead of copied into memory
+DEFAULT_MMAP_THRESHOLD = 1024 * 1024
+
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+# Newlines are counted in slices of this size to keep copies bounded
+COUNT_CHUNK_SIZE = 1024 * 1024
+
+
+class FileBuffer:
+    """Read-only view over the bytes of one file.
+
+    Backed by ``bytes``, a slice of a reusable ``bytearray`` or an ``mmap``.
+    A buffer handed out by ``FileReader`` is only valid until the next read.
+    """
+
+    def __init__(self, data: Union[bytes, bytearray, mmap.mmap], length: int | None = None):
+        """Wrap file data.
+
+        Args:
+            data: Underlying storage
+            length: Number of valid bytes at the start of ``data``
+        """
+        self._data = data
+        self.length = len(data) if length is None else length
+        # Set when ``length`` was cut back to a prefix of the file
+        self.truncated = False
+
+    def __len__(self) -> int:
+        return self.length
+
+    def find(self, sub: bytes, start: int = 0, end: int | None = None) -> int:
+        """Return the lowest offset of ``sub`` in ``[start, end)``, or -1."""
+        return self._data.find(sub, start, self.length if end is None else end)
+
+    def rfind(self, sub: bytes, start: int = 0, end: int | None = None) -> int:
+        """Return the highest offset of ``sub`` in ``[start, end)``, or -1."""
+        return self._data.rfind(sub, start, self.length if end is None else end)
+
+    def region(self, start: int, end: int) -> bytes:
+        """Copy out the bytes in ``[start, end)``."""
+        return bytes(self._data[start:min(end, self.length)])
+
+    def view(self) -> memoryview:
+        """Return a zero-copy view of the valid bytes (release it after use)."""
+        return memoryview(self._data)[:self.length]
+
+    def count_lines(self, end: int) -> int:
+        """Count line breaks before ``end`` using universal-newline rules.
+
+        ``\\n``, ``\\r\\n`` and a lone ``\\r`` each count as one line break, as
+        they do for ``Path.read_text``.
+
+        Args:
+            end: Offset to count up to
+
+        Returns:
+            Number of complete lines before ``end``
+        """
+        count = 0
+        previous_cr = False
+        for chunk_start in range(0, end, COUNT_CHUNK_SIZE):
+            chunk = self._data[chunk_start:min(chunk_start + COUNT_CHUNK_SIZE, end)]
+            count += chunk.count(b'\n') + chunk.count(b'\r') - chunk.count(b'\r\n')
+            # A \r\n pair split across chunks was counted twice
+            if previous_cr and chunk.startswith(b'\n'):
+                count -= 1
+            previous_cr = chunk.endswith(b'\r')
+        return count
+
+    def total_lines(self) -> int:
+        """Count lines the way ``str.splitlines`` would (a final unterminated line counts)."""
+        if not self.length:
+            return 0
+        unterminated = self._data[self.length - 1] not in (0x0A, 0x0D)
+        return self.count_lines(self.length) + unterminated
+
+    def close(self) -> None:
+        """Release the mapping if this buffer is memory-mapped."""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+
+class FileReader:
+    """Reads files into ``FileBuffer`` objects with minimal copying.
+
+    Small files are read with a single ``readinto`` call into a buffer that is
+    reused across files; files at or above ``mmap_threshold`` are mapped so
+    their pages are only faulted in where they are searched or decoded.
+    """
+
+    def __init__(
+        self,
+        mmap_threshold: int = DEFAULT_MMAP_THRESHOLD,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ):
+        """Initialize reader.
+
+        Args:
+            mmap_threshold: Minimum file size (bytes) that is memory-mapped
+            buffer_size: Initial size of the reusable read buffer
+        """
+        self.mmap_threshold = mmap_threshold
+        self._buffer = bytearray(buffer_size)
+
+    def read(self, file_path: Path) -> FileBuffer:
+        """Read a file.
+
+        Args:
+            file_path: Path to read
+
+        Returns:
+            Buffer with the file bytes, valid until the next call
+
+        Raises:
+            OSError: If the file cannot be opened or read
+        """
+        with open(file_path, 'rb', buffering=0) as f:
+            size = os.fstat(f.fileno()).st_size
+            if size >= self.mmap_threshold:
+                return FileBuffer(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+            if size > len(self._buffer):
+                self._buffer = bytearray(size)
+            length = 0
+            with memoryview(self._buffer) as view:
+                while length < size:
+                    read = f.readinto(view[length:size])
+                    if not read:
+                        break
+                    length += read
+            return FileBuffer(self._buffer, length)
@@ -1,11 +1,26 @@
 """Reporter for validation results in multiple formats."""
 
 import json
-from dataclasses import asdict, dataclass
+import sys
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional, Sequence, TextIO
 
+from . import __version__
+from .coverage import format_coverage_text
 from .parser import AnnotationError
+from .results import ErrorTable
+
+SARIF_SCHEMA = 'https://json.schemastore.org/sarif-2.1.0.json'
+SARIF_RULE_ID = 'invalid-ai-annotation'
+
+# Text for the summary's ``stop_reason`` when a run stopped early
+STOP_REASONS = {
+    'max_errors': 'the error limit',
+    'time_budget': 'the time budget',
+    'max_rss': 'the memory limit',
+}
 
 
 @dataclass
@@ -13,8 +28,12 @@ class ValidationResult:
     """Overall validation result."""
 
     valid: bool
-    errors: list[dict]
+    # Records of {'file', 'line', 'message'}; an ErrorTable for fresh runs
+    errors: Sequence[dict]
     summary: dict
+    coverage: Optional[dict] = None
+    # Records of {'file', 'message'}, e.g. for oversized files
+    warnings: Optional[list[dict]] = None
 
 
 class ResultReporter:
@@ -30,42 +49,37 @@ class ResultReporter:
 
     def generate_result(
         self,
-        errors: list[AnnotationError],
+        errors: Iterable[AnnotationError],
         total_files_scanned: int,
+        coverage: Optional[dict] = None,
+        warnings: Optional[list[dict]] = None,
     ) -> ValidationResult:
         """Generate validation result.
 
         Args:
-            errors: List of validation errors
+            errors: Validation errors, or an ``ErrorTable`` holding them
             total_files_scanned: Total number of files scanned
+            coverage: Optional ``CoverageMetrics.to_dict()`` to include
+            warnings: Optional warning records to include
 
         Returns:
-            ValidationResult object
+            ValidationResult object; its errors are rendered when read
         """
-        is_valid = len(errors) == 0
-
-        error_dicts = [
-            {
-                'file': str(error.file_path),
-                'line': error.line_number,
-                'message': error.message,
-            }
-            for error in errors
-        ]
-
-        # Count unique files with errors
-        files_with_errors = len(set(error.file_path for error in errors))
+        if not isinstance(errors, ErrorTable):
+            errors = ErrorTable(errors)
 
         summary = {
             'total_files': total_files_scanned,
-            'files_with_errors': files_with_errors,
+            'files_with_errors': errors.files_with_errors,
             'total_errors': len(errors),
         }
 
         return ValidationResult(
-            valid=is_valid,
-            errors=error_dicts,
+            valid=len(errors) == 0,
+            errors=errors,
             summary=summary,
+            coverage=coverage,
+            warnings=warnings or None,
         )
 
     def report_json(self, result: ValidationResult) -> str:
@@ -77,14 +91,16 @@ class ResultReporter:
         Returns:
             JSON string
         """
-        return json.dumps(
-            {
-                'valid': result.valid,
-                'errors': result.errors,
-                'summary': result.summary,
-            },
-            indent=2,
-        )
+        report = {
+            'valid': result.valid,
+            'errors': list(result.errors),
+            'summary': result.summary,
+        }
+        if result.coverage is not None:
+            report['coverage'] = result.coverage
+        if result.warnings:
+            report['warnings'] = result.warnings
+        return json.dumps(report, indent=2)
 
     def report_text(self, result: ValidationResult) -> str:
         """Format result as human-readable text.
@@ -107,6 +123,9 @@ class ResultReporter:
         lines.append(f"  Total files scanned: {result.summary['total_files']}")
         lines.append(f"  Files with errors: {result.summary['files_with_errors']}")
         lines.append(f"  Total errors: {result.summary['total_errors']}")
+        if result.summary.get('truncated'):
+            reason = STOP_REASONS.get(result.summary.get('stop_reason'), 'a limit')
+            lines.append(f'  Stopped early at {reason}; later files were not scanned')
 
         if result.errors:
             lines.append('')
@@ -115,6 +134,17 @@ class ResultReporter:
                 lines.append(f"  {error['file']}:{error['line']}")
                 lines.append(f"    → {error['message']}")
 
+        if result.warnings:
+            lines.append('')
+            lines.append('Warnings:')
+            for warning in result.warnings:
+                lines.append(f"  {warning['file']}")
+                lines.append(f"    ⚠ {warning['message']}")
+
+        if result.coverage is not None:
+            lines.append('')
+            lines.extend(format_coverage_text(result.coverage))
+
         return '\n'.join(lines)
 
     def print_result(self, result: ValidationResult, format: str = 'text') -> None:
@@ -128,3 +158,190 @@ class ResultReporter:
             print(self.report_json(result))
         else:
             print(self.report_text(result))
+
+
+class StreamingReporter(ABC):
+    """Writes results incrementally while files are being validated.
+
+    Errors are written as soon as each file is processed and only the
+    summary counters are kept, so memory use does not grow with the number
+    of errors. Subclasses define the record format.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None, repo_path: Optional[Path] = None):
+        """Initialize reporter.
+
+        Args:
+            stream: Output stream (default: stdout)
+            repo_path: Repository root; error paths are reported relative to it
+        """
+        self.stream = stream if stream is not None else sys.stdout
+        self.repo_path = repo_path
+        self.total_files = 0
+        self.files_with_errors = 0
+        self.total_errors = 0
+        # Set when the scan stopped before every file was validated, with
+        # the summary's stop_reason
+        self.truncated = False
+        self.stop_reason: Optional[str] = None
+        # Warning records ({'file', 'message'}) written with the trailer
+        self.warnings: list[dict] = []
+
+    @property
+    def summary(self) -> dict:
+        """Summary counters in the same shape as ``ValidationResult.summary``."""
+        summary = {
+            'total_files': self.total_files,
+            'files_with_errors': self.files_with_errors,
+            'total_errors': self.total_errors,
+        }
+        if self.truncated:
+            summary['truncated'] = True
+            summary['stop_reason'] = self.stop_reason
+        return summary
+
+    def start(self) -> None:
+        """Write any header that precedes the per-error records."""
+
+    def add_file(self, file_path: Path, errors: list[AnnotationError]) -> None:
+        """Record one validated file and write its errors.
+
+        Args:
+            file_path: File that was validated
+            errors: Validation errors found in the file
+        """
+        self.total_files += 1
+        if not errors:
+            return
+        self.files_with_errors += 1
+        for error in errors:
+            self.total_errors += 1
+            self._write_error(error)
+        self.stream.flush()
+
+    def finish(self) -> ValidationResult:
+        """Write the trailer and return the overall result.
+
+        Returns:
+            ValidationResult with the summary; ``errors`` is empty because
+            the errors were already written to the stream
+        """
+        result = ValidationResult(
+            valid=self.total_errors == 0,
+            errors=[],
+            summary=self.summary,
+            warnings=self.warnings or None,
+        )
+        self._write_trailer(result)
+        self.stream.flush()
+        return result
+
+    def _display_path(self, file_path: Path) -> str:
+        """Return ``file_path`` relative to the repository root, or as given outside it."""
+        if self.repo_path is not None:
+            try:
+                return file_path.relative_to(self.repo_path).as_posix()
+            except ValueError:
+                pass
+        return str(file_path)
+
+    @abstractmethod
+    def _write_error(self, error: AnnotationError) -> None:
+        """Write the record of one error."""
+
+    @abstractmethod
+    def _write_trailer(self, result: ValidationResult) -> None:
+        """Write the records that follow the last error."""
+
+
+class NdjsonReporter(StreamingReporter):
+    """Writes NDJSON: one ``error`` record per error, then ``warning`` records
+    and a ``summary`` record."""
+
+    def _write_error(self, error: AnnotationError) -> None:
+        self.stream.write(json.dumps({
+            'type': 'error',
+            'file': self._display_path(error.file_path),
+            'line': error.line_number,
+            'message': error.message,
+        }))
+        self.stream.write('\n')
+
+    def _write_trailer(self, result: ValidationResult) -> None:
+        for warning in self.warnings:
+            self.stream.write(json.dumps({
+                'type': 'warning',
+                'file': self._display_path(Path(warning['file'])),
+                'message': warning['message'],
+            }))
+            self.stream.write('\n')
+        self.stream.write(json.dumps({
+            'type': 'summary',
+            'valid': result.valid,
+            'summary': result.summary,
+        }))
+        self.stream.write('\n')
+
+
+class SarifReporter(StreamingReporter):
+    """Writes a SARIF 2.1.0 log, streaming each error as a result object."""
+
+    def start(self) -> None:
+        driver = {
+            'name': 'ai-code-validator',
+            'version': __version__,
+            'rules': [{
+                'id': SARIF_RULE_ID,
+                'shortDescription': {'text': 'Invalid AI-generated code annotation'},
+            }],
+        }
+        header = json.dumps({'$schema': SARIF_SCHEMA, 'version': '2.1.0'})
+        # Open the runs array and the results array of the single run
+        self.stream.write(header[:-1])
+        self.stream.write(', "runs": [{"tool": {"driver": ')
+        self.stream.write(json.dumps(driver))
+        self.stream.write('}, "results": [\n')
+
+    def _write_error(self, error: AnnotationError) -> None:
+        if self.total_errors > 1:
+            self.stream.write(',\n')
+        self.stream.write(json.dumps({
+            'ruleId': SARIF_RULE_ID,
+            'level': 'error',
+            'message': {'text': error.message},
+            'locations': [{
+                'physicalLocation': {
+                    'artifactLocation': {'uri': self._display_path(error.file_path)},
+                    'region': {'startLine': error.line_number},
+                },
+            }],
+        }))
+
+    def _write_trailer(self, result: ValidationResult) -> None:
+        invocation = {'executionSuccessful': True}
+        if self.warnings:
+            invocation['toolExecutionNotifications'] = [
+                {
+                    'level': 'warning',
+                    'message': {'text': warning['message']},
+                    'locations': [{
+                        'physicalLocation': {
+                            'artifactLocation': {
+                                'uri': self._display_path(Path(warning['file'])),
+                            },
+                        },
+                    }],
+                }
+                for warning in self.warnings
+            ]
+        self.stream.write('\n], "invocations": [')
+        self.stream.write(json.dumps(invocation))
+        self.stream.write('], "properties": ')
+        self.stream.write(json.dumps({'valid': result.valid, 'summary': result.summary}))
+        self.stream.write('}]}\n')
+
+
+STREAMING_REPORTERS = {
+    'ndjson': NdjsonReporter,
+    'sarif': SarifReporter,
+}
@@ -0,0 +1,86 @@
+"""Columnar storage for the errors of a whole run."""
+
+from array import array
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from .parser import ERROR_MESSAGES, AnnotationError, ErrorCode
+
+
+class ErrorTable(Sequence):
+    """Array-backed table of validation errors.
+
+    Each error is stored as a row of typed array columns: an index into a
+    table of files with errors, a line number and an error code, plus a
+    reference to an interned tuple of message arguments. A run with hundreds
+    of thousands of errors therefore keeps a few bytes per error instead of
+    an error object and a report dict with a rendered message.
+
+    As a sequence, the table yields report records
+    (``{'file', 'line', 'message'}``) rendered on access, so it can be used
+    directly as ``ValidationResult.errors``.
+    """
+
+    def __init__(self, errors: Iterable[AnnotationError] = ()):
+        """Initialize table.
+
+        Args:
+            errors: Errors to add initially
+        """
+        # Files that have at least one error, in order of their first error
+        self.files: list[Path] = []
+        self._file_index: dict[Path, int] = {}
+        self._file_column = array('I')
+        self._line_column = array('I')
+        self._code_column = array('B')
+        self._args_column: list[tuple[str, ...]] = []
+        self._interned_args: dict[tuple[str, ...], tuple[str, ...]] = {}
+        self.add(errors)
+
+    def add(self, errors: Iterable[AnnotationError]) -> None:
+        """Append errors to the table.
+
+        Args:
+            errors: Errors to append (typically those of one file)
+        """
+        for error in errors:
+            index = self._file_index.get(error.file_path)
+            if index is None:
+                index = self._file_index[error.file_path] = len(self.files)
+                self.files.append(error.file_path)
+            self._file_column.append(index)
+            self._line_column.append(error.line_number)
+            self._code_column.append(error.code)
+            self._args_column.append(self._interned_args.setdefault(error.args, error.args))
+
+    @property
+    def files_with_errors(self) -> int:
+        """Number of distinct files with at least one error."""
+        return len(self.files)
+
+    def __len__(self) -> int:
+        return len(self._line_column)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return {
+            'file': str(self.files[self._file_column[index]]),
+            'line': self._line_column[index],
+            'message': ERROR_MESSAGES[self._code_column[index]].format(*self._args_column[index]),
+        }
+
+    def errors(self) -> Iterator[AnnotationError]:
+        """Rebuild the stored errors as ``AnnotationError`` records.
+
+        Yields:
+            Errors in the order they were added
+        """
+        for row in range(len(self)):
+            yield AnnotationError(
+                file_path=self.files[self._file_column[row]],
+                line_number=self._line_column[row],
+                code=ErrorCode(self._code_column[row]),
+                args=self._args_column[row],
+            )
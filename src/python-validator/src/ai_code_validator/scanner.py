@@ -1,21 +1,44 @@
 """File scanner for discovering code files in repositories."""
 
+import os
+import sys
 from pathlib import Path
-from typing import Generator
+from typing import TYPE_CHECKING, Generator, Iterable, Optional
 
 from .config import Config
+from .ignore import IGNORE_FILENAMES, RuleChain, is_ignored, load_directory_rules, load_root_rules
+from .reader import FileBuffer, FileReader
+from .stats import RunStats, maybe_phase
+
+if TYPE_CHECKING:
+    from .budget import RunBudget
 
 
 class FileScanner:
     """Scans repository for code files matching configured patterns."""
 
-    def __init__(self, config: Config):
+    def __init__(
+        self,
+        config: Config,
+        stats: Optional[RunStats] = None,
+        warnings: Optional[list[dict]] = None,
+        budget: Optional['RunBudget'] = None,
+    ):
         """Initialize scanner with configuration.
 
         Args:
             config: Configuration object with paths and patterns
+            stats: Optional statistics collector for discovery and reading
+            warnings: List that warning records (``{'file', 'message'}``) for
+                files over ``max_file_size`` are appended to
+            budget: Optional run budget; a directory walk stops listing
+                once it is exceeded
         """
         self.config = config
+        self.stats = stats
+        self.warnings = [] if warnings is None else warnings
+        self.budget = budget
+        self.reader = FileReader(config.mmap_threshold)
 
     def scan(self) -> Generator[tuple[Path, str], None, None]:
         """Scan repository and yield (file_path, content) tuples.
@@ -23,17 +46,196 @@ class FileScanner:
         Yields:
             Tuples of (absolute_file_path, file_content)
         """
+        for file_path in self.discover_files():
+            content = self.read_file(file_path)
+            if content is not None:
+                yield file_path, content
+
+    def discover_files(self) -> Generator[Path, None, None]:
+        """Discover code files without reading them.
+
+        Yields:
+            Absolute file paths matching configured patterns
+        """
         if not self.config.repo_path.exists():
             raise FileNotFoundError(f"Repository path not found: {self.config.repo_path}")
 
-        for file_path in self._discover_files():
+        if self.stats is None:
+            yield from self._discover_files()
+            return
+        for file_path in self.stats.timed_iter('discovery', self._discover_files()):
+            self.stats.count('files_discovered')
+            yield file_path
+
+    def select(
+        self, paths: Iterable[Path], require_file: bool = True
+    ) -> Generator[Path, None, None]:
+        """Filter an explicit list of paths through the configured patterns.
+
+        Used when the file set comes from somewhere other than a directory
+        walk, such as ``git diff`` or a path list on stdin.
+
+        Args:
+            paths: Absolute paths to consider
+            require_file: Drop paths that are not regular files on disk
+
+        Yields:
+            Paths inside the repository that are not excluded and match
+        """
+        root = self.config.repo_path
+        for path in paths:
             try:
-                content = file_path.read_text(encoding='utf-8')
-                yield file_path, content
-            except (UnicodeDecodeError, PermissionError) as e:
-                if self.config.verbose:
-                    print(f"Warning: Could not read file {file_path}: {e}")
+                relative = path.relative_to(root)
+            except ValueError:
+                continue
+            if any(self.config.is_excluded_name(part) for part in relative.parts):
+                continue
+            if require_file and not path.is_file():
                 continue
+            if self._matches_patterns(path):
+                yield path
+
+    def read_file(self, file_path: Path) -> Optional[str]:
+        """Read a discovered file as UTF-8 text.
+
+        With ``max_file_size`` set, an oversized file is skipped or cut to
+        its leading complete lines as ``limit_buffer`` decides, with a
+        warning either way.
+
+        Args:
+            file_path: Path to read
+
+        Returns:
+            File content, or None if the file could not be read or decoded
+            or was skipped as oversized
+        """
+        data = self.read_bytes(file_path)
+        if data is None:
+            return None
+        if self.config.max_file_size is not None:
+            buffer = self.limit_buffer(file_path, FileBuffer(data))
+            if buffer is None:
+                return None
+            if buffer.truncated:
+                data = data[:len(buffer)]
+        return self.decode(file_path, data)
+
+    def read_bytes(self, file_path: Path) -> Optional[bytes]:
+        """Read the raw bytes of a discovered file.
+
+        Args:
+            file_path: Path to read
+
+        Returns:
+            File bytes, or None if the file could not be read; with
+            ``max_file_size`` set, at most one byte more than the limit is
+            read, enough for ``limit_buffer`` to tell the file is oversized
+        """
+        try:
+            if self.config.max_file_size is not None:
+                with open(file_path, 'rb') as stream:
+                    return stream.read(self.config.max_file_size + 1)
+            return file_path.read_bytes()
+        except OSError as e:
+            if self.config.verbose:
+                print(f"Warning: Could not read file {file_path}: {e}", file=sys.stderr)
+            return None
+
+    def read_buffer(self, file_path: Path) -> Optional[FileBuffer]:
+        """Read a file into a byte buffer without decoding it.
+
+        Small files share one reusable buffer and large files are
+        memory-mapped, so the result is only valid until the next call and
+        must be closed when done.
+
+        Args:
+            file_path: Path to read
+
+        Returns:
+            File buffer, or None if the file could not be read
+        """
+        try:
+            with maybe_phase(self.stats, 'reading'):
+                buffer = self.reader.read(file_path)
+        except OSError as e:
+            # Unreadable, or deleted since discovery (e.g. an editor's atomic save)
+            if self.stats is not None:
+                self.stats.count('read_errors')
+            if self.config.verbose:
+                print(f"Warning: Could not read file {file_path}: {e}", file=sys.stderr)
+            return None
+        if self.stats is not None:
+            self.stats.count('bytes_read', len(buffer))
+        return buffer
+
+    def limit_buffer(self, file_path: Path, buffer: FileBuffer) -> Optional[FileBuffer]:
+        """Apply ``config.max_file_size`` to a buffer about to be validated.
+
+        An oversized file is either skipped or, with ``oversized='prefix'``,
+        cut back to the last complete line within the limit and marked
+        ``truncated``. Either way a warning is recorded in ``warnings``.
+
+        Args:
+            file_path: Path the buffer was read from
+            buffer: File bytes
+
+        Returns:
+            The buffer to validate, or None if the file is skipped
+        """
+        limit = self.config.max_file_size
+        if limit is None or len(buffer) <= limit:
+            return buffer
+
+        if self.config.oversized == 'skip':
+            self.skip_oversized(file_path)
+            return None
+
+        if self.stats is not None:
+            self.stats.count('oversized_files')
+        cut = buffer.rfind(b'\n', 0, limit)
+        buffer.length = cut + 1 if cut != -1 else limit
+        buffer.truncated = True
+        self.warnings.append({
+            'file': str(file_path),
+            'message': f'Only the first {buffer.length} bytes were scanned: '
+            f'file is larger than the {limit}-byte size limit',
+        })
+        return buffer
+
+    def skip_oversized(self, file_path: Path) -> None:
+        """Record that a file over ``config.max_file_size`` is skipped.
+
+        Args:
+            file_path: Path of the oversized file
+        """
+        if self.stats is not None:
+            self.stats.count('oversized_files')
+        self.warnings.append({
+            'file': str(file_path),
+            'message': f'Skipped: file is larger than the {self.config.max_file_size}-byte size limit',
+        })
+
+    def decode(self, file_path: Path, data: bytes) -> Optional[str]:
+        """Decode file bytes the way ``Path.read_text`` would.
+
+        Args:
+            file_path: Path the bytes were read from (for warnings)
+            data: Raw file bytes
+
+        Returns:
+            UTF-8 text with universal newlines, or None if decoding fails
+        """
+        try:
+            content = data.decode('utf-8')
+        except UnicodeDecodeError as e:
+            if self.stats is not None:
+                self.stats.count('decode_errors')
+            if self.config.verbose:
+                print(f"Warning: Could not read file {file_path}: {e}", file=sys.stderr)
+            return None
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
 
     def _discover_files(self) -> Generator[Path, None, None]:
         """Discover all code files in repository matching patterns.
@@ -41,53 +243,108 @@ class FileScanner:
         Yields:
             Absolute file paths matching configured patterns
         """
-        for path in self.config.repo_path.rglob('*'):
-            # Skip excluded paths
-            if self.config.should_exclude_path(path):
-                continue
-
-            # Only process files, not directories
-            if not path.is_file():
-                continue
-
+        matches_file = self.config.matches_file
+        for path, relative_path in self._walk(self.config.repo_path):
             # Check if file matches any pattern
-            if self._matches_patterns(path):
+            if matches_file(relative_path):
                 yield path
 
-    def _matches_patterns(self, file_path: Path) -> bool:
-        """Check if file path matches any configured pattern.
+    def _walk(self, root: Path) -> Generator[Path, None, None]:
+        """Walk a directory tree, pruning excluded entries before descending.
+
+        Each directory is listed once with ``os.scandir``; the cached
+        ``DirEntry`` type information decides between file and directory
+        so no extra ``stat`` is issued per entry. Symlinked directories are
+        not followed, matching ``Path.rglob``. Unless disabled in the config,
+        ignore files are loaded as directories are entered, so ignored
+        directories are never listed. The walk ends early once the run
+        budget is exceeded, even if no matching file was found meanwhile.
 
         Args:
-            file_path: Path to check
+            root: Directory to walk
 
-        Returns:
-            True if file matches any pattern
+        Yields:
+            Tuples of (path, root-relative posix path) for regular files (or
+            symlinks to files) that are not excluded
         """
-        name = file_path.name
-        for pattern in self.config.file_patterns:
-            if self._simple_match(name, pattern):
-                return True
-        return False
+        stack = [self.root_entry(root)]
+        while stack:
+            subdirs, files = self.list_directory(*stack.pop())
+            yield from files
+            # Push in reverse so subdirectories are visited in listing order
+            stack.extend(reversed(subdirs))
+            if stack and self.budget is not None and self.budget.exceeded() is not None:
+                return
+
+    def root_entry(self, root: Path) -> tuple[str, str, RuleChain]:
+        """Return the (directory, relative_dir, rule_chain) walk entry for the root."""
+        root_chain = load_root_rules(root) if self.config.respect_gitignore else ()
+        return str(root), '', root_chain
 
-    @staticmethod
-    def _simple_match(filename: str, pattern: str) -> bool:
-        """Simple glob-style pattern matching.
+    def list_directory(
+        self, directory: str, relative_dir: str, chain: RuleChain
+    ) -> tuple[list[tuple[str, str, RuleChain]], list[tuple[Path, str]]]:
+        """List one directory, applying exclusions and ignore files.
 
         Args:
-            filename: File name to match
-            pattern: Pattern (e.g., '*.py')
+            directory: Directory to list
+            relative_dir: The directory relative to the scan root
+            chain: Ignore rules in effect for the directory
 
         Returns:
-            True if filename matches pattern
+            Tuple of (subdirectory walk entries, (path, relative_path) of files)
         """
-        # Convert simple glob patterns to match
-        if pattern == '*':
-            return True
+        subdirs = []
+        files = []
+        try:
+            with os.scandir(directory) as iterator:
+                entries = list(iterator)
+        except OSError as e:
+            if self.config.verbose:
+                print(f"Warning: Could not list directory {directory}: {e}", file=sys.stderr)
+            return subdirs, files
+
+        if self.config.respect_gitignore:
+            names = {entry.name for entry in entries}
+            if not names.isdisjoint(IGNORE_FILENAMES):
+                chain = chain + load_directory_rules(Path(directory), relative_dir, names)
+
+        for entry in entries:
+            if self.config.is_excluded_name(entry.name):
+                if self.stats is not None:
+                    self.stats.count('excluded_entries')
+                continue
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                if not is_dir and not entry.is_file():
+                    continue
+            except OSError:
+                continue
+
+            relative_path = f'{relative_dir}/{entry.name}' if relative_dir else entry.name
+            if chain and is_ignored(chain, relative_path, is_dir):
+                if self.stats is not None:
+                    self.stats.count('excluded_entries')
+                continue
+
+            if is_dir:
+                subdirs.append((entry.path, relative_path, chain))
+            else:
+                files.append((Path(entry.path), relative_path))
+
+        return subdirs, files
 
-        if pattern.startswith('*.'):
-            # Pattern like '*.py'
-            extension = pattern[2:]
-            return filename.endswith(f'.{extension}')
+    def _matches_patterns(self, file_path: Path) -> bool:
+        """Check if file path matches any configured pattern.
 
-        # Exact match
-        return filename == pattern
+        Args:
+            file_path: Path to check
+
+        Returns:
+            True if file matches any pattern
+        """
+        try:
+            relative_path = file_path.relative_to(self.config.repo_path).as_posix()
+        except ValueError:
+            relative_path = file_path.name
+        return self.config.matches_file(relative_path)
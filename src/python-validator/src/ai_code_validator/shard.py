@@ -0,0 +1,110 @@
+"""Deterministic splitting of the file set across CI nodes, and merging results."""
+
+import hashlib
+from pathlib import Path
+
+Shard = tuple[int, int]
+
+
+def parse_shard(spec: str) -> Shard:
+    """Parse an ``INDEX/COUNT`` shard specification.
+
+    Args:
+        spec: Shard such as ``2/4`` (indices start at 1)
+
+    Returns:
+        Tuple of (index, count)
+
+    Raises:
+        ValueError: If the specification is malformed or out of range
+    """
+    index, separator, count = spec.partition('/')
+    try:
+        index, count = int(index), int(count)
+    except ValueError:
+        separator = ''
+    if not separator or count < 1 or not 1 <= index <= count:
+        raise ValueError(f'Invalid shard: {spec} (expected INDEX/COUNT with 1 <= INDEX <= COUNT)')
+    return index, count
+
+
+def shard_of(relative_path: str, count: int) -> int:
+    """Return the 1-based shard a repo-relative path belongs to.
+
+    The hash depends only on the path, so every node agrees on the split
+    regardless of platform, Python version or discovery order.
+
+    Args:
+        relative_path: ``/``-separated path relative to the repository root
+        count: Number of shards
+
+    Returns:
+        Shard index in ``1..count``
+    """
+    digest = hashlib.blake2b(relative_path.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big') % count + 1
+
+
+def merge_reports(reports: list[dict]) -> 'ValidationResult':
+    """Combine JSON reports of separate shards into one result.
+
+    Args:
+        reports: Decoded ``--output-format json`` reports, one per shard
+
+    Returns:
+        Result with errors of all shards and recomputed summary totals
+
+    Raises:
+        ValueError: If the same shard appears twice or shard counts differ
+    """
+    from .coverage import CoverageMetrics
+    from .reporter import ValidationResult
+
+    shards = [report['summary'].get('shard') for report in reports]
+    labelled = [shard for shard in shards if shard is not None]
+    if len(set(labelled)) != len(labelled):
+        raise ValueError('The same shard was given more than once')
+    if len({parse_shard(shard)[1] for shard in labelled}) > 1:
+        raise ValueError('Reports come from runs with different shard counts')
+
+    errors = sorted(
+        (error for report in reports for error in report['errors']),
+        key=lambda error: (error['file'], error['line']),
+    )
+    summary = {
+        'total_files': sum(report['summary']['total_files'] for report in reports),
+        'files_with_errors': len({error['file'] for error in errors}),
+        'total_errors': len(errors),
+    }
+    stop_reasons = [
+        report['summary'].get('stop_reason') for report in reports if report['summary'].get('truncated')
+    ]
+    if stop_reasons:
+        summary['truncated'] = True
+        summary['stop_reason'] = stop_reasons[0]
+    warnings = [warning for report in reports for warning in report.get('warnings', [])]
+
+    coverage = None
+    if reports and all('coverage' in report for report in reports):
+        metrics = CoverageMetrics(Path('.'))
+        for report in reports:
+            metrics.merge(report['coverage'])
+        coverage = metrics.to_dict()
+
+    return ValidationResult(
+        valid=not errors,
+        errors=errors,
+        summary=summary,
+        coverage=coverage,
+        warnings=warnings or None,
+    )
+
+
+def missing_shards(reports: list[dict]) -> list[str]:
+    """Return the ``INDEX/COUNT`` labels absent from a set of shard reports."""
+    labelled = [report['summary'].get('shard') for report in reports]
+    labelled = [shard for shard in labelled if shard is not None]
+    if not labelled:
+        return []
+    count = parse_shard(labelled[0])[1]
+    return [f'{index}/{count}' for index in range(1, count + 1) if f'{index}/{count}' not in labelled]
@@ -0,0 +1,170 @@
+"""Per-phase timing and counters for validator runs."""
+
+import heapq
+import time
+from typing import Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar('T')
+
+PHASES = ('discovery', 'reading', 'parsing', 'reporting')
+
+COUNTERS = (
+    'files_discovered',
+    'files_scanned',
+    'bytes_read',
+    'excluded_entries',
+    'read_errors',
+    'decode_errors',
+    'fast_path_files',
+    'cache_hits',
+    'oversized_files',
+)
+
+DEFAULT_TOP_N = 10
+
+
+class _PhaseTimer:
+    """Context manager adding wall and CPU time to one phase."""
+
+    __slots__ = ('stats', 'name', 'wall', 'cpu')
+
+    def __init__(self, stats: 'RunStats', name: str):
+        self.stats = stats
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.wall = time.perf_counter()
+        self.cpu = time.process_time()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stats.wall[self.name] += time.perf_counter() - self.wall
+        self.stats.cpu[self.name] += time.process_time() - self.cpu
+
+
+class RunStats:
+    """Collects wall/CPU time per phase, file and byte counters and the
+    slowest files of a run.
+
+    Worker processes keep their own instance and send ``to_dict()`` back to
+    be combined with ``merge()``. In pooled runs phase times are summed over
+    workers, so they can exceed the elapsed time.
+    """
+
+    def __init__(self, top_n: int = DEFAULT_TOP_N):
+        """Initialize empty statistics.
+
+        Args:
+            top_n: Number of slowest files to keep
+        """
+        self.top_n = top_n
+        self.wall = dict.fromkeys(PHASES, 0.0)
+        self.cpu = dict.fromkeys(PHASES, 0.0)
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self._slowest: list[tuple[float, str]] = []
+        self._started = time.perf_counter()
+        self.elapsed = 0.0
+
+    def phase(self, name: str) -> _PhaseTimer:
+        """Return a context manager timing a block as part of a phase."""
+        return _PhaseTimer(self, name)
+
+    def add_time(self, name: str, wall: float, cpu: float) -> None:
+        """Add wall and CPU time measured elsewhere (e.g. on an I/O thread) to a phase."""
+        self.wall[name] += wall
+        self.cpu[name] += cpu
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Increment a counter."""
+        self.counters[name] += amount
+
+    def record_file(self, file_path, seconds: float) -> None:
+        """Record the time spent reading and validating one file."""
+        entry = (seconds, str(file_path))
+        if len(self._slowest) < self.top_n:
+            heapq.heappush(self._slowest, entry)
+        elif entry > self._slowest[0]:
+            heapq.heapreplace(self._slowest, entry)
+
+    def timed_iter(self, name: str, iterable: Iterable[T]) -> Iterator[T]:
+        """Wrap an iterator so the time spent producing items counts to a phase."""
+        iterator = iter(iterable)
+        while True:
+            with self.phase(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def slowest_files(self) -> list[tuple[str, float]]:
+        """Return the slowest files, slowest first."""
+        return [(path, seconds) for seconds, path in sorted(self._slowest, reverse=True)]
+
+    def finish(self) -> None:
+        """Record the elapsed time of the whole run."""
+        self.elapsed = time.perf_counter() - self._started
+
+    def merge(self, other: dict) -> None:
+        """Add statistics collected elsewhere (e.g. in a worker process).
+
+        Args:
+            other: Output of another instance's ``to_dict()``
+        """
+        for name, value in other['phases'].items():
+            self.wall[name] += value['wall']
+            self.cpu[name] += value['cpu']
+        for name, value in other['counters'].items():
+            self.counters[name] += value
+        for path, seconds in other['slowest_files']:
+            self.record_file(path, seconds)
+
+    def to_dict(self) -> dict:
+        """Return the statistics as a JSON-serializable dict."""
+        return {
+            'elapsed': self.elapsed,
+            'phases': {
+                name: {'wall': self.wall[name], 'cpu': self.cpu[name]}
+                for name in PHASES
+            },
+            'counters': dict(self.counters),
+            'slowest_files': self.slowest_files(),
+        }
+
+    def format_json(self) -> str:
+        """Format statistics as a JSON block."""
+        import json
+
+        return json.dumps({'stats': self.to_dict()}, indent=2)
+
+    def format_text(self) -> str:
+        """Format statistics as a human-readable block."""
+        lines = ['Run statistics:', f'  Elapsed: {self.elapsed:.3f}s', '  Phases (wall / cpu):']
+        for name in PHASES:
+            lines.append(f'    {name:<10} {self.wall[name]:8.3f}s / {self.cpu[name]:8.3f}s')
+        lines.append('  Counters:')
+        for name in COUNTERS:
+            lines.append(f'    {name:<17} {self.counters[name]}')
+        slowest = self.slowest_files()
+        if slowest:
+            lines.append('  Slowest files:')
+            for path, seconds in slowest:
+                lines.append(f'    {seconds * 1000:8.2f}ms  {path}')
+        return '\n'.join(lines)
+
+
+def maybe_phase(stats: Optional[RunStats], name: str):
+    """Time a phase if statistics are being collected."""
+    return stats.phase(name) if stats is not None else _NULL_TIMER
+
+
+class _NullTimer:
+    """No-op stand-in for ``_PhaseTimer`` when statistics are disabled."""
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+_NULL_TIMER = _NullTimer()
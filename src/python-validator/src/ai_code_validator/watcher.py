@@ -0,0 +1,392 @@
+"""Change detection for repeated validation of a working tree."""
+
+import os
+import select
+import struct
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .ignore import IGNORE_FILENAMES, RuleChain
+from .scanner import FileScanner
+
+# (st_mtime_ns, st_size) of a file when it was last seen
+FileState = tuple[int, int]
+
+# Walk entry of a directory (as from ``FileScanner.root_entry``), its
+# matching files and its subdirectories, as of the latest listing
+DirectoryState = tuple[tuple[str, str, RuleChain], list[Path], list[str]]
+
+# Seconds between full walks of an inotify-watched tree, as a safety net
+# for events that were never delivered
+DEFAULT_FULL_WALK_INTERVAL = 60.0
+
+
+@dataclass
+class Changes:
+    """Files added, modified and deleted since the previous poll."""
+
+    added: list[Path] = field(default_factory=list)
+    modified: list[Path] = field(default_factory=list)
+    deleted: list[Path] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.modified or self.deleted)
+
+    @property
+    def changed(self) -> list[Path]:
+        """Files whose contents need validating (added and modified)."""
+        return self.added + self.modified
+
+
+class PollingWatcher:
+    """Detects changes by walking the tree and comparing file stats.
+
+    Works on every platform and filesystem; each poll costs one directory
+    walk plus one ``stat`` per matching file, but no file is read. Callers
+    that know which directories changed can ``rescan()`` just those.
+    """
+
+    def __init__(self, scanner: FileScanner):
+        """Initialize watcher with nothing seen yet.
+
+        Args:
+            scanner: Scanner providing the file set to watch
+        """
+        self.scanner = scanner
+        self.states: dict[Path, FileState] = {}
+        self.directories: dict[str, DirectoryState] = {}
+
+    def poll(self) -> Changes:
+        """Walk the tree and report what changed since the previous poll.
+
+        The first poll reports every file as added.
+
+        Returns:
+            Changes since the previous poll
+        """
+        changes = Changes()
+        previous, self.states = self.states, {}
+        self.directories = {}
+        self._walk([self.scanner.root_entry(self.scanner.config.repo_path)], previous, changes)
+        changes.deleted = [path for path in previous if path not in self.states]
+        self._directories_seen(list(self.directories))
+        return changes
+
+    def rescan(self, directories: Iterable[str]) -> Changes:
+        """Re-list only some directories and report what changed in them.
+
+        Files directly inside each directory are compared with the previous
+        poll; subdirectories that appeared are walked in full and those that
+        disappeared are dropped with everything below them. Directories the
+        watcher has not seen are ignored (their parent's listing covers them).
+
+        Args:
+            directories: Directories to re-list, as walked by ``poll()``
+
+        Returns:
+            Changes found in those directories
+        """
+        changes = Changes()
+        # Parents first, so a removed subtree is dropped before its members
+        for directory in sorted(set(directories)):
+            known = self.directories.get(directory)
+            if known is None:
+                continue
+            entry, old_files, old_subdirs = known
+            subdirs = self._list(entry, self.states, changes)
+            current = set(self.directories[directory][1])
+            for file_path in old_files:
+                if file_path not in current and self.states.pop(file_path, None) is not None:
+                    changes.deleted.append(file_path)
+            names = {subdir[0] for subdir in subdirs}
+            for subdir in old_subdirs:
+                if subdir not in names:
+                    self._forget(subdir, changes)
+            self._walk(
+                [subdir for subdir in subdirs if subdir[0] not in self.directories],
+                self.states,
+                changes,
+            )
+        self._directories_seen(list(self.directories))
+        return changes
+
+    def wait(self, timeout: float) -> None:
+        """Block until changes may have happened or ``timeout`` seconds pass."""
+        time.sleep(timeout)
+
+    def close(self) -> None:
+        """Release any operating system resources."""
+
+    def _directories_seen(self, directories: list[str]) -> None:
+        """Hook called with every directory known after a poll or rescan."""
+
+    def _walk(
+        self,
+        stack: list[tuple[str, str, RuleChain]],
+        previous: dict[Path, FileState],
+        changes: Changes,
+    ) -> None:
+        """List directories and everything below them, depth first."""
+        stack = list(reversed(stack))
+        while stack:
+            stack.extend(reversed(self._list(stack.pop(), previous, changes)))
+
+    def _list(
+        self,
+        entry: tuple[str, str, RuleChain],
+        previous: dict[Path, FileState],
+        changes: Changes,
+    ) -> list[tuple[str, str, RuleChain]]:
+        """List one directory, stat its matching files and record the result.
+
+        Files are compared with their state in ``previous`` and stored in
+        ``states``.
+
+        Returns:
+            Walk entries of the directory's subdirectories
+        """
+        matches_file = self.scanner.config.matches_file
+        subdirs, files = self.scanner.list_directory(*entry)
+        matched = []
+        for file_path, relative_path in files:
+            if not matches_file(relative_path):
+                continue
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            state = (stat.st_mtime_ns, stat.st_size)
+            before = previous.get(file_path)
+            if before is None:
+                changes.added.append(file_path)
+            elif before != state:
+                changes.modified.append(file_path)
+            self.states[file_path] = state
+            matched.append(file_path)
+        self.directories[entry[0]] = (entry, matched, [subdir[0] for subdir in subdirs])
+        return subdirs
+
+    def _forget(self, directory: str, changes: Changes) -> None:
+        """Drop a directory that disappeared, reporting its files as deleted."""
+        known = self.directories.pop(directory, None)
+        if known is None:
+            return
+        _, files, subdirs = known
+        for file_path in files:
+            if self.states.pop(file_path, None) is not None:
+                changes.deleted.append(file_path)
+        for subdir in subdirs:
+            self._forget(subdir, changes)
+
+
+# inotify(7) event bits
+_IN_MODIFY = 0x002
+_IN_ATTRIB = 0x004
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_DELETE_SELF = 0x400
+_IN_MOVE_SELF = 0x800
+_IN_Q_OVERFLOW = 0x4000
+_IN_IGNORED = 0x8000
+_IN_ONLYDIR = 0x01000000
+
+# struct inotify_event header: wd, mask, cookie, len (name follows)
+_EVENT_HEADER = struct.Struct('iIII')
+
+_IGNORE_FILENAMES = frozenset(name.encode() for name in IGNORE_FILENAMES)
+
+_INOTIFY_MASK = (
+    _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+    | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_ONLYDIR
+)
+
+
+class InotifyWatcher(PollingWatcher):
+    """Watcher driven by Linux inotify events.
+
+    Every walked directory gets an inotify watch, so ``wait()`` returns as
+    soon as something in the tree changes instead of sleeping for the whole
+    timeout, and ``poll()`` re-lists only the directories that had events
+    instead of walking the tree. A full walk still runs on the first poll,
+    after an event queue overflow or a change to an ignore file, and every
+    ``full_walk_interval`` seconds, so missed events (for example once the
+    per-user watch limit is reached) only delay detection.
+    """
+
+    def __init__(
+        self, scanner: FileScanner, full_walk_interval: float = DEFAULT_FULL_WALK_INTERVAL
+    ):
+        """Initialize watcher and open an inotify instance.
+
+        Args:
+            scanner: Scanner providing the file set to watch
+            full_walk_interval: Seconds between full walks of the tree
+
+        Raises:
+            OSError: If inotify is not available
+        """
+        super().__init__(scanner)
+        self.full_walk_interval = full_walk_interval
+        import ctypes
+        import ctypes.util
+
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._get_errno = ctypes.get_errno
+        self._watches: dict[str, int] = {}
+        self._watched: dict[int, str] = {}
+        # Directories with events since the last poll
+        self._dirty: set[str] = set()
+        self._full_walk_due = True
+        self._last_full_walk = 0.0
+
+    def poll(self) -> Changes:
+        """Re-list directories that had events, or walk the tree when due.
+
+        Returns:
+            Changes since the previous poll
+        """
+        self._drain()
+        now = time.monotonic()
+        if self._full_walk_due or now - self._last_full_walk >= self.full_walk_interval:
+            self._full_walk_due = False
+            self._last_full_walk = now
+            self._dirty.clear()
+            return super().poll()
+        dirty, self._dirty = self._dirty, set()
+        return self.rescan(dirty)
+
+    def wait(self, timeout: float) -> None:
+        """Block until an inotify event arrives or ``timeout`` seconds pass."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if ready:
+            self._drain()
+
+    def close(self) -> None:
+        """Close the inotify instance."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def _drain(self) -> None:
+        """Read queued events and note the directories they happened in."""
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return
+            if not data:
+                return
+            offset = 0
+            while offset < len(data):
+                descriptor, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b'\0')
+                offset += length
+                if mask & _IN_Q_OVERFLOW or name in _IGNORE_FILENAMES:
+                    # Events were lost, or ignore rules below a directory changed
+                    self._full_walk_due = True
+                    continue
+                directory = self._watched.get(descriptor)
+                if directory is None:
+                    continue
+                if mask & _IN_IGNORED:
+                    # The kernel removed the watch (the directory is gone)
+                    del self._watched[descriptor]
+                    self._watches.pop(directory, None)
+                    continue
+                self._dirty.add(directory)
+
+    def _directories_seen(self, directories: list[str]) -> None:
+        seen = set(directories)
+        for directory in list(self._watches):
+            if directory not in seen:
+                # Fails harmlessly if the kernel already dropped the watch
+                descriptor = self._watches.pop(directory)
+                self._watched.pop(descriptor, None)
+                self._libc.inotify_rm_watch(self._fd, descriptor)
+        for directory in directories:
+            if directory in self._watches:
+                continue
+            descriptor = self._libc.inotify_add_watch(
+                self._fd, os.fsencode(directory), _INOTIFY_MASK
+            )
+            if descriptor >= 0:
+                self._watches[directory] = descriptor
+                self._watched[descriptor] = directory
+            elif self.scanner.config.verbose:
+                errno = self._get_errno()
+                print(
+                    f'Warning: Could not watch {directory}: {os.strerror(errno)}',
+                    file=sys.stderr,
+                )
+
+
+def create_watcher(scanner: FileScanner, polling: bool = False) -> PollingWatcher:
+    """Return an inotify watcher where available, else a polling watcher.
+
+    Args:
+        scanner: Scanner providing the file set to watch
+        polling: Always use the portable polling watcher
+
+    Returns:
+        Watcher for the scanner's tree
+    """
+    if not polling and sys.platform.startswith('linux'):
+        try:
+            return InotifyWatcher(scanner)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(scanner)
+
+
+def watch(
+    validator,
+    on_refresh,
+    poll_interval: float = 1.0,
+    debounce: float = 0.3,
+    max_reports: Optional[int] = None,
+) -> None:
+    """Keep an incremental validator up to date and report after each burst.
+
+    After a poll finds changes, the tree is polled again every ``debounce``
+    seconds; ``on_refresh`` is only called once a poll comes back empty, so
+    a burst of saves produces a single report.
+
+    Args:
+        validator: ``IncrementalValidator`` to keep up to date
+        on_refresh: Called with the validator after the initial scan and
+            after each burst of changes
+        poll_interval: Seconds between polls while the tree is quiet
+        debounce: Quiet period that ends a burst of changes
+        max_reports: Return after this many reports (default: run until
+            interrupted)
+    """
+    watcher = validator.watcher
+    validator.refresh()
+    on_refresh(validator)
+    reports = 1
+    pending = False
+    while max_reports is None or reports < max_reports:
+        watcher.wait(debounce if pending else poll_interval)
+        try:
+            changed = validator.refresh()
+        except OSError as e:
+            # Files or directories vanishing mid-refresh must not end watching
+            print(f'Warning: Refresh failed: {e}', file=sys.stderr)
+            continue
+        if changed:
+            pending = True
+        elif pending:
+            pending = False
+            on_refresh(validator)
+            reports += 1
@@ -0,0 +1,90 @@
+"""Tests for validating archive members without extraction."""
+
+import io
+import tarfile
+import tempfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from ai_code_validator.archive import archive_members, member_path
+from ai_code_validator.cli import main
+from ai_code_validator.config import Config
+
+INVALID_BLOCK = b'# START_AI_GENERATED_CODE\n# TOOL_NAME: GPT-4\n'
+
+MEMBERS = {
+    'pkg/__init__.py': b'',
+    'pkg/bad.py': b'x = 1\n' + INVALID_BLOCK,
+    'pkg/README.md': INVALID_BLOCK,
+    'pkg/node_modules/dep.js': INVALID_BLOCK,
+}
+
+
+def _write_zip(path: Path) -> None:
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr('pkg/', b'')
+        for name, data in MEMBERS.items():
+            archive.writestr(name, data)
+
+
+def _write_tar(path: Path) -> None:
+    with tarfile.open(path, 'w:gz') as archive:
+        for name, data in MEMBERS.items():
+            info = tarfile.TarInfo(f'./{name}')
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+
+
+@pytest.mark.parametrize('name, write', [('pkg-1.0-py3-none-any.whl', _write_zip), ('pkg-1.0.tar.gz', _write_tar)])
+def test_members_are_filtered_by_patterns(name, write):
+    """Test that members are selected by the file and exclude patterns and named without ./."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        archive_path = Path(tmpdir) / name
+        write(archive_path)
+
+        members = dict(archive_members(archive_path, Config(repo_path=tmpdir)))
+
+        assert {path.name for path in members} == {'__init__.py', 'bad.py'}
+        bad = member_path(archive_path, 'pkg/bad.py')
+        assert members[bad] == MEMBERS['pkg/bad.py']
+
+
+@pytest.mark.parametrize('name, write', [('pkg.whl', _write_zip), ('pkg.tar.gz', _write_tar)])
+def test_member_reads_stop_past_the_size_limit(name, write):
+    """Test that members are read only one byte past max_file_size."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        archive_path = Path(tmpdir) / name
+        write(archive_path)
+
+        members = dict(archive_members(archive_path, Config(repo_path=tmpdir, max_file_size=4)))
+
+        assert members[member_path(archive_path, 'pkg/bad.py')] == MEMBERS['pkg/bad.py'][:5]
+        assert members[member_path(archive_path, 'pkg/__init__.py')] == b''
+
+
+def test_unreadable_archive_is_rejected():
+    """Test that corrupt and unsupported archives raise ValueError."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        archive_path = Path(tmpdir) / 'broken.zip'
+        archive_path.write_bytes(b'not a zip')
+
+        with pytest.raises(ValueError, match='Unreadable archive'):
+            list(archive_members(archive_path, Config(repo_path=tmpdir)))
+        with pytest.raises(ValueError, match='Unsupported archive'):
+            list(archive_members(Path(tmpdir) / 'pkg.rar', Config(repo_path=tmpdir)))
+
+
+def test_cli_reports_archive_members(capsys, monkeypatch):
+    """Test that --archive reports errors under archive!member paths."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        wheel = Path(tmpdir) / 'pkg.whl'
+        _write_zip(wheel)
+
+        monkeypatch.setattr('sys.argv', ['cli', '--repo-path', tmpdir, '--archive', str(wheel)])
+        assert main() == 1
+
+        output = capsys.readouterr().out
+        assert f'{wheel}!pkg/bad.py:2' in output
+        assert 'Total files scanned: 2' in output
@@ -0,0 +1,99 @@
+"""Tests for the asyncio I/O pipeline."""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from ai_code_validator.asyncscan import AsyncValidator
+from ai_code_validator.config import Config
+from ai_code_validator.parallel import ParallelValidator
+from ai_code_validator.scanner import FileScanner
+
+INVALID_BLOCK = '''
+# START_AI_GENERATED_CODE
+# TOOL_NAME: GPT-4
+# ACTION: GENERATED
+# END_AI_GENERATED_CODE
+'''
+
+
+def _make_repo(tmppath: Path) -> None:
+    for i in range(40):
+        subdir = tmppath / f'pkg{i % 5}' / f'sub{i % 3}'
+        subdir.mkdir(parents=True, exist_ok=True)
+        (subdir / f'module{i}.py').write_text(INVALID_BLOCK if i % 3 else '# Plain')
+    (tmppath / '.gitignore').write_text('pkg4/\n')
+    (tmppath / 'node_modules').mkdir()
+    (tmppath / 'node_modules' / 'dep.py').write_text(INVALID_BLOCK)
+
+
+def _by_path(results):
+    return {str(path): [error.message for error in errors] for path, _, errors in results}
+
+
+def test_async_tree_matches_serial_results():
+    """Test that the async walk finds and validates the same files."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _make_repo(Path(tmpdir))
+        config = Config(repo_path=tmpdir, jobs=1)
+
+        serial = _by_path(ParallelValidator(config).validate(FileScanner(config).discover_files()))
+        validator = AsyncValidator(config, io_concurrency=3)
+        concurrent = _by_path(validator.validate_tree())
+
+        assert concurrent == serial
+        assert len(concurrent) == 32
+        assert validator.fast_path_files == sum(not errors for errors in serial.values())
+
+
+def test_async_reuses_buffers_and_maps_large_files():
+    """Test that reader buffers are not overwritten before they are parsed, mapped or not."""
+    from ai_code_validator.stats import RunStats
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _make_repo(Path(tmpdir))
+        config = Config(repo_path=tmpdir, jobs=1)
+        serial = _by_path(ParallelValidator(config).validate(FileScanner(config).discover_files()))
+
+        for mmap_threshold in (1, 10 ** 6):
+            stats = RunStats()
+            mapped = Config(repo_path=tmpdir, jobs=1, mmap_threshold=mmap_threshold)
+            validator = AsyncValidator(mapped, io_concurrency=4, stats=stats)
+
+            assert _by_path(validator.validate_tree()) == serial
+            assert stats.counters['files_discovered'] == 32
+            assert stats.wall['discovery'] > 0
+            assert stats.wall['reading'] > 0
+
+
+def test_async_explicit_paths():
+    """Test validating an explicit path list, including unreadable entries."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        (tmppath / 'a.py').write_text(INVALID_BLOCK)
+        (tmppath / 'b.py').write_bytes(b'# START_AI_GENERATED_CODE \xff\n')
+
+        results = _by_path(
+            AsyncValidator(Config(repo_path=tmpdir), io_concurrency=2).validate(
+                [tmppath / 'a.py', tmppath / 'b.py']
+            )
+        )
+
+        assert list(results) == [str(tmppath / 'a.py')]
+
+
+def test_async_early_close_stops_pipeline():
+    """Test that abandoning the generator shuts the pipeline down cleanly."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _make_repo(Path(tmpdir))
+        results = AsyncValidator(Config(repo_path=tmpdir), io_concurrency=2).validate_tree()
+
+        next(results)
+        results.close()
+
+
+def test_async_missing_repository():
+    """Test that a missing root raises like the serial scanner."""
+    with pytest.raises(FileNotFoundError):
+        list(AsyncValidator(Config(repo_path='/nonexistent/repo')).validate_tree())
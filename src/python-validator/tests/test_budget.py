@@ -0,0 +1,181 @@
+"""Tests for file size limits and time/memory budgets."""
+
+import json
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from ai_code_validator import parallel
+from ai_code_validator.budget import RunBudget, parse_size
+from ai_code_validator.cli import main
+from ai_code_validator.config import Config
+from ai_code_validator.parallel import ParallelValidator, _init_worker, _validate_chunk
+from ai_code_validator.scanner import FileScanner
+
+VALID_BLOCK = '''# START_AI_GENERATED_CODE
+# TOOL_NAME: GPT-4
+# DATE: 2025-02-15
+# AUTHOR_ID: user-1
+# ACTION: GENERATED
+# END_AI_GENERATED_CODE
+'''
+
+
+def test_parse_size():
+    assert parse_size('4096') == 4096
+    assert parse_size('512K') == 512 * 1024
+    assert parse_size('1.5mb') == 1536 * 1024
+    for value in ('', 'M', '0', '-1K', 'ten'):
+        with pytest.raises(ValueError):
+            parse_size(value)
+
+
+def test_budget_reports_exhaustion():
+    assert RunBudget().exceeded() is None
+    assert RunBudget(time_budget=0).exceeded() == 'time_budget'
+    assert RunBudget(time_budget=3600, max_rss=1).exceeded() == 'max_rss'
+    assert RunBudget(time_budget=3600, max_rss=1 << 50).exceeded() is None
+
+
+def test_budget_counts_worker_memory():
+    budget = RunBudget(max_rss=1 << 50)
+    budget.note_worker_rss(None)
+    assert budget.exceeded() is None
+    budget.note_worker_rss(1 << 50)
+    assert budget.exceeded() == 'max_rss'
+    assert budget.reason == 'max_rss'
+
+
+def test_workers_report_their_peak_memory():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        (Path(tmpdir) / 'a.py').write_text(VALID_BLOCK)
+        _init_worker(Config(repo_path=tmpdir))
+        peak_rss = _validate_chunk([Path(tmpdir) / 'a.py'])[-1]
+
+        assert peak_rss is None or peak_rss > 0
+
+
+def test_discovery_stops_when_the_budget_runs_out():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        (tmppath / 'top.py').write_text(VALID_BLOCK)
+        (tmppath / 'sub').mkdir()
+        (tmppath / 'sub' / 'nested.py').write_text(VALID_BLOCK)
+        config = Config(repo_path=tmpdir)
+
+        assert [path.name for path in FileScanner(config, budget=RunBudget(time_budget=0)).discover_files()] == ['top.py']
+        # Nothing is left to list after the last directory, so the budget is not charged
+        budget = RunBudget(time_budget=3600)
+        assert len(list(FileScanner(config, budget=budget).discover_files())) == 2
+        assert budget.reason is None
+
+
+def test_waiting_on_workers_stops_when_the_budget_runs_out(monkeypatch):
+    validate_paths = parallel._validate_paths
+
+    def slow_validate_paths(scanner, parser, paths, *args):
+        for path in paths:
+            time.sleep(0.2)
+            yield from validate_paths(scanner, parser, [path], *args)
+
+    # Pool workers are forked from this process, so they inherit the patch
+    monkeypatch.setattr(parallel, '_validate_paths', slow_validate_paths)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        paths = []
+        for n in range(40):
+            paths.append(Path(tmpdir) / f'm{n}.py')
+            paths[-1].write_text(VALID_BLOCK)
+        budget = RunBudget(time_budget=0.3)
+        validator = ParallelValidator(Config(repo_path=tmpdir, jobs=2), chunk_size=20, budget=budget)
+
+        started = time.monotonic()
+        assert list(validator.validate(paths)) == []
+        assert budget.reason == 'time_budget'
+        # Workers skip the rest of their chunks instead of finishing them
+        assert time.monotonic() - started < 2
+
+
+@pytest.mark.parametrize('oversized', ['skip', 'prefix'])
+def test_oversized_files_are_warned_about(oversized):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        (tmppath / 'small.py').write_text(VALID_BLOCK)
+        # A valid block, then an unterminated one cut off by the limit
+        (tmppath / 'huge.py').write_text(VALID_BLOCK + '# START_AI_GENERATED_CODE\n' + 'x = 1\n' * 500)
+
+        config = Config(repo_path=tmpdir, jobs=1, max_file_size=len(VALID_BLOCK) + 40, oversized=oversized)
+        validator = ParallelValidator(config)
+        results = {path.name: errors for path, _, errors in validator.validate(FileScanner(config).discover_files())}
+
+        assert [warning['file'] for warning in validator.warnings] == [str(tmppath / 'huge.py')]
+        if oversized == 'skip':
+            assert set(results) == {'small.py'}
+            assert 'Skipped' in validator.warnings[0]['message']
+        else:
+            assert results == {'small.py': [], 'huge.py': []}
+            assert 'Only the first' in validator.warnings[0]['message']
+
+
+@pytest.mark.parametrize('oversized', ['skip', 'prefix'])
+def test_size_limit_applies_to_cached_files(oversized):
+    """Test that --max-file-size is enforced for files the cache already holds."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        (tmppath / 'huge.py').write_text(VALID_BLOCK + '# START_AI_GENERATED_CODE\n' + 'x = 1\n' * 500)
+        cache_dir = str(tmppath / '.cache')
+
+        unlimited = Config(repo_path=tmpdir, jobs=1, cache_dir=cache_dir)
+        results = list(ParallelValidator(unlimited).validate(FileScanner(unlimited).discover_files()))
+        assert results[0][2]
+
+        config = Config(
+            repo_path=tmpdir, jobs=1, cache_dir=cache_dir, max_file_size=len(VALID_BLOCK) + 40, oversized=oversized
+        )
+        validator = ParallelValidator(config)
+        results = [errors for _, _, errors in validator.validate(FileScanner(config).discover_files())]
+
+        assert [warning['file'] for warning in validator.warnings] == [str(tmppath / 'huge.py')]
+        assert results == ([] if oversized == 'skip' else [[]])
+
+
+def test_cli_time_budget_emits_partial_report(capsys, monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        for n in range(5):
+            (tmppath / f'm{n}.py').write_text(VALID_BLOCK)
+        (tmppath / 'big.py').write_text('x = 1\n' * 1000)
+
+        monkeypatch.setattr(
+            'sys.argv',
+            [
+                'cli', '--repo-path', tmpdir, '--jobs', '1', '--output-format', 'json',
+                '--time-budget', '0.000001', '--max-file-size', '1K',
+            ],
+        )
+        assert main() == 1
+
+        captured = capsys.readouterr()
+        report = json.loads(captured.out)
+        assert report['summary']['truncated'] is True
+        assert report['summary']['stop_reason'] == 'time_budget'
+        assert report['summary']['total_files'] == 1
+        assert 'Run statistics:' in captured.err
+
+
+def test_cli_time_budget_stops_during_discovery(capsys, monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        (Path(tmpdir) / 'sub').mkdir()
+        (Path(tmpdir) / 'sub' / 'm.py').write_text(VALID_BLOCK)
+
+        monkeypatch.setattr(
+            'sys.argv',
+            ['cli', '--repo-path', tmpdir, '--jobs', '1', '--output-format', 'json', '--time-budget', '0.000001'],
+        )
+        assert main() == 1
+
+        report = json.loads(capsys.readouterr().out)
+        assert report['summary']['truncated'] is True
+        assert report['summary']['stop_reason'] == 'time_budget'
+        assert report['summary']['total_files'] == 0
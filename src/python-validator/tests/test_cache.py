@@ -0,0 +1,107 @@
+"""Tests for the persistent validation cache."""
+
+import os
+import tempfile
+from pathlib import Path
+
+from ai_code_validator.cache import ValidationCache
+from ai_code_validator.config import Config
+from ai_code_validator.parallel import ParallelValidator
+from ai_code_validator.scanner import FileScanner
+
+INVALID_BLOCK = '''
+# START_AI_GENERATED_CODE
+# TOOL_NAME: GPT-4
+# ACTION: GENERATED
+# END_AI_GENERATED_CODE
+'''
+
+
+def _run(config: Config) -> list:
+    validator = ParallelValidator(config)
+    return list(validator.validate(FileScanner(config).discover_files()))
+
+
+def test_warm_run_skips_reading(monkeypatch):
+    """Test that unchanged files are served from the cache without reading."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        (tmppath / 'bad.py').write_text(INVALID_BLOCK)
+        (tmppath / 'plain.py').write_text('# Plain')
+
+        config = Config(repo_path=tmpdir, jobs=1, cache_dir=str(tmppath / '.cache'))
+        cold = _run(config)
+
+        def fail_read(self, file_path):
+            raise AssertionError(f'unexpected read of {file_path}')
+
+        monkeypatch.setattr(FileScanner, 'read_buffer', fail_read)
+        warm = _run(config)
+
+        assert warm == cold
+        assert any(errors for _, _, errors in warm)
+
+
+def test_modified_file_is_revalidated():
+    """Test that content changes invalidate the cached entry."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        target = tmppath / 'module.py'
+        target.write_text('# Plain')
+
+        config = Config(repo_path=tmpdir, jobs=1, cache_dir=str(tmppath / '.cache'))
+        assert _run(config)[0][2] == []
+
+        target.write_text(INVALID_BLOCK)
+        os.utime(target, ns=(1, 1))
+        assert _run(config)[0][2] != []
+
+
+def test_fingerprint_change_clears_entries():
+    """Test that a different rule set discards cached results."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        target = tmppath / 'module.py'
+        target.write_text('# Plain')
+        stat = target.stat()
+
+        cache = ValidationCache(tmppath / '.cache', fingerprint='rules-1')
+        cache.store(target, stat, 'digest', [], [])
+        cache.close()
+
+        cache = ValidationCache(tmppath / '.cache', fingerprint='rules-2')
+        assert cache.lookup_stat(target, stat) is None
+        cache.close()
+
+
+def test_lru_eviction_bounds_size():
+    """Test that the least recently used entries are evicted."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        cache = ValidationCache(tmppath / '.cache', max_entries=2, fingerprint='rules')
+        paths = []
+        for name in ['a.py', 'b.py', 'c.py']:
+            path = tmppath / name
+            path.write_text('# Plain')
+            paths.append(path)
+            cache.store(path, path.stat(), name, [], [])
+            cache.flush()
+
+        assert cache.lookup_stat(paths[0], paths[0].stat()) is None
+        assert cache.lookup_stat(paths[2], paths[2].stat()) is not None
+        cache.close()
+
+
+def test_file_deleted_after_discovery_is_skipped():
+    """Test that a file removed between discovery and validation does not abort the run."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        (tmppath / 'gone.py').write_text(INVALID_BLOCK)
+        (tmppath / 'kept.py').write_text('# Plain')
+
+        config = Config(repo_path=tmpdir, jobs=1, cache_dir=str(tmppath / '.cache'))
+        paths = list(FileScanner(config).discover_files())
+        (tmppath / 'gone.py').unlink()
+        results = list(ParallelValidator(config).validate(paths))
+
+        assert [path.name for path, _, _ in results] == ['kept.py']
@@ -97,3 +97,166 @@ def test_cli_custom_file_patterns(capsys, monkeypatch):
         captured = capsys.readouterr()
         # Should only scan .js files and find no errors (they don't have annotations)
         assert result == 0
+
+
+def test_cli_jobs_option(capsys, monkeypatch):
+    """Test CLI with an explicit worker count."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+
+        (tmppath / 'a.py').write_text('# START_AI_GENERATED_CODE\n')
+        (tmppath / 'b.py').write_text('# Plain')
+
+        monkeypatch.setattr(
+            'sys.argv',
+            ['cli', '--repo-path', tmpdir, '--jobs', '2', '--output-format', 'json'],
+        )
+        result = main()
+
+        captured = capsys.readouterr()
+        assert result == 1
+        assert '"total_files": 2' in captured.out
+
+
+def test_cli_stats_json(capsys, monkeypatch):
+    """Test that --stats json prints counters to stderr."""
+    import json
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+
+        (tmppath / 'a.py').write_text('# Plain')
+        (tmppath / 'node_modules').mkdir()
+
+        monkeypatch.setattr(
+            'sys.argv',
+            ['cli', '--repo-path', tmpdir, '--stats', 'json', '--output-format', 'json'],
+        )
+        assert main() == 0
+
+        captured = capsys.readouterr()
+        stats = json.loads(captured.err)['stats']
+        assert stats['counters']['files_scanned'] == 1
+        assert stats['counters']['fast_path_files'] == 1
+        assert stats['counters']['excluded_entries'] == 1
+        assert set(stats['phases']) == {'discovery', 'reading', 'parsing', 'reporting'}
+
+
+def test_cli_io_concurrency_option(capsys, monkeypatch):
+    """Test CLI with the asyncio I/O pipeline."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+
+        (tmppath / 'a.py').write_text('# START_AI_GENERATED_CODE\n')
+        (tmppath / 'sub').mkdir()
+        (tmppath / 'sub' / 'b.py').write_text('# Plain')
+
+        monkeypatch.setattr(
+            'sys.argv',
+            ['cli', '--repo-path', tmpdir, '--io-concurrency', '4', '--output-format', 'json'],
+        )
+        result = main()
+
+        captured = capsys.readouterr()
+        assert result == 1
+        assert '"total_files": 2' in captured.out
+
+
+def test_cli_index_and_query(capsys, monkeypatch):
+    """Test the index and query subcommands."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        (tmppath / 'a.py').write_text('''# START_AI_GENERATED_CODE
+# TOOL_NAME: Copilot
+# DATE: 2025-01-10
+# AUTHOR_ID: alice
+# ACTION: GENERATED
+# END_AI_GENERATED_CODE
+''')
+
+        monkeypatch.setattr('sys.argv', ['cli', 'index', '--repo-path', tmpdir])
+        assert main() == 0
+        assert 'Indexed 1 files (1 updated, 0 removed)' in capsys.readouterr().out
+
+        monkeypatch.setattr(
+            'sys.argv', ['cli', 'query', '--repo-path', tmpdir, '--author', 'alice', '--count']
+        )
+        assert main() == 0
+        assert capsys.readouterr().out.strip() == '1'
+
+
+def test_cli_shard_and_merge(capsys, monkeypatch):
+    """Test that merged shard reports match an unsharded run."""
+    import json
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        for n in range(10):
+            (tmppath / f'm{n}.py').write_text('# START_AI_GENERATED_CODE\n' if n % 2 else '# Plain')
+
+        reports = []
+        for index in (1, 2):
+            monkeypatch.setattr(
+                'sys.argv',
+                ['cli', '--repo-path', tmpdir, '--shard', f'{index}/2', '--output-format', 'json'],
+            )
+            main()
+            report = tmppath / f'shard{index}.json'
+            report.write_text(capsys.readouterr().out)
+            reports.append(str(report))
+
+        monkeypatch.setattr('sys.argv', ['cli', 'merge', '--output-format', 'json', *reports])
+        assert main() == 1
+        merged = json.loads(capsys.readouterr().out)
+        assert merged['summary'] == {'total_files': 10, 'files_with_errors': 5, 'total_errors': 5}
+
+
+def test_cli_max_errors_truncates_report(capsys, monkeypatch):
+    """Test that --max-errors and --fail-fast stop early with a truncated summary."""
+    import json
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        for n in range(6):
+            # Two errors per file: missing DATE and AUTHOR_ID
+            (tmppath / f'm{n}.py').write_text(
+                '# START_AI_GENERATED_CODE\n# TOOL_NAME: GPT-4\n# ACTION: GENERATED\n'
+                '# END_AI_GENERATED_CODE\n'
+            )
+
+        monkeypatch.setattr(
+            'sys.argv',
+            ['cli', '--repo-path', tmpdir, '--max-errors', '3', '--jobs', '1', '--output-format', 'json'],
+        )
+        assert main() == 1
+        report = json.loads(capsys.readouterr().out)
+        assert report['summary'] == {
+            'total_files': 2,
+            'files_with_errors': 2,
+            'total_errors': 3,
+            'truncated': True,
+            'stop_reason': 'max_errors',
+        }
+
+        monkeypatch.setattr(
+            'sys.argv',
+            ['cli', '--repo-path', tmpdir, '--fail-fast', '--output-format', 'ndjson'],
+        )
+        assert main() == 1
+        records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+        assert [record['type'] for record in records] == ['error', 'summary']
+        assert records[-1]['summary']['truncated'] is True
+
+        # Reaching the limit exactly truncates only if files remain unchecked
+        monkeypatch.setattr(
+            'sys.argv',
+            ['cli', '--repo-path', tmpdir, '--max-errors', '4', '--jobs', '1', '--output-format', 'json'],
+        )
+        assert main() == 1
+        report = json.loads(capsys.readouterr().out)
+        assert report['summary']['total_errors'] == 4
+        assert report['summary']['truncated'] is True
+
+        monkeypatch.setattr('sys.argv', ['cli', '--repo-path', tmpdir, '--max-errors', '12'])
+        assert main() == 1
+        assert 'Stopped early' not in capsys.readouterr().out
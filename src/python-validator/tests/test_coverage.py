@@ -0,0 +1,109 @@
+"""Tests for AI code coverage metrics."""
+
+import tempfile
+from pathlib import Path
+
+from ai_code_validator.config import Config
+from ai_code_validator.coverage import CoverageMetrics
+from ai_code_validator.parallel import ParallelValidator
+from ai_code_validator.parser import AnnotationBlock
+from ai_code_validator.reader import FileBuffer
+from ai_code_validator.scanner import FileScanner
+
+
+def _block(tool: str, author: str, body_lines: int) -> str:
+    header = [
+        '# START_AI_GENERATED_CODE',
+        f'# TOOL_NAME: {tool}',
+        '# DATE: 2025-02-15',
+        f'# AUTHOR_ID: {author}',
+        '# ACTION: GENERATED',
+    ]
+    body = [f'x{n} = {n}' for n in range(body_lines)]
+    return '\n'.join(header + body + ['# END_AI_GENERATED_CODE']) + '\n'
+
+
+def _make_repo(tmppath: Path) -> None:
+    for index in range(12):
+        directory = tmppath / f'pkg{index % 3}' / 'sub'
+        directory.mkdir(parents=True, exist_ok=True)
+        content = '# plain\n' * 10
+        if index % 2:
+            content += _block('Copilot' if index % 4 == 1 else 'GPT-4', f'dev-{index % 3}', index)
+        (directory / f'module{index}.py').write_text(content)
+    (tmppath / 'top.py').write_text('a = 1\nb = 2')
+
+
+def _coverage(config: Config, chunk_size: int = 256) -> dict:
+    coverage = CoverageMetrics(config.repo_path, directory_depth=2)
+    validator = ParallelValidator(config, chunk_size=chunk_size, coverage=coverage)
+    list(validator.validate(FileScanner(config).discover_files()))
+    return coverage.to_dict()
+
+
+def test_total_lines():
+    """Test line counting matches str.splitlines."""
+    for data in [b'', b'a', b'a\n', b'a\nb', b'a\r\nb\r\n', b'a\rb\r', b'\n\n']:
+        assert FileBuffer(data).total_lines() == len(data.decode().splitlines())
+
+
+def test_add_file_groups():
+    """Test per-directory, tool and author aggregation."""
+    metrics = CoverageMetrics(Path('/repo'))
+    block = AnnotationBlock(Path('/repo/src/a.py'), 1, 12, 'Copilot', None, '2025-02-15', 'alice', 'GENERATED')
+    metrics.add_file(Path('/repo/src/a.py'), 40, [block])
+    metrics.add_file(Path('/repo/README.py'), 10, [])
+
+    result = metrics.to_dict()
+    assert result['ai_lines'] == 10
+    assert result['total_lines'] == 50
+    assert result['ratio'] == 0.2
+    assert result['by_directory'] == {
+        '.': {'total_lines': 10, 'ai_lines': 0, 'ratio': 0.0},
+        'src': {'total_lines': 40, 'ai_lines': 10, 'ratio': 0.25},
+    }
+    assert result['by_tool'] == {'Copilot': {'ai_lines': 10, 'blocks': 1}}
+    assert result['by_author'] == {'alice': {'ai_lines': 10, 'blocks': 1}}
+
+
+def test_pool_and_cache_match_serial():
+    """Test that pooled runs and cache hits produce the same metrics."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        _make_repo(tmppath)
+
+        serial = _coverage(Config(repo_path=tmpdir, jobs=1))
+        assert serial['files'] == 13
+        assert serial['by_directory']['pkg0/sub']['total_lines'] > 0
+        assert set(serial['by_tool']) == {'Copilot', 'GPT-4'}
+
+        assert _coverage(Config(repo_path=tmpdir, jobs=2), chunk_size=3) == serial
+
+        cached = Config(repo_path=tmpdir, jobs=1, cache_dir=str(tmppath / '.cache'))
+        assert _coverage(cached) == serial
+        assert _coverage(cached) == serial
+
+
+def test_cache_without_line_counts_misses_under_coverage():
+    """Test that entries stored without coverage are revalidated, not counted as hits."""
+    from ai_code_validator.cache import ValidationCache, content_digest
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        _make_repo(tmppath)
+        config = Config(repo_path=tmpdir, jobs=1, cache_dir=str(tmppath / '.cache'))
+        list(ParallelValidator(config).validate(FileScanner(config).discover_files()))
+
+        cache = ValidationCache(config.cache_dir)
+        target = tmppath / 'top.py'
+        assert cache.lookup_stat(target, target.stat())[2] is None
+        assert cache.lookup_stat(target, target.stat(), need_line_count=True) is None
+        assert cache.lookup_digest(
+            target, target.stat(), content_digest(target.read_bytes()), need_line_count=True
+        ) is None
+        assert (cache.hits, cache.misses) == (1, 1)
+        cache.close()
+
+        serial = _coverage(Config(repo_path=tmpdir, jobs=1))
+        assert _coverage(config) == serial
+        assert _coverage(config) == serial
@@ -0,0 +1,83 @@
+"""Tests for the validation daemon and its client."""
+
+import json
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from ai_code_validator.config import Config
+from ai_code_validator.daemon import ValidationDaemon, send_request
+
+INVALID_BLOCK = '''# START_AI_GENERATED_CODE
+# TOOL_NAME: GPT-4
+# END_AI_GENERATED_CODE
+'''
+
+
+def _start(daemon: ValidationDaemon) -> threading.Thread:
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not daemon.socket_path.exists():
+        assert time.monotonic() < deadline, 'daemon did not start'
+        time.sleep(0.01)
+    return thread
+
+
+def test_daemon_check_refresh_and_shutdown():
+    """Test that the daemon answers from memory and picks up edits."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        (tmppath / 'a.py').write_text(INVALID_BLOCK)
+        socket_path = tmppath / 'd.sock'
+
+        daemon = ValidationDaemon(Config(repo_path=tmpdir, jobs=1), socket_path, poll_interval=60)
+        thread = _start(daemon)
+        try:
+            response = send_request(socket_path, {'command': 'check', 'format': 'json'})
+            assert response['exit_code'] == 1
+            assert json.loads(response['output'])['summary']['files_with_errors'] == 1
+
+            (tmppath / 'a.py').unlink()
+            (tmppath / 'b.py').write_text('# Plain')
+            response = send_request(socket_path, {'command': 'check', 'refresh': True})
+            assert response['exit_code'] == 0
+            assert 'Total files scanned: 1' in response['output']
+
+            response = send_request(socket_path, {'command': 'bogus'})
+            assert response['exit_code'] == 2
+        finally:
+            send_request(socket_path, {'command': 'shutdown'})
+            thread.join(10)
+
+        assert not thread.is_alive()
+        assert not socket_path.exists()
+
+
+def test_poll_survives_a_failed_refresh(capsys):
+    """Test that an exception in one background refresh does not stop polling."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        daemon = ValidationDaemon(Config(repo_path=tmpdir, jobs=1), poll_interval=0.01)
+        calls = []
+
+        def refresh():
+            calls.append(None)
+            if len(calls) == 1:
+                raise FileNotFoundError('vanished.py')
+            daemon._stopped.set()
+
+        daemon.refresh = refresh
+        daemon._poll()
+
+        assert len(calls) == 2
+        assert 'Refresh failed: vanished.py' in capsys.readouterr().err
+
+
+def test_client_without_daemon():
+    """Test that the client reports a missing daemon clearly."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with pytest.raises(RuntimeError, match='No validator daemon'):
+            send_request(Path(tmpdir) / 'missing.sock', {'command': 'status'})
@@ -0,0 +1,124 @@
+"""Tests for the git-backed file sources."""
+
+import io
+import subprocess
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from ai_code_validator.cli import main
+from ai_code_validator.config import Config
+from ai_code_validator.parallel import ParallelValidator
+from ai_code_validator.gitsource import changed_files_since, read_path_list, staged_files, tree_entries
+
+INVALID_BLOCK = '''
+# START_AI_GENERATED_CODE
+# TOOL_NAME: GPT-4
+# ACTION: GENERATED
+# END_AI_GENERATED_CODE
+'''
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ['git', '-c', 'user.name=test', '-c', 'user.email=test@example.com', *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir).resolve()
+        _git(path, 'init', '-q')
+        (path / 'committed.py').write_text('# Plain')
+        _git(path, 'add', '.')
+        _git(path, 'commit', '-q', '-m', 'initial')
+        yield path
+
+
+def test_staged_files_lists_index_changes(repo):
+    """Test that only staged files are listed."""
+    (repo / 'staged.py').write_text('# Staged')
+    (repo / 'untracked.py').write_text('# Untracked')
+    _git(repo, 'add', 'staged.py')
+
+    assert staged_files(repo) == [repo / 'staged.py']
+
+
+def test_changed_files_since_revision(repo):
+    """Test listing files changed since a revision."""
+    (repo / 'committed.py').write_text('# Modified')
+
+    assert changed_files_since(repo, 'HEAD') == [repo / 'committed.py']
+
+
+def test_read_path_list_accepts_nul_separated():
+    """Test reading NUL-separated path lists."""
+    paths = read_path_list(io.StringIO('a.py\0sub/b.py\0'), Path('/repo'))
+    assert paths == [Path('/repo/a.py'), Path('/repo/sub/b.py')]
+
+
+def test_cli_staged_validates_index_contents(repo, capsys, monkeypatch):
+    """Test that --staged validates the staged blob, not the working tree."""
+    (repo / 'module.py').write_text(INVALID_BLOCK)
+    _git(repo, 'add', 'module.py')
+    (repo / 'module.py').write_text('# Fixed in the working tree only')
+
+    monkeypatch.setattr('sys.argv', ['cli', '--repo-path', str(repo), '--staged'])
+    result = main()
+
+    captured = capsys.readouterr()
+    assert result == 1
+    assert 'Total files scanned: 1' in captured.out
+
+
+def test_tree_entries_lists_blobs(repo):
+    """Test listing a revision's files with their blob ids."""
+    (repo / 'pkg').mkdir()
+    (repo / 'pkg' / 'copy.py').write_text('# Plain')
+    (repo / 'link.py').symlink_to('committed.py')
+    _git(repo, 'add', '.')
+    _git(repo, 'commit', '-q', '-m', 'more')
+
+    entries = dict(tree_entries(repo, 'HEAD'))
+    assert set(entries) == {'committed.py', 'pkg/copy.py'}
+    assert entries['committed.py'] == entries['pkg/copy.py']
+    assert dict(tree_entries(repo / 'pkg', 'HEAD')) == {'copy.py': entries['pkg/copy.py']}
+
+
+def test_validate_objects_reads_each_blob_once(repo):
+    """Test that identical blobs are read and validated once."""
+    items = [(repo / f'copy{n}.py', 'blob-1') for n in range(3)]
+    reads = []
+
+    def read_object(object_id):
+        reads.append(object_id)
+        return INVALID_BLOCK.encode()
+
+    results = list(ParallelValidator(Config(repo_path=str(repo))).validate_objects(items, read_object))
+
+    assert reads == ['blob-1']
+    assert [path for path, _, _ in results] == [path for path, _ in items]
+    assert all(error.file_path == path for path, _, errors in results for error in errors)
+
+
+def test_cli_git_rev_validates_without_checkout(repo, capsys, monkeypatch):
+    """Test validating a past revision after the working tree changed."""
+    (repo / 'bad.py').write_text(INVALID_BLOCK)
+    _git(repo, 'add', '.')
+    _git(repo, 'commit', '-q', '-m', 'bad')
+    _git(repo, 'rm', '-q', 'bad.py')
+    _git(repo, 'commit', '-q', '-m', 'fix')
+
+    monkeypatch.setattr(
+        'sys.argv', ['cli', '--repo-path', str(repo), '--git-rev', 'HEAD~1', '--output-format', 'json']
+    )
+    assert main() == 1
+    assert '"total_files": 2' in capsys.readouterr().out
+
+    monkeypatch.setattr('sys.argv', ['cli', '--repo-path', str(repo), '--git-rev', 'HEAD'])
+    assert main() == 0
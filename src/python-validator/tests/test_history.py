@@ -0,0 +1,158 @@
+"""Tests for the commit range audit."""
+
+import subprocess
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from ai_code_validator.config import Config
+from ai_code_validator.history import HistoryAudit, format_audit_text
+
+INVALID_BLOCK = '''
+# START_AI_GENERATED_CODE
+# TOOL_NAME: GPT-4
+# DATE: 2025-02-15
+# AUTHOR_ID: dev
+# ACTION: GENERATED
+'''
+
+
+def _git(repo: Path, *args: str) -> str:
+    completed = subprocess.run(
+        ['git', '-c', 'user.name=test', '-c', 'user.email=test@example.com', *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return completed.stdout.strip()
+
+
+def _commit(repo: Path, message: str) -> str:
+    _git(repo, 'add', '-A')
+    _git(repo, 'commit', '-q', '-m', message)
+    return _git(repo, 'rev-parse', 'HEAD')
+
+
+@pytest.fixture
+def history():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repo = Path(tmpdir).resolve()
+        _git(repo, 'init', '-q')
+        for n in range(5):
+            (repo / f'shared{n}.py').write_text(f'# Plain {n}')
+        base = _commit(repo, 'base')
+
+        (repo / 'feature.py').write_text(INVALID_BLOCK)
+        broken = _commit(repo, 'add feature')
+        (repo / 'other.py').write_text('# Other')
+        still = _commit(repo, 'unrelated')
+        (repo / 'feature.py').write_text(INVALID_BLOCK + '# END_AI_GENERATED_CODE\n')
+        fixed = _commit(repo, 'fix feature')
+        yield repo, base, [broken, still, fixed]
+
+
+def test_audit_reports_introduction_and_fix(history):
+    """Test per-commit validity and violation lifetimes."""
+    repo, base, (broken, still, fixed) = history
+    report = HistoryAudit(Config(repo_path=str(repo), jobs=1)).run(f'{base}..HEAD')
+
+    assert [commit['commit'] for commit in report['commits']] == [broken, still, fixed]
+    assert [commit['valid'] for commit in report['commits']] == [False, False, True]
+    assert not report['valid']
+    assert report['violations'] == [{
+        'file': 'feature.py',
+        'message': 'START_AI_GENERATED_CODE marker found but no matching END_AI_GENERATED_CODE',
+        'line': 2,
+        'introduced': broken,
+        'fixed': fixed,
+    }]
+    assert 'introduced in' in format_audit_text(report)
+
+
+def test_audit_validates_each_blob_once(history, monkeypatch):
+    """Test that blobs shared between commits are read only once."""
+    from ai_code_validator.gitsource import CatFileBatch
+
+    repo, base, _ = history
+    reads = []
+    original = CatFileBatch.read
+
+    def read(self, object_name):
+        reads.append(object_name)
+        return original(self, object_name)
+
+    monkeypatch.setattr(CatFileBatch, 'read', read)
+    report = HistoryAudit(Config(repo_path=str(repo), jobs=1)).run(f'{base}..HEAD')
+
+    # Base tree (5 shared blobs), two feature versions and other.py
+    assert len(reads) == len(set(reads)) == report['summary']['unique_blobs'] == 8
+    assert report['summary']['files_checked'] == 6 + 7 + 7
+
+
+def test_audit_reports_fixes_of_older_violations(history):
+    """Test that a violation from before the range is reported when the range fixes it."""
+    repo, base, (broken, still, fixed) = history
+    report = HistoryAudit(Config(repo_path=str(repo), jobs=1)).run(f'{still}..HEAD')
+
+    assert report['violations'] == [{
+        'file': 'feature.py',
+        'message': 'START_AI_GENERATED_CODE marker found but no matching END_AI_GENERATED_CODE',
+        'line': 2,
+        'introduced': None,
+        'fixed': fixed,
+    }]
+    assert 'introduced before the range' in format_audit_text(report)
+
+
+def test_audit_reports_the_line_of_each_repeated_violation(history):
+    """Test that repeats of one message in a file keep their own lines."""
+    repo, _, (_, _, fixed) = history
+    missing_date = INVALID_BLOCK.replace('# DATE: 2025-02-15\n', '') + '# END_AI_GENERATED_CODE\n'
+    (repo / 'repeat.py').write_text(missing_date + '\n' * 3 + missing_date)
+    repeated = _commit(repo, 'add repeated violations')
+
+    report = HistoryAudit(Config(repo_path=str(repo), jobs=1)).run(f'{fixed}..HEAD')
+
+    assert [(violation['line'], violation['introduced']) for violation in report['violations']] == [
+        (2, repeated),
+        (11, repeated),
+    ]
+
+
+def test_audit_follows_violations_through_merges():
+    """Test that a violation merged in from a side branch is reported once."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repo = Path(tmpdir).resolve()
+        _git(repo, 'init', '-q', '-b', 'main')
+        (repo / 'a.py').write_text('# Plain')
+        base = _commit(repo, 'base')
+
+        _git(repo, 'checkout', '-q', '-b', 'side')
+        (repo / 'b.py').write_text(INVALID_BLOCK)
+        side = _commit(repo, 'side: add b')
+        _git(repo, 'checkout', '-q', 'main')
+        (repo / 'c.py').write_text('# Other')
+        _commit(repo, 'main: add c')
+        _git(repo, '-c', 'user.name=test', 'merge', '-q', '--no-ff', '-m', 'merge side', 'side')
+        (repo / 'b.py').write_text(INVALID_BLOCK + '# END_AI_GENERATED_CODE\n')
+        fixed = _commit(repo, 'fix b')
+
+        report = HistoryAudit(Config(repo_path=str(repo), jobs=1)).run(f'{base}..HEAD')
+
+        assert [(v['file'], v['introduced'], v['fixed']) for v in report['violations']] == [
+            ('b.py', side, fixed),
+        ]
+
+
+def test_audit_lists_violations_open_throughout_the_range(history):
+    """Test that a violation older than the range and never fixed is still listed."""
+    repo, base, (broken, still, fixed) = history
+    report = HistoryAudit(Config(repo_path=str(repo), jobs=1)).run(f'{broken}..{still}')
+
+    assert report['summary']['invalid_commits'] == 1
+    assert [(v['file'], v['line'], v['introduced'], v['fixed']) for v in report['violations']] == [
+        ('feature.py', 2, None, None),
+    ]
+    assert 'introduced before the range, not fixed' in format_audit_text(report)
@@ -0,0 +1,79 @@
+"""Tests for gitignore-style exclusion rules."""
+
+import tempfile
+from pathlib import Path
+
+from ai_code_validator.config import Config
+from ai_code_validator.ignore import IgnoreRules
+from ai_code_validator.scanner import FileScanner
+
+
+def _scan(root: Path, **kwargs) -> list[str]:
+    config = Config(repo_path=str(root), **kwargs)
+    return sorted(
+        path.relative_to(config.repo_path).as_posix()
+        for path in FileScanner(config).discover_files()
+    )
+
+
+def test_ignore_rules_follow_gitignore_semantics():
+    """Test anchoring, directory-only patterns, globstars and negation."""
+    rules = IgnoreRules([
+        '# comment',
+        '*.gen.py',
+        '!keep.gen.py',
+        'target/',
+        '/top.py',
+        'docs/**/draft_*.py',
+    ])
+
+    assert rules.match('a/b/x.gen.py', is_dir=False) is True
+    assert rules.match('a/keep.gen.py', is_dir=False) is False
+    assert rules.match('sub/target', is_dir=True) is True
+    assert rules.match('target', is_dir=False) is None
+    assert rules.match('top.py', is_dir=False) is True
+    assert rules.match('sub/top.py', is_dir=False) is None
+    assert rules.match('docs/draft_1.py', is_dir=False) is True
+    assert rules.match('docs/a/b/draft_2.py', is_dir=False) is True
+    assert rules.match('src/docs/draft_3.py', is_dir=False) is None
+
+
+def test_scanner_respects_hierarchical_ignore_files():
+    """Test .gitignore, nested overrides, .git/info/exclude and validator ignores."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        (root / '.git' / 'info').mkdir(parents=True)
+        (root / '.git' / 'info' / 'exclude').write_text('local.py\n')
+        (root / '.gitignore').write_text('target/\n.next/\n*.gen.py\n')
+        (root / '.ai-validator-ignore').write_text('fixtures/\n')
+
+        for relative in [
+            'main.py',
+            'local.py',
+            'target/debug/build.py',
+            '.next/server/page.js',
+            'pkg/model.gen.py',
+            'pkg/keep.gen.py',
+            'fixtures/broken.py',
+            'foo.egg-info/setup.py',
+        ]:
+            path = root / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text('# code')
+        (root / 'pkg' / '.gitignore').write_text('!keep.gen.py\n')
+
+        assert _scan(root) == ['main.py', 'pkg/keep.gen.py']
+        assert 'target/debug/build.py' in _scan(root, respect_gitignore=False)
+
+
+def test_parent_gitignore_applies_to_subdirectory_scan():
+    """Test that ignore files above the scan root are honoured."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        (root / '.git').mkdir()
+        (root / '.gitignore').write_text('src/generated/\n')
+        (root / 'src' / 'generated').mkdir(parents=True)
+        (root / 'src' / 'generated' / 'api.py').write_text('# code')
+        (root / 'src' / 'app.py').write_text('# code')
+
+        assert _scan(root / 'src') == ['app.py']
@@ -0,0 +1,220 @@
+"""Tests for change detection and incremental validation."""
+
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from ai_code_validator.config import Config
+from ai_code_validator.incremental import IncrementalValidator
+from ai_code_validator.reporter import ResultReporter
+from ai_code_validator.scanner import FileScanner
+from ai_code_validator.watcher import InotifyWatcher, PollingWatcher, create_watcher, watch
+
+INVALID_BLOCK = '''# START_AI_GENERATED_CODE
+# TOOL_NAME: GPT-4
+# END_AI_GENERATED_CODE
+'''
+
+
+def _touch(path: Path, content: str) -> None:
+    """Write a file and move its mtime forward so the change is visible."""
+    stat = path.stat() if path.exists() else None
+    path.write_text(content)
+    if stat is not None:
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_polling_watcher_reports_changes():
+    """Test that polls report added, modified and deleted files."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        (tmppath / 'a.py').write_text('a')
+        (tmppath / 'b.py').write_text('b')
+
+        watcher = PollingWatcher(FileScanner(Config(repo_path=tmpdir)))
+        first = watcher.poll()
+        assert sorted(first.added) == [tmppath / 'a.py', tmppath / 'b.py']
+        assert not watcher.poll()
+
+        _touch(tmppath / 'a.py', 'changed')
+        (tmppath / 'b.py').unlink()
+        (tmppath / 'c.py').write_text('c')
+        changes = watcher.poll()
+        assert changes.added == [tmppath / 'c.py']
+        assert changes.modified == [tmppath / 'a.py']
+        assert changes.deleted == [tmppath / 'b.py']
+
+
+def test_incremental_result_matches_full_scan():
+    """Test that the incremental result follows edits like a fresh scan would."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        (tmppath / 'a.py').write_text(INVALID_BLOCK)
+        (tmppath / 'b.py').write_text('# Plain')
+
+        reporter = ResultReporter()
+        validator = IncrementalValidator(Config(repo_path=tmpdir, jobs=1))
+        validator.refresh()
+        result = validator.result(reporter)
+        assert not result.valid
+        assert result.summary['total_files'] == 2
+
+        _touch(tmppath / 'a.py', '# Fixed')
+        (tmppath / 'b.py').unlink()
+        changes = validator.refresh()
+        assert changes.changed == [tmppath / 'a.py']
+
+        result = validator.result(reporter)
+        assert result.valid
+        assert result.summary['total_files'] == 1
+
+
+def test_files_deleted_before_revalidation_are_dropped():
+    """Test that a file vanishing between a poll and its read is dropped, not raised."""
+    from ai_code_validator.watcher import Changes
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        (tmppath / 'a.py').write_text(INVALID_BLOCK)
+        validator = IncrementalValidator(Config(repo_path=tmpdir, jobs=1))
+        validator.refresh()
+
+        (tmppath / 'a.py').unlink()
+        validator.apply(Changes(modified=[tmppath / 'a.py']))
+
+        assert validator.errors == {}
+
+
+def test_watch_debounces_bursts():
+    """Test that a burst of edits produces one report after the initial one."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        (tmppath / 'a.py').write_text('# Plain')
+
+        config = Config(repo_path=tmpdir, jobs=1)
+        validator = IncrementalValidator(config, create_watcher(FileScanner(config)))
+        reports = []
+        edits = iter(range(3))
+
+        def on_refresh(validator):
+            reports.append(validator.result(ResultReporter()))
+
+        original_wait = validator.watcher.wait
+
+        def wait(timeout):
+            # Three saves land during the burst, then the tree goes quiet
+            index = next(edits, None)
+            if index is not None:
+                _touch(tmppath / 'a.py', INVALID_BLOCK + '#' * index)
+            original_wait(0)
+
+        validator.watcher.wait = wait
+        try:
+            watch(validator, on_refresh, max_reports=2)
+        finally:
+            validator.watcher.close()
+
+        # All three saves were applied before the single follow-up report
+        assert next(edits, None) is None
+        assert [report.valid for report in reports] == [True, False]
+
+
+def _inotify_watcher(scanner: FileScanner, **kwargs) -> InotifyWatcher:
+    try:
+        return InotifyWatcher(scanner, **kwargs)
+    except (OSError, AttributeError):
+        pytest.skip('inotify is not available')
+
+
+def test_inotify_watcher_rescans_only_changed_directories():
+    """Test that inotify events limit polls to the directories they happened in."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        for name in ('a', 'b', 'c'):
+            (tmppath / name).mkdir()
+            (tmppath / name / 'm.py').write_text(name)
+        (tmppath / 'c' / 'sub').mkdir()
+        (tmppath / 'c' / 'sub' / 'n.py').write_text('n')
+
+        scanner = FileScanner(Config(repo_path=tmpdir))
+        watcher = _inotify_watcher(scanner)
+        listed = []
+        list_directory = scanner.list_directory
+
+        def record(directory, *args):
+            listed.append(Path(directory).relative_to(tmppath).as_posix())
+            return list_directory(directory, *args)
+
+        scanner.list_directory = record
+        try:
+            assert len(watcher.poll().added) == 4
+            listed.clear()
+
+            _touch(tmppath / 'a' / 'm.py', 'changed')
+            (tmppath / 'b' / 'new').mkdir()
+            (tmppath / 'b' / 'new' / 'x.py').write_text('x')
+            (tmppath / 'c' / 'sub' / 'n.py').unlink()
+            (tmppath / 'c' / 'sub').rmdir()
+            watcher.wait(0)
+            changes = watcher.poll()
+
+            assert sorted(listed) == ['a', 'b', 'b/new', 'c']
+            assert changes.modified == [tmppath / 'a' / 'm.py']
+            assert changes.added == [tmppath / 'b' / 'new' / 'x.py']
+            assert changes.deleted == [tmppath / 'c' / 'sub' / 'n.py']
+            assert set(watcher.states) == {
+                tmppath / 'a' / 'm.py', tmppath / 'b' / 'm.py', tmppath / 'b' / 'new' / 'x.py', tmppath / 'c' / 'm.py'
+            }
+
+            listed.clear()
+            assert not watcher.poll()
+            assert listed == []
+        finally:
+            watcher.close()
+
+
+def test_inotify_watcher_falls_back_to_full_walks():
+    """Test that a full walk runs once the fallback interval has passed."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        (tmppath / 'a.py').write_text('a')
+        watcher = _inotify_watcher(FileScanner(Config(repo_path=tmpdir)), full_walk_interval=3600)
+        try:
+            watcher.poll()
+            (tmppath / 'b.py').write_text('b')
+            # Simulate a lost event: only a full walk can find the new file
+            watcher.wait(0)
+            watcher._dirty.clear()
+            assert not watcher.poll()
+
+            watcher.full_walk_interval = 0
+            assert watcher.poll().added == [tmppath / 'b.py']
+        finally:
+            watcher.close()
+
+
+def test_watch_survives_a_failed_refresh(capsys):
+    """Test that a filesystem error during one refresh does not end watching."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config = Config(repo_path=tmpdir, jobs=1)
+        validator = IncrementalValidator(config, PollingWatcher(FileScanner(config)))
+        refresh = validator.refresh
+        calls = []
+
+        def flaky_refresh():
+            calls.append(None)
+            if len(calls) == 2:
+                raise FileNotFoundError('vanished.py')
+            if len(calls) == 3:
+                (Path(tmpdir) / 'a.py').write_text('# Plain')
+            return refresh()
+
+        validator.refresh = flaky_refresh
+        validator.watcher.wait = lambda timeout: None
+        reports = []
+        watch(validator, reports.append, max_reports=2)
+
+        assert len(reports) == 2
+        assert 'Refresh failed: vanished.py' in capsys.readouterr().err
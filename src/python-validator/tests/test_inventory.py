@@ -0,0 +1,79 @@
+"""Tests for the SQLite annotation inventory."""
+
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from ai_code_validator.config import Config
+from ai_code_validator.inventory import AnnotationInventory, normalize_date
+
+
+def _block(tool: str, author: str, date: str) -> str:
+    return f'''# START_AI_GENERATED_CODE
+# TOOL_NAME: {tool}
+# DATE: {date}
+# AUTHOR_ID: {author}
+# ACTION: GENERATED
+x = 1
+# END_AI_GENERATED_CODE
+'''
+
+
+def test_normalize_date():
+    """Test that dates and timestamps normalize to comparable UTC strings."""
+    assert normalize_date('2025-02-15') == '2025-02-15T00:00:00+00:00'
+    assert normalize_date('2025-02-15T12:00:00+02:00') == '2025-02-15T10:00:00+00:00'
+    assert normalize_date('2025-02-15T10:30:00Z') == '2025-02-15T10:30:00+00:00'
+    assert normalize_date('yesterday') is None
+
+
+def test_index_and_query():
+    """Test filtering indexed blocks by tool, author, date and path."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        (tmppath / 'src').mkdir()
+        (tmppath / 'src' / 'a.py').write_text(_block('Copilot', 'alice', '2025-01-10'))
+        (tmppath / 'src' / 'b.py').write_text(_block('GPT-4', 'bob', '2025-03-01T09:00:00Z'))
+        (tmppath / 'srcx.py').write_text(_block('Copilot', 'bob', '2025-02-01'))
+        (tmppath / 'bad.py').write_text('# START_AI_GENERATED_CODE\n# END_AI_GENERATED_CODE\n')
+
+        config = Config(repo_path=tmpdir, jobs=1)
+        inventory = AnnotationInventory(tmppath / 'inventory.sqlite3')
+        try:
+            assert inventory.update(config) == {'files': 4, 'updated': 4, 'removed': 0}
+
+            copilot = inventory.blocks(tool='Copilot')
+            assert [block['path'] for block in copilot] == ['src/a.py', 'srcx.py']
+            assert [b['path'] for b in inventory.blocks(author='bob', since='2025-02-15')] == ['src/b.py']
+            assert [b['path'] for b in inventory.blocks(until='2025-02-01')] == ['src/a.py']
+            assert [b['path'] for b in inventory.blocks(path_prefix='src')] == ['src/a.py', 'src/b.py']
+            assert {error['path'] for error in inventory.errors()} == {'bad.py'}
+
+            with pytest.raises(ValueError):
+                inventory.blocks(since='last week')
+        finally:
+            inventory.close()
+
+
+def test_update_is_incremental():
+    """Test that only changed files are re-read and deleted files are dropped."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        (tmppath / 'a.py').write_text(_block('Copilot', 'alice', '2025-01-10'))
+        (tmppath / 'b.py').write_text(_block('Copilot', 'bob', '2025-01-10'))
+
+        config = Config(repo_path=tmpdir, jobs=1)
+        inventory = AnnotationInventory(tmppath / 'inventory.sqlite3')
+        try:
+            inventory.update(config)
+            assert inventory.update(config) == {'files': 2, 'updated': 0, 'removed': 0}
+
+            (tmppath / 'a.py').write_text(_block('GPT-4', 'alice', '2025-01-10'))
+            os.utime(tmppath / 'a.py', ns=(1, 1))
+            (tmppath / 'b.py').unlink()
+            assert inventory.update(config) == {'files': 1, 'updated': 1, 'removed': 1}
+            assert [block['tool_name'] for block in inventory.blocks()] == ['GPT-4']
+        finally:
+            inventory.close()
@@ -0,0 +1,86 @@
+"""Tests for the process-pool execution mode."""
+
+import tempfile
+from pathlib import Path
+
+from ai_code_validator.config import Config
+from ai_code_validator.parallel import ParallelValidator
+from ai_code_validator.parser import AnnotationParser
+from ai_code_validator.scanner import FileScanner
+
+INVALID_BLOCK = '''
+# START_AI_GENERATED_CODE
+# TOOL_NAME: GPT-4
+# ACTION: GENERATED
+# END_AI_GENERATED_CODE
+'''
+
+
+def _make_repo(tmppath: Path) -> None:
+    for i in range(7):
+        subdir = tmppath / f'pkg{i % 3}'
+        subdir.mkdir(exist_ok=True)
+        (subdir / f'module{i}.py').write_text(INVALID_BLOCK if i % 2 else '# Plain')
+
+
+def test_parallel_matches_serial_order():
+    """Test that pooled validation yields the same results as a serial run."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _make_repo(Path(tmpdir))
+
+        config = Config(repo_path=tmpdir, jobs=2)
+        scanner = FileScanner(config)
+        parser = AnnotationParser()
+        serial = [
+            (path, parser.validate_file(path, content)[1])
+            for path, content in scanner.scan()
+        ]
+
+        validator = ParallelValidator(config, chunk_size=2)
+        parallel = [
+            (path, errors)
+            for path, _, errors in validator.validate(scanner.discover_files())
+        ]
+
+        assert parallel == serial
+        assert sum(len(errors) for _, errors in parallel) > 0
+
+
+def test_single_chunk_runs_in_process():
+    """Test that small inputs are validated without a pool."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _make_repo(Path(tmpdir))
+
+        config = Config(repo_path=tmpdir, jobs=4)
+        validator = ParallelValidator(config, chunk_size=100)
+        results = list(validator.validate(FileScanner(config).discover_files()))
+
+        assert len(results) == 7
+
+
+def test_fast_path_files_are_counted():
+    """Test that files without markers are reported as fast-path files."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _make_repo(Path(tmpdir))
+
+        config = Config(repo_path=tmpdir, jobs=2)
+        validator = ParallelValidator(config, chunk_size=2)
+        results = list(validator.validate(FileScanner(config).discover_files()))
+
+        assert len(results) == 7
+        assert validator.fast_path_files == 4
+
+
+def test_closing_validation_early_cancels_queued_chunks():
+    """Test that a consumer can stop after the first result without draining the pool."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        _make_repo(Path(tmpdir))
+
+        config = Config(repo_path=tmpdir, jobs=2)
+        validator = ParallelValidator(config, chunk_size=1)
+        results = validator.validate(FileScanner(config).discover_files())
+        first = next(results)
+        results.close()
+
+        assert first[0].suffix == '.py'
+        assert validator.fast_path_files < 4
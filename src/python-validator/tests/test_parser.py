@@ -127,3 +127,52 @@ def func2():
     assert len(blocks) == 2
     assert blocks[0].tool_name == 'Copilot'
     assert blocks[1].tool_name == 'GPT-4'
+
+
+def test_unmarked_content_takes_fast_path():
+    """Test that files without a START marker skip parsing and are counted."""
+    parser = AnnotationParser()
+
+    assert parser.may_contain_annotations(b'def plain():\n    pass\n') is False
+    assert parser.validate_file(Path('test.py'), 'x = 1\n# END_AI_GENERATED_CODE\n') == ([], [])
+    assert parser.may_contain_annotations(b'# START_AI_GENERATED_CODE\n') is True
+    assert parser.fast_path_files == 2
+
+
+def test_offset_parser_matches_line_parser():
+    """Differential test: the offset-based engine agrees with the line parser."""
+    import random
+
+    from ai_code_validator.parser import OffsetAnnotationParser
+
+    fragments = [
+        '# START_AI_GENERATED_CODE',
+        '// END_AI_GENERATED_CODE',
+        '# TOOL_NAME: Copilot',
+        '# TOOL_NAME:',
+        '# TOOL_VERSION: 1.2',
+        '# DATE: 2025-02-15T10:30:00Z',
+        '# DATE: 2025/02/15',
+        '  * AUTHOR_ID: dev-1 ',
+        '-- AUTHOR_ID:   ',
+        '# ACTION: GENERATED',
+        '# ACTION: MODIFIED',
+        'x = {"DATE": 1}',
+        'DATE: 2024-01-01',
+        'TOOL_NAMEND_AI_GENERATED_CODE',
+        '# START_AI_GENERATED_CODE END_AI_GENERATED_CODE',
+        'def f():\r',
+        'plain code',
+        '',
+    ]
+    rng = random.Random(1234)
+    reference = AnnotationParser()
+    engine = OffsetAnnotationParser()
+
+    for _ in range(2000):
+        lines = [rng.choice(fragments) for _ in range(rng.randint(0, 25))]
+        content = '\n'.join(lines)
+        offset = rng.randint(0, 3)
+        expected = reference.validate_file(Path('f.py'), content, line_offset=offset)
+        actual = engine.validate_file(Path('f.py'), content, line_offset=offset)
+        assert actual == expected, content
@@ -0,0 +1,41 @@
+"""Tests for the compiled file pattern matcher."""
+
+from ai_code_validator.config import DEFAULT_FILE_PATTERNS
+from ai_code_validator.patterns import FilePatternMatcher
+
+
+def test_extension_and_exact_name_patterns():
+    """Test *.ext suffixes and exact file names."""
+    matcher = FilePatternMatcher(['*.py', '*.gz', 'Dockerfile'])
+
+    assert matcher.suffixes == frozenset({'.py', '.gz'})
+    assert matcher.glob is None
+    assert matcher.matches('pkg/module.py')
+    assert matcher.matches('dist/archive.tar.gz')
+    assert matcher.matches('deploy/Dockerfile')
+    assert not matcher.matches('module.pyc')
+    assert not matcher.matches('Dockerfile.dev')
+
+
+def test_glob_patterns_use_gitignore_semantics():
+    """Test gitignore-style globs: ``*`` stays within a segment, ``**`` spans directories."""
+    matcher = FilePatternMatcher(['test_*.py', 'src/**/*.ts', 'scripts/*.sh', '*.py[iw]'])
+
+    assert matcher.matches('tests/unit/test_scanner.py')
+    assert not matcher.matches('tests/conftest.py')
+    assert matcher.matches('src/index.ts')
+    assert matcher.matches('src/a/b/c.ts')
+    assert not matcher.matches('lib/src/index.ts')
+    assert matcher.matches('scripts/build.sh')
+    assert not matcher.matches('scripts/ci/build.sh')
+    assert matcher.matches('stubs/module.pyi')
+
+
+def test_default_patterns_match_like_before():
+    """Test that the default patterns keep their suffix behaviour."""
+    matcher = FilePatternMatcher(DEFAULT_FILE_PATTERNS)
+
+    assert matcher.glob is None
+    assert matcher.matches('a/b/component.tsx')
+    assert matcher.matches('.py')
+    assert not matcher.matches('README.md')
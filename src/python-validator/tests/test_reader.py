@@ -0,0 +1,70 @@
+"""Tests for the byte-level file reader."""
+
+import tempfile
+from pathlib import Path
+
+from ai_code_validator.config import Config
+from ai_code_validator.parallel import ParallelValidator
+from ai_code_validator.parser import AnnotationParser
+from ai_code_validator.reader import FileBuffer, FileReader
+from ai_code_validator.scanner import FileScanner
+
+BLOCK = (
+    '# START_AI_GENERATED_CODE\n'
+    '# TOOL_NAME: GPT-4\n'
+    '# DATE: 2025-02-15T10:30:00Z\n'
+    '# AUTHOR_ID: user-1\n'
+    '# ACTION: GENERATED\n'
+    'x = 1\n'
+    '# END_AI_GENERATED_CODE\n'
+)
+
+
+def test_reader_reuses_buffer_and_maps_large_files():
+    """Test that small reads share a buffer and large files are mapped."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        (tmppath / 'small.py').write_bytes(b'small')
+        (tmppath / 'large.py').write_bytes(b'x' * 100 + b'START')
+
+        reader = FileReader(mmap_threshold=64, buffer_size=16)
+        small = reader.read(tmppath / 'small.py')
+        assert len(small) == 5
+        assert small.region(0, 5) == b'small'
+
+        large = reader.read(tmppath / 'large.py')
+        assert large.find(b'START') == 100
+        large.close()
+
+
+def test_count_lines_uses_universal_newlines():
+    """Test line counting across \\n, \\r\\n and lone \\r."""
+    buffer = FileBuffer(b'a\nb\r\nc\rd')
+    assert buffer.count_lines(len(buffer)) == 3
+    assert buffer.count_lines(3) == 1
+
+
+def test_region_decoding_matches_full_parse():
+    """Test that decoding only the marker region gives the same results."""
+    contents = [
+        '\n'.join(['# filler'] * 50) + '\n' + BLOCK + '\n'.join(['# tail'] * 50),
+        'header\r\n' + BLOCK.replace('\n', '\r\n') + 'trailer\r\n',
+        'a\rb\r' + BLOCK + '# START_AI_GENERATED_CODE\n# TOOL_NAME: x\n',
+        BLOCK.replace('# TOOL_NAME: GPT-4\n', '') + 'more\n' + BLOCK,
+    ]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        for index, content in enumerate(contents):
+            (tmppath / f'file{index}.py').write_bytes(content.encode('utf-8'))
+
+        config = Config(repo_path=tmpdir, jobs=1, mmap_threshold=256)
+        scanner = FileScanner(config)
+
+        parser = AnnotationParser()
+        expected = [
+            (path, *parser.validate_file(path, content))
+            for path, content in scanner.scan()
+        ]
+        actual = list(ParallelValidator(config).validate(scanner.discover_files()))
+
+        assert actual == expected
@@ -2,7 +2,7 @@
 
 from pathlib import Path
 
-from ai_code_validator.parser import AnnotationError
+from ai_code_validator.parser import AnnotationError, ErrorCode
 from ai_code_validator.reporter import ResultReporter
 
 
@@ -24,12 +24,14 @@ def test_generate_invalid_result():
         AnnotationError(
             file_path=Path('file1.py'),
             line_number=10,
-            message='Missing field',
+            code=ErrorCode.MISSING_FIELD,
+            args=('DATE',),
         ),
         AnnotationError(
             file_path=Path('file2.py'),
             line_number=20,
-            message='Invalid format',
+            code=ErrorCode.INVALID_DATE,
+            args=('yesterday',),
         ),
     ]
     reporter = ResultReporter()
@@ -48,7 +50,8 @@ def test_report_json_format():
         AnnotationError(
             file_path=Path('test.py'),
             line_number=5,
-            message='Missing TOOL_NAME',
+            code=ErrorCode.MISSING_FIELD,
+            args=('TOOL_NAME',),
         ),
     ]
     reporter = ResultReporter()
@@ -58,7 +61,7 @@ def test_report_json_format():
     assert '"valid": false' in json_output
     assert '"errors"' in json_output
     assert 'test.py' in json_output
-    assert 'Missing TOOL_NAME' in json_output
+    assert 'Missing or empty required field: TOOL_NAME' in json_output
 
 
 def test_report_text_format():
@@ -67,7 +70,8 @@ def test_report_text_format():
         AnnotationError(
             file_path=Path('test.py'),
             line_number=5,
-            message='Invalid format',
+            code=ErrorCode.INVALID_ACTION,
+            args=('EDITED',),
         ),
     ]
     reporter = ResultReporter()
@@ -76,7 +80,7 @@ def test_report_text_format():
 
     assert '❌' in text_output
     assert 'test.py' in text_output
-    assert 'Invalid format' in text_output
+    assert 'Invalid ACTION value: EDITED (expected GENERATED)' in text_output
     assert 'Files with errors: 1' in text_output
 
 
@@ -89,3 +93,106 @@ def test_report_valid_result_text():
     assert '✅' in text_output
     assert 'valid' in text_output
     assert 'Total files scanned: 5' in text_output
+
+
+def test_ndjson_reporter_streams_records():
+    """Test NDJSON streaming output and incremental summary."""
+    import io
+    import json
+
+    from ai_code_validator.reporter import NdjsonReporter
+
+    stream = io.StringIO()
+    reporter = NdjsonReporter(stream, repo_path=Path('/repo'))
+    reporter.start()
+    reporter.add_file(Path('/repo/a.py'), [
+        AnnotationError(Path('/repo/a.py'), 3, ErrorCode.MISSING_FIELD, ('DATE',)),
+    ])
+    reporter.add_file(Path('/repo/b.py'), [])
+    result = reporter.finish()
+
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert records[0] == {
+        'type': 'error',
+        'file': 'a.py',
+        'line': 3,
+        'message': 'Missing or empty required field: DATE',
+    }
+    assert records[-1]['summary'] == {'total_files': 2, 'files_with_errors': 1, 'total_errors': 1}
+    assert result.valid is False
+
+
+def test_streaming_formats_report_repo_relative_paths():
+    """Test that NDJSON paths are repo-relative while the JSON report keeps paths as given."""
+    import io
+    import json
+
+    from ai_code_validator.reporter import NdjsonReporter
+
+    errors = [
+        AnnotationError(Path('/repo/pkg/a.py'), 3, ErrorCode.MISSING_FIELD, ('DATE',)),
+        AnnotationError(Path('/elsewhere/b.py'), 4, ErrorCode.MISSING_FIELD, ('DATE',)),
+    ]
+    reporter = ResultReporter()
+    report = json.loads(reporter.report_json(reporter.generate_result(errors, total_files_scanned=2)))
+
+    stream = io.StringIO()
+    streaming = NdjsonReporter(stream, repo_path=Path('/repo'))
+    streaming.start()
+    for error in errors:
+        streaming.add_file(error.file_path, [error])
+    streaming.finish()
+    records = [json.loads(line) for line in stream.getvalue().splitlines()]
+
+    assert [error['file'] for error in report['errors']] == ['/repo/pkg/a.py', '/elsewhere/b.py']
+    assert [record['file'] for record in records if record['type'] == 'error'] == ['pkg/a.py', '/elsewhere/b.py']
+
+
+def test_sarif_reporter_writes_valid_document():
+    """Test that the streamed SARIF log is a complete JSON document."""
+    import io
+    import json
+
+    from ai_code_validator.reporter import SarifReporter
+
+    stream = io.StringIO()
+    reporter = SarifReporter(stream)
+    reporter.start()
+    reporter.add_file(Path('a.py'), [
+        AnnotationError(Path('a.py'), 1, ErrorCode.UNTERMINATED_BLOCK),
+        AnnotationError(Path('a.py'), 9, ErrorCode.EMPTY_AUTHOR_ID),
+    ])
+    reporter.finish()
+
+    document = json.loads(stream.getvalue())
+    results = document['runs'][0]['results']
+    assert document['version'] == '2.1.0'
+    assert [r['message']['text'] for r in results] == [
+        'START_AI_GENERATED_CODE marker found but no matching END_AI_GENERATED_CODE',
+        'AUTHOR_ID cannot be empty',
+    ]
+    assert results[1]['locations'][0]['physicalLocation']['region']['startLine'] == 9
+    assert document['runs'][0]['properties']['summary']['total_errors'] == 2
+
+
+def test_coverage_in_reports():
+    """Test that coverage metrics appear in JSON and text reports."""
+    import json
+
+    coverage = {
+        'files': 1,
+        'total_lines': 100,
+        'ai_lines': 25,
+        'ratio': 0.25,
+        'by_directory': {'src': {'total_lines': 100, 'ai_lines': 25, 'ratio': 0.25}},
+        'by_tool': {'Copilot': {'ai_lines': 25, 'blocks': 2}},
+        'by_author': {'alice': {'ai_lines': 25, 'blocks': 2}},
+    }
+    reporter = ResultReporter()
+    result = reporter.generate_result([], total_files_scanned=1, coverage=coverage)
+
+    assert json.loads(reporter.report_json(result))['coverage'] == coverage
+    text = reporter.report_text(result)
+    assert 'AI lines: 25 / 100 (25.00%)' in text
+    assert 'Copilot: 25 lines in 2 block(s)' in text
+    assert 'coverage' not in reporter.report_json(reporter.generate_result([], 1))
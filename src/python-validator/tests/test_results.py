@@ -0,0 +1,58 @@
+"""Tests for the columnar error table."""
+
+import dataclasses
+import pickle
+from pathlib import Path
+
+import pytest
+
+from ai_code_validator.parser import AnnotationError, ErrorCode
+from ai_code_validator.results import ErrorTable
+
+
+def _errors():
+    return [
+        AnnotationError(Path('a.py'), 3, ErrorCode.MISSING_FIELD, ('DATE',)),
+        AnnotationError(Path('b.py'), 7, ErrorCode.INVALID_ACTION, ('EDITED',)),
+        AnnotationError(Path('a.py'), 9, ErrorCode.UNTERMINATED_BLOCK),
+    ]
+
+
+def test_records_are_rendered_on_access():
+    table = ErrorTable(_errors())
+
+    assert len(table) == 3
+    assert table.files_with_errors == 2
+    assert table[0] == {'file': 'a.py', 'line': 3, 'message': 'Missing or empty required field: DATE'}
+    assert table[-1]['message'].startswith('START_AI_GENERATED_CODE marker found')
+    assert [record['line'] for record in table] == [3, 7, 9]
+    assert [record['file'] for record in table[1:]] == ['b.py', 'a.py']
+
+
+def test_errors_round_trip():
+    table = ErrorTable()
+    table.add(_errors()[:1])
+    table.add(_errors()[1:])
+
+    assert list(table.errors()) == _errors()
+
+
+def test_file_paths_and_arguments_are_shared():
+    table = ErrorTable(
+        AnnotationError(Path('a.py'), line, ErrorCode.MISSING_FIELD, ('DATE',))
+        for line in range(100)
+    )
+
+    assert table.files == [Path('a.py')]
+    rebuilt = list(table.errors())
+    assert all(error.args is rebuilt[0].args for error in rebuilt)
+
+
+def test_annotation_error_is_frozen_and_picklable():
+    error = _errors()[0]
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        error.line_number = 4
+    assert not hasattr(error, '__dict__')
+    assert pickle.loads(pickle.dumps(error)) == error
+    assert error.message == 'Missing or empty required field: DATE'
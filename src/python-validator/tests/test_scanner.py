@@ -1,5 +1,6 @@
 """Tests for the file scanner module."""
 
+import os
 import tempfile
 from pathlib import Path
 
@@ -64,6 +65,23 @@ def test_scan_returns_file_content():
         assert file_content == content
 
 
+def test_scan_applies_the_size_limit():
+    """Test that scan() skips or cuts oversized files with a warning instead of truncating silently."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        (tmppath / 'small.py').write_text('a = 1\n')
+        (tmppath / 'big.py').write_text('# START_AI_GENERATED_CODE\n' + 'x = 1\n' * 20)
+
+        scanner = FileScanner(Config(repo_path=tmpdir, max_file_size=40, oversized='skip'))
+        assert [path.name for path, _ in scanner.scan()] == ['small.py']
+        assert [warning['file'] for warning in scanner.warnings] == [str(tmppath / 'big.py')]
+
+        scanner = FileScanner(Config(repo_path=tmpdir, max_file_size=40, oversized='prefix'))
+        contents = {path.name: content for path, content in scanner.scan()}
+        assert contents['big.py'] == '# START_AI_GENERATED_CODE\nx = 1\nx = 1\n'
+        assert 'Only the first 38 bytes' in scanner.warnings[0]['message']
+
+
 def test_scan_skips_unreadable_files():
     """Test that scanner handles unreadable files gracefully."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -78,3 +96,31 @@ def test_scan_skips_unreadable_files():
         results = list(scanner.scan())
         # Should have at least the valid file
         assert len(results) >= 1
+
+
+def test_scan_prunes_excluded_directories(monkeypatch):
+    """Test that excluded directories are never listed during traversal."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+
+        (tmppath / 'src' / 'pkg').mkdir(parents=True)
+        (tmppath / 'src' / 'pkg' / 'deep.py').write_text('# Deep')
+        (tmppath / 'node_modules' / 'lib').mkdir(parents=True)
+        (tmppath / 'node_modules' / 'lib' / 'index.js').write_text('// Vendored')
+
+        listed = []
+        real_scandir = os.scandir
+
+        def tracking_scandir(path):
+            if isinstance(path, str):
+                listed.append(os.path.basename(path))
+            return real_scandir(path)
+
+        monkeypatch.setattr('ai_code_validator.scanner.os.scandir', tracking_scandir)
+
+        config = Config(repo_path=tmpdir)
+        files = [path for path, _ in FileScanner(config).scan()]
+
+        assert [f.name for f in files] == ['deep.py']
+        assert 'node_modules' not in listed
+        assert 'lib' not in listed
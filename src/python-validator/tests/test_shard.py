@@ -0,0 +1,69 @@
+"""Tests for sharding and merging shard reports."""
+
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from ai_code_validator.config import Config
+from ai_code_validator.reporter import ResultReporter
+from ai_code_validator.scanner import FileScanner
+from ai_code_validator.shard import merge_reports, missing_shards, parse_shard, shard_of
+
+
+def test_parse_shard():
+    """Test shard specification parsing and validation."""
+    assert parse_shard('1/4') == (1, 4)
+    assert parse_shard('4/4') == (4, 4)
+    for spec in ['0/4', '5/4', '1/0', '1', 'a/b', '1/2/3']:
+        with pytest.raises(ValueError):
+            parse_shard(spec)
+
+
+def test_shard_of_is_stable():
+    """Test that assignment depends only on the path."""
+    assert shard_of('src/app.py', 4) == shard_of('src/app.py', 4)
+    assert {shard_of(f'pkg/module{n}.py', 3) for n in range(50)} == {1, 2, 3}
+
+
+def test_shards_partition_the_tree():
+    """Test that every file lands in exactly one shard."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmppath = Path(tmpdir)
+        for n in range(30):
+            (tmppath / f'module{n}.py').write_text('# Plain')
+
+        everything = set(FileScanner(Config(repo_path=tmpdir)).discover_files())
+        shards = [
+            set(FileScanner(Config(repo_path=tmpdir, shard=(index, 3))).discover_files())
+            for index in (1, 2, 3)
+        ]
+        assert set().union(*shards) == everything
+        assert sum(len(shard) for shard in shards) == len(everything)
+
+
+def test_merge_reports():
+    """Test that merged summaries are recomputed from all shards."""
+    reporter = ResultReporter()
+    first = reporter.generate_result([], 3)
+    first.summary['shard'] = '1/2'
+    second = {
+        'valid': False,
+        'errors': [
+            {'file': 'b.py', 'line': 4, 'message': 'Missing END marker'},
+            {'file': 'a.py', 'line': 1, 'message': 'Missing or empty required field: DATE'},
+        ],
+        'summary': {'total_files': 5, 'files_with_errors': 2, 'total_errors': 2, 'shard': '2/2'},
+    }
+    reports = [json.loads(reporter.report_json(first)), second]
+
+    merged = merge_reports(reports)
+    assert not merged.valid
+    assert merged.summary == {'total_files': 8, 'files_with_errors': 2, 'total_errors': 2}
+    assert [error['file'] for error in merged.errors] == ['a.py', 'b.py']
+    assert missing_shards(reports) == []
+    assert missing_shards(reports[:1]) == ['2/2']
+
+    with pytest.raises(ValueError):
+        merge_reports([second, second])
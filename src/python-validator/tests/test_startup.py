@@ -0,0 +1,69 @@
+"""Tests for the import-time cost of the CLI entry point."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from ai_code_validator import cli
+from ai_code_validator.reporter import STREAMING_REPORTERS
+
+SRC = Path(__file__).resolve().parent.parent / 'src'
+
+# Modules a plain or --staged run never needs at import time
+DEFERRED_MODULES = {
+    'asyncio',
+    'concurrent.futures',
+    'datetime',
+    'json',
+    'multiprocessing',
+    'socket',
+    'sqlite3',
+    'subprocess',
+    'ai_code_validator.asyncscan',
+    'ai_code_validator.cache',
+    'ai_code_validator.daemon',
+    'ai_code_validator.gitsource',
+    'ai_code_validator.inventory',
+    'ai_code_validator.reporter',
+    'ai_code_validator.watcher',
+}
+
+# Cumulative microseconds for importing the CLI; several times what it takes
+# on a developer machine, so only a heavy new dependency trips it
+IMPORT_BUDGET_US = 400_000
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """Import ``module`` in a fresh interpreter and return cumulative times."""
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True,
+        text=True,
+        env={'PYTHONPATH': str(SRC)},
+        check=True,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_cli_import_defers_optional_modules():
+    times = _import_times('ai_code_validator.cli')
+    assert 'ai_code_validator.cli' in times
+    assert DEFERRED_MODULES.isdisjoint(times)
+
+
+def test_cli_import_within_budget():
+    # Second run so bytecode compilation of the package is not measured
+    _import_times('ai_code_validator.cli')
+    times = _import_times('ai_code_validator.cli')
+    assert times['ai_code_validator.cli'] < IMPORT_BUDGET_US
+
+
+def test_streaming_formats_match_reporters():
+    assert set(cli.STREAMING_FORMATS) == set(STREAMING_REPORTERS)
@@ -0,0 +1,37 @@
+"""Tests for run statistics."""
+
+from ai_code_validator.stats import RunStats
+
+
+def test_slowest_files_keeps_top_n():
+    """Test that only the slowest files are kept, slowest first."""
+    stats = RunStats(top_n=2)
+    stats.record_file('a.py', 0.1)
+    stats.record_file('b.py', 0.5)
+    stats.record_file('c.py', 0.3)
+
+    assert stats.slowest_files() == [('b.py', 0.5), ('c.py', 0.3)]
+
+
+def test_merge_combines_worker_stats():
+    """Test merging statistics collected in another process."""
+    worker = RunStats()
+    with worker.phase('parsing'):
+        pass
+    worker.count('bytes_read', 100)
+    worker.record_file('slow.py', 2.0)
+
+    stats = RunStats()
+    stats.count('bytes_read', 50)
+    stats.merge(worker.to_dict())
+
+    assert stats.counters['bytes_read'] == 150
+    assert stats.wall['parsing'] == worker.wall['parsing']
+    assert stats.slowest_files()[0] == ('slow.py', 2.0)
+
+
+def test_timed_iter_counts_time_to_phase():
+    """Test that producing items is attributed to the given phase."""
+    stats = RunStats()
+    assert list(stats.timed_iter('discovery', range(3))) == [0, 1, 2]
+    assert stats.wall['discovery'] > 0